@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Browser Pool
+A bounded pool of browser tabs for scraping many profiles at once.
+
+Playwright's MCP page tools act on a session's current tab, so a tab here
+is its own MCP session (and browser context), started lazily on first use
+and kept open for the pool's lifetime. map() runs a worker per item, each
+holding a tab of its own. How many tabs work at once is not fixed: an
+adaptive limit (rate_control.AdaptiveConcurrency) grows from one towards
+`size` while page loads stay fast and shrinks when they slow down or the
+site pushes back; pool.retry is the scheduler that feeds it. A per-host cap
+bounds how many workers talk to one host at a time, and the scheduler's
+per-host token bucket spaces their requests, so raising the pool size never
+turns into a burst against a single site.
+
+Workers name the crawl they belong to (a brief, a search category) when
+they ask for a tab, and a free tab goes to the crawls waiting for one in
+turn, first come first served within each: a brief with hundreds of
+queued profiles cannot starve one that started later.
+"""
+
+import asyncio
+import collections
+import contextlib
+import io
+import os
+import shlex
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Awaitable, Callable, Iterable, Optional
+from urllib.parse import urlparse
+
+from mcp_browser_client import MCPBrowserClient, close_client
+from rate_control import AdaptiveConcurrency, RetryScheduler
+
+POOL_SIZE = 4                  # most tabs open at once
+HOST_CONCURRENCY = 4           # workers allowed on one host at once
+
+class HostLimiter:
+    """Per-host concurrency cap"""
+
+    def __init__(self, concurrency: int = HOST_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold one of the host's slots"""
+        semaphore = self._slots.setdefault(urlparse(url).netloc, asyncio.Semaphore(self.concurrency))
+        async with semaphore:
+            yield
+
+class FairShare:
+    """Admits one waiter at a time, round-robin across groups and in arrival order within a group"""
+
+    def __init__(self):
+        self._waiters: Dict[str, collections.deque] = {}
+        self._rotation: collections.deque = collections.deque()   # groups with waiters, next turn first
+        self._busy = False
+
+    @asynccontextmanager
+    async def turn(self, group: str = ""):
+        """Wait for this group's turn; the next waiter is admitted when the block exits"""
+        if self._busy:
+            waiter = asyncio.get_running_loop().create_future()
+            if group not in self._waiters:
+                self._waiters[group] = collections.deque()
+                self._rotation.append(group)
+            self._waiters[group].append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._admit_next()       # admitted just as we were cancelled: pass the turn on
+                raise
+        self._busy = True
+        try:
+            yield
+        finally:
+            self._admit_next()
+
+    def _admit_next(self):
+        self._busy = False
+        while self._rotation:
+            group = self._rotation.popleft()
+            waiters = self._waiters[group]
+            waiter = waiters.popleft()
+            if waiters:
+                self._rotation.append(group)
+            else:
+                del self._waiters[group]
+            if not waiter.done():
+                self._busy = True
+                waiter.set_result(None)
+                return
+
+class TabPool:
+    """A fixed number of MCP browser sessions handed out to concurrent workers"""
+
+    def __init__(self, size: int = POOL_SIZE, host_concurrency: int = HOST_CONCURRENCY,
+                 command: Optional[List[str]] = None):
+        self.size = max(1, size)
+        self.command = command
+        self.limiter = HostLimiter(host_concurrency)
+        self.concurrency = AdaptiveConcurrency(self.size)
+        self.retry = RetryScheduler(concurrency=self.concurrency)   # for page loads in this pool's tabs
+        self.fair_share = FairShare()
+        self.tabs: List[MCPBrowserClient] = []
+        self._idle: Optional[asyncio.Queue] = None
+
+    def _ensure_tabs(self):
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                tab = MCPBrowserClient(self.command)
+                self.tabs.append(tab)
+                self._idle.put_nowait(tab)
+
+    @asynccontextmanager
+    async def tab(self, url: str, group: str = ""):
+        """An idle tab (its session starts on first call) within the adaptive limit and host cap, fairly across groups"""
+        self._ensure_tabs()
+        async with contextlib.AsyncExitStack() as stack:
+            # Only the group whose turn it is waits for the next free slot
+            async with self.fair_share.turn(group):
+                await stack.enter_async_context(self.concurrency.slot())
+            tab = await self._idle.get()
+            try:
+                async with self.limiter.slot(url):
+                    yield tab
+            finally:
+                self._idle.put_nowait(tab)
+
+    async def map(self, worker: Callable[[MCPBrowserClient, str], Awaitable[Any]],
+                  urls: Iterable[str], group: str = "") -> List[Any]:
+        """worker(tab, url) for every URL, within the adaptive limit across all map() calls; results in input order"""
+
+        async def run(url: str) -> Any:
+            async with self.tab(url, group) as tab:
+                return await worker(tab, url)
+
+        return await asyncio.gather(*(run(url) for url in urls))
+
+    async def close(self):
+        """Close every tab's session"""
+        await asyncio.gather(*(tab.close() for tab in self.tabs), return_exceptions=True)
+
+async def _time_brief(applicants: int, tabs: int, latency: float) -> tuple:
+    from mcp_browser_client import get_client
+    from mock_mcp_server import MOCK_BRIEF_URL
+    from record_stream import RecordStream
+    from upwork_applicants_scraper_docker_mcp import UpworkApplicantsScraperDockerMCP
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper = UpworkApplicantsScraperDockerMCP(max_applicants=applicants, pool_size=tabs, frontier_path=":memory:")
+        scraper.stream = RecordStream(os.devnull)
+        start = time.perf_counter()
+        try:
+            collected = await scraper.scrape_applicants_from_brief(MOCK_BRIEF_URL, "mock")
+            calls = (await get_client()).calls + sum(tab.calls for tab in scraper.pool.tabs)
+        finally:
+            await scraper.close()
+            await close_client()
+    return time.perf_counter() - start, len(collected), calls
+
+def run_benchmark(applicants: int = 24, tabs: int = POOL_SIZE, latency: float = 0.2):
+    """Scrape a synthetic brief from the mock MCP server with one tab, then with a pool"""
+    from mock_mcp_server import mock_command
+
+    os.environ["MCP_GATEWAY_COMMAND"] = shlex.join(mock_command(applicants, latency))
+    print(f"⏱️ Scraping a mock brief with {applicants} applicants ({latency:g}s per navigation)...")
+    results = {}
+    for size in sorted({1, tabs}):
+        elapsed, collected, calls = asyncio.run(_time_brief(applicants, size, latency))
+        results[size] = elapsed
+        print(f"   • {size} tab{'s' if size > 1 else ' '}:  {elapsed:6.1f}s ({collected} profiles, "
+              f"{collected / elapsed:.2f} profiles/s, {calls} MCP tool calls)")
+    if tabs > 1:
+        print(f"   • Speedup:  {results[1] / results[tabs]:.1f}x")
+
+def main():
+    """Benchmark pooled profile scraping against the mock server (--benchmark [N] [--tabs K] [--latency S])"""
+    if "--benchmark" not in sys.argv:
+        print("Usage: python3 scripts/browser_pool.py --benchmark [applicants] [--tabs K] [--latency S]")
+        return
+    index = sys.argv.index("--benchmark")
+    applicants = int(sys.argv[index + 1]) if len(sys.argv) > index + 1 and sys.argv[index + 1].isdigit() else 24
+    tabs = int(sys.argv[sys.argv.index("--tabs") + 1]) if "--tabs" in sys.argv else POOL_SIZE
+    latency = float(sys.argv[sys.argv.index("--latency") + 1]) if "--latency" in sys.argv else 0.2
+    run_benchmark(applicants, tabs, latency)
+
+if __name__ == "__main__":
+    main()
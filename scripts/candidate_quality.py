@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Candidate Quality
+One data-quality score for every pipeline, computed per batch and kept in a sorted index.
+
+The score is the percentage (0-100) of QUALITY_FIELDS that hold real data.
+Empty values, zero ratings and extractor placeholders such as "Rate not
+specified" count as missing. A batch is scored in one tight pass into a numpy
+array and the score is written back onto each record as data_quality_score,
+so later stages read it instead of recomputing it with their own rules.
+
+QualityIndex keeps the scores sorted alongside per-job running totals, so
+"least complete N", "below threshold" and "average quality per job" are
+answered from the index instead of rescoring every candidate.
+"""
+
+import sys
+import time
+from typing import Dict, List, Any, Optional, Iterable, Callable
+
+import numpy as np
+
+from candidate_store import candidate_key, open_store
+
+QUALITY_FIELDS = (
+    # Basic info
+    "name", "title", "location", "hourly_rate",
+    # Performance metrics
+    "job_success", "total_earned", "hours_worked", "jobs_completed",
+    # Detailed info
+    "overview", "proposal_text", "profile_url", "skills",
+    # Additional data
+    "rating", "notes", "portfolio_links"
+)
+
+# Fill-in values the extractors write when a field could not be parsed
+PLACEHOLDER_VALUES = frozenset({
+    "Unknown", "N/A", "not specified", "Rate not specified", "Success rate not specified",
+    "Earnings not specified", "Hours not specified", "Jobs not specified",
+    "Location not specified", "Professional title not specified"
+})
+
+COMPLETE_THRESHOLD = 80.0
+INCOMPLETE_THRESHOLD = 40.0
+
+def field_counts(candidates: List[Any], fields: Iterable[str] = QUALITY_FIELDS) -> np.ndarray:
+    """Number of fields holding real data for each candidate in a batch"""
+    fields = tuple(fields)
+    counts = []
+    for candidate in candidates:
+        present = 0
+        for field in fields:
+            value = candidate.get(field)
+            if value and (value.__class__ is not str or value not in PLACEHOLDER_VALUES):
+                present += 1
+        counts.append(present)
+    return np.array(counts, dtype=np.int16)
+
+def score_batch(candidates: List[Any]) -> np.ndarray:
+    """Quality scores (0-100) for a batch of candidate dicts or records"""
+    return field_counts(candidates) * (100.0 / len(QUALITY_FIELDS))
+
+def score_candidate(candidate: Any) -> float:
+    """Quality score (0-100) for a single candidate"""
+    return float(score_batch([candidate])[0])
+
+def apply_scores(candidates: List[Any]) -> np.ndarray:
+    """Score a batch, store each score on its record as data_quality_score and return the stored scores"""
+    scores = np.round(score_batch(candidates), 2)
+    for candidate, score in zip(candidates, scores.tolist()):
+        if isinstance(candidate, dict):
+            candidate["data_quality_score"] = score
+        else:
+            candidate.data_quality_score = score
+    return scores
+
+def job_of(candidate: Any) -> str:
+    """Job a candidate applied to, used to group quality averages"""
+    return candidate.get("job_title") or "Unknown"
+
+class QualityIndex:
+    """Candidates ordered by quality score with per-job totals"""
+
+    def __init__(self, candidates: Optional[List[Any]] = None, key: Callable[[Any], str] = candidate_key):
+        self.key = key
+        self.scores = np.zeros(0, dtype=np.float64)     # ascending
+        self.keys = np.zeros(0, dtype=object)           # key for each entry in self.scores
+        self.records: Dict[str, Any] = {}                # key -> record, carrying its data_quality_score
+        self.job_totals: Dict[str, List[float]] = {}    # job -> [score sum, count]
+        if candidates:
+            self.add(candidates)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def add(self, candidates: List[Any]) -> np.ndarray:
+        """Score a batch, store the scores on the records and merge them into the index"""
+        # Later records replace earlier ones with the same key, as in the candidate store
+        latest = dict(zip(map(self.key, candidates), candidates))
+        batch = list(latest.values())
+
+        # Take replaced records out of the job totals and the sorted arrays, using the score stored on them
+        replaced = [k for k in latest if k in self.records] if self.records else []
+        for k in replaced:
+            old = self.records[k]
+            self._update_job(job_of(old), -old.get("data_quality_score", 0.0), -1)
+        if replaced:
+            gone = set(replaced)
+            keep = np.fromiter((k not in gone for k in self.keys), dtype=bool, count=len(self.keys))
+            self.scores, self.keys = self.scores[keep], self.keys[keep]
+
+        scores = apply_scores(batch)
+        batch_keys = np.array(list(latest), dtype=object)
+        jobs = list(map(job_of, batch))
+        self.records.update(latest)
+
+        # Per-job totals for the batch, accumulated per job rather than per candidate
+        totals: Dict[str, List[float]] = {}
+        for job, score in zip(jobs, scores.tolist()):
+            job_total = totals.get(job)
+            if job_total is None:
+                totals[job] = [score, 1]
+            else:
+                job_total[0] += score
+                job_total[1] += 1
+        for job, (total, count) in totals.items():
+            self._update_job(job, total, count)
+
+        # Sort only the batch, then insert it into the index at its searchsorted positions
+        new_order = np.argsort(scores, kind="stable")
+        new_scores = scores[new_order]
+        positions = np.searchsorted(self.scores, new_scores, side="right")
+        self.scores = np.insert(self.scores, positions, new_scores)
+        self.keys = np.insert(self.keys, positions, batch_keys[new_order])
+        return scores
+
+    def _update_job(self, job: str, score: float, count: int):
+        totals = self.job_totals.setdefault(job, [0.0, 0])
+        totals[0] += score
+        totals[1] += count
+        if totals[1] <= 0:
+            del self.job_totals[job]
+
+    def least_complete(self, n: int = 100) -> List[Any]:
+        """The n candidates with the lowest quality scores, lowest first"""
+        return [self.records[k] for k in self.keys[:n]]
+
+    def most_complete(self, n: int = 100) -> List[Any]:
+        """The n candidates with the highest quality scores, highest first"""
+        return [self.records[k] for k in self.keys[::-1][:n]]
+
+    def below(self, threshold: float) -> List[Any]:
+        """Candidates scoring strictly below a threshold"""
+        end = int(np.searchsorted(self.scores, threshold, side="left"))
+        return [self.records[k] for k in self.keys[:end]]
+
+    def average_by_job(self) -> Dict[str, float]:
+        """Average quality score for each job"""
+        return {job: round(total / count, 2) for job, (total, count) in self.job_totals.items()}
+
+    def summary(self) -> Dict[str, Any]:
+        """Overall quality breakdown in the format of the extractors' data_quality_summary"""
+        total = len(self.scores)
+        if total == 0:
+            return {}
+        incomplete = int(np.searchsorted(self.scores, INCOMPLETE_THRESHOLD, side="left"))
+        complete = total - int(np.searchsorted(self.scores, COMPLETE_THRESHOLD, side="right"))
+        return {
+            "average_quality_score": round(float(self.scores.mean()), 2),
+            "complete_profiles": complete,
+            "partial_profiles": total - complete - incomplete,
+            "incomplete_profiles": incomplete,
+            "total_applicants": total
+        }
+
+def quality_summary(candidates: List[Any]) -> Dict[str, Any]:
+    """Score a batch and return its overall quality breakdown"""
+    return QualityIndex(candidates).summary()
+
+def _legacy_score(candidate: Dict[str, Any]) -> float:
+    """Per-record 15-field score as previously computed in process_downloaded_applicants"""
+    score = sum(1 for field in QUALITY_FIELDS if candidate.get(field))
+    return (score / len(QUALITY_FIELDS)) * 100
+
+def run_benchmark(count: int):
+    """Compare per-record scoring and full re-sorts with batch scoring and index queries"""
+    from candidate_columnar import synthesize_candidates
+
+    candidates = synthesize_candidates(count)
+    print(f"⏱️ Scoring {count:,} candidates...")
+
+    start = time.perf_counter()
+    legacy = [_legacy_score(c) for c in candidates]
+    sorted(range(count), key=legacy.__getitem__)[:100]
+    per_job: Dict[str, List[float]] = {}
+    for candidate, score in zip(candidates, legacy):
+        per_job.setdefault(job_of(candidate), []).append(score)
+    {job: sum(s) / len(s) for job, s in per_job.items()}
+    legacy_time = time.perf_counter() - start
+
+    batch = min(1000, count // 10)
+    start = time.perf_counter()
+    index = QualityIndex(candidates[:count - batch])
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index.add(candidates[count - batch:])
+    add_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index.least_complete(100)
+    index.average_by_job()
+    index.summary()
+    query_time = time.perf_counter() - start
+
+    print(f"   • Per-record score + sort + group: {legacy_time:.3f}s (every query)")
+    print(f"   • Batch score + build index:       {build_time:.3f}s (once, {count - batch:,} candidates)")
+    print(f"   • Add {batch:,} candidates to index:    {add_time * 1000:.2f}ms")
+    print(f"   • Index queries:                   {query_time * 1000:.2f}ms")
+
+def main():
+    """Score the candidate store, save the scores and print quality queries"""
+    if "--benchmark" in sys.argv:
+        index = sys.argv.index("--benchmark")
+        count = int(sys.argv[index + 1]) if len(sys.argv) > index + 1 else 200_000
+        run_benchmark(count)
+        return
+
+    store = open_store()
+    index = QualityIndex(store.load_all())
+    updated = store.upsert(list(index.records.values()), {"quality_scored_at": time.strftime("%Y-%m-%dT%H:%M:%S")})
+    print(f"💾 Scored {len(index)} candidates ({len(updated)} scores changed)")
+
+    summary = index.summary()
+    if not summary:
+        return
+    print(f"📊 Average quality: {summary['average_quality_score']:.1f}%  "
+          f"complete: {summary['complete_profiles']}  partial: {summary['partial_profiles']}  "
+          f"incomplete: {summary['incomplete_profiles']}")
+
+    print("\n📋 Average quality per job:")
+    for job, average in sorted(index.average_by_job().items(), key=lambda x: x[1]):
+        print(f"   • {average:5.1f}%  {job}")
+
+    limit = 100
+    if "--least" in sys.argv:
+        position = sys.argv.index("--least")
+        if len(sys.argv) > position + 1:
+            limit = int(sys.argv[position + 1])
+    print(f"\n🔍 Least complete {limit} candidates:")
+    for candidate in index.least_complete(limit):
+        print(f"   • {candidate.get('data_quality_score', 0):5.1f}%  {candidate.get('name', 'Unknown')}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Candidate Record
+Compact __slots__ record shared by the candidate pipelines.
+
+Candidates cross JSON boundaries as wide dicts with ~25 string keys. Inside a
+pipeline a CandidateRecord holds the same data in fixed slots: categorical
+and display strings (status, job_title, location, source, "$30.00/hr",
+"100% Job Success", skills) are interned so repeated values share one object,
+scores are floats, and list fields are tuples. Parsed numeric values of the
+display metrics come from a shared cache keyed by the interned string, so
+they cost nothing per record.
+"""
+
+import json
+import re
+import sys
+import time
+import tracemalloc
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Iterable
+
+from skill_vocabulary import VOCABULARY
+
+NUMBER_PATTERN = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([KkMm])?')
+MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
+TEXT_FIELDS = ("id", "name", "title", "overview", "proposal_text", "profile_url", "applied_date",
+               "notes", "profile_image", "screenshot_source", "processed_at", "source_file")
+CATEGORY_FIELDS = ("status", "job_title", "location", "source")
+METRIC_FIELDS = ("hourly_rate", "job_success", "total_earned", "hours_worked", "jobs_completed")
+SCORE_FIELDS = ("rating", "data_quality_score")
+LIST_FIELDS = ("skills", "portfolio_links", "work_samples")
+
+FIELD_DEFAULTS = {
+    **{name: "" for name in TEXT_FIELDS + CATEGORY_FIELDS + METRIC_FIELDS},
+    "status": "pending",
+    "rating": 0,
+    "data_quality_score": 0.0,
+    **{name: () for name in LIST_FIELDS}
+}
+
+SCALAR_FIELDS = TEXT_FIELDS + CATEGORY_FIELDS + METRIC_FIELDS + SCORE_FIELDS
+
+FIELD_KINDS = {
+    **{name: "text" for name in TEXT_FIELDS},
+    **{name: "intern" for name in CATEGORY_FIELDS + METRIC_FIELDS},
+    **{name: "score" for name in SCORE_FIELDS},
+    **{name: "list" for name in LIST_FIELDS}
+}
+
+def parse_number(value: Any) -> Optional[float]:
+    """Parse the first number in a display string, honouring K/M suffixes ("$1.2M+" -> 1200000.0)"""
+    if value is None or value == "" or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = NUMBER_PATTERN.search(str(value))
+    if not match:
+        return None
+    number = float(match.group(1).replace(',', ''))
+    suffix = (match.group(2) or "").lower()
+    return number * MULTIPLIERS.get(suffix, 1)
+
+@lru_cache(maxsize=65536)
+def _parse_display(text: str) -> Optional[float]:
+    """Cached parse of an interned display string; equal strings share one float"""
+    return parse_number(text)
+
+def _intern(value: Any) -> str:
+    """Intern a string value, converting non-strings first"""
+    if value is None:
+        return ""
+    return sys.intern(value if isinstance(value, str) else str(value))
+
+class CandidateRecord:
+    """Slotted candidate with interned categoricals and typed scores"""
+
+    __slots__ = TEXT_FIELDS + CATEGORY_FIELDS + METRIC_FIELDS + SCORE_FIELDS + LIST_FIELDS + ("extra", "_skill_bits")
+
+    def __init__(self, **fields):
+        extra = None
+        for name, value in fields.items():
+            kind = FIELD_KINDS.get(name)
+            if kind is None:
+                if extra is None:
+                    extra = {}
+                extra[name] = value
+            elif kind == "text":
+                setattr(self, name, "" if value is None else str(value))
+            elif kind == "intern":
+                setattr(self, name, _intern(value))
+            elif kind == "score":
+                number = parse_number(value)
+                setattr(self, name, number if number is not None else FIELD_DEFAULTS[name])
+                # Keep non-numeric originals like "4.9 of 5 stars" so to_dict round-trips
+                if isinstance(value, str) and value:
+                    if extra is None:
+                        extra = {}
+                    extra[name] = value
+            else:
+                if isinstance(value, str):
+                    value = [s.strip() for s in value.split(',') if s.strip()]
+                setattr(self, name, tuple(_intern(v) if isinstance(v, str) else v for v in value or ()))
+
+        if len(fields) < len(FIELD_KINDS) or extra:
+            for name, default in FIELD_DEFAULTS.items():
+                if name not in fields:
+                    setattr(self, name, default)
+        self.extra = extra
+        self._skill_bits = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **defaults) -> "CandidateRecord":
+        """Build a record from a candidate dict; defaults fill keys missing from data"""
+        if defaults:
+            data = {**defaults, **data}
+        return cls(**data)
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Convert back to the candidate dict format used at JSON boundaries"""
+        data = {name: getattr(self, name) for name in SCALAR_FIELDS}
+        for name in LIST_FIELDS:
+            data[name] = list(getattr(self, name))
+        if self.extra:
+            data.update(self.extra)
+        if fields is not None:
+            return {name: data.get(name, FIELD_DEFAULTS.get(name, "")) for name in fields}
+        return data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access so existing candidate.get(...) call sites keep working"""
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        if key in FIELD_DEFAULTS:
+            value = getattr(self, key)
+            return list(value) if key in LIST_FIELDS else value
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            raise KeyError(key)
+        return value
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CandidateRecord):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CandidateRecord(id={self.id!r}, name={self.name!r}, job_title={self.job_title!r})"
+
+    @property
+    def skill_bits(self) -> int:
+        """Skills encoded against the global skill vocabulary, computed once"""
+        if self._skill_bits is None:
+            self._skill_bits = VOCABULARY.encode(self.skills)
+        return self._skill_bits
+
+    @property
+    def hourly_rate_value(self) -> Optional[float]:
+        return _parse_display(self.hourly_rate)
+
+    @property
+    def job_success_value(self) -> Optional[float]:
+        return _parse_display(self.job_success)
+
+    @property
+    def total_earned_value(self) -> Optional[float]:
+        return _parse_display(self.total_earned)
+
+    @property
+    def hours_worked_value(self) -> Optional[float]:
+        return _parse_display(self.hours_worked)
+
+    @property
+    def jobs_completed_value(self) -> Optional[float]:
+        return _parse_display(self.jobs_completed)
+
+def to_records(candidates: Iterable[Dict[str, Any]]) -> List[CandidateRecord]:
+    """Convert candidate dicts to records"""
+    return [c if isinstance(c, CandidateRecord) else CandidateRecord.from_dict(c) for c in candidates]
+
+def to_dicts(candidates: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Convert records (or already-plain dicts) back to dicts for JSON output"""
+    return [c.to_dict() if isinstance(c, CandidateRecord) else c for c in candidates]
+
+def run_benchmark(count: int):
+    """Compare memory held by JSON-loaded dicts with the equivalent records"""
+    from candidate_columnar import synthesize_candidates
+
+    print(f"⏱️ Measuring memory for {count:,} candidates...")
+    payload = json.dumps(synthesize_candidates(count))
+
+    tracemalloc.start()
+    dicts = json.loads(payload)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+
+    # Records keep whatever strings they reference alive, so measure after the dicts are gone
+    records = to_records(dicts)
+    del dicts
+    record_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    dicts = json.loads(payload)
+    start = time.perf_counter()
+    records = to_records(dicts)
+    convert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    to_dicts(records)
+    back_time = time.perf_counter() - start
+
+    print(f"   • Dicts:   {dict_bytes / 1_048_576:,.1f} MiB ({dict_bytes / count:,.0f} B/candidate)")
+    print(f"   • Records: {record_bytes / 1_048_576:,.1f} MiB ({record_bytes / count:,.0f} B/candidate)")
+    print(f"   • Ratio:   {record_bytes / dict_bytes:.0%} of the dict representation")
+    print(f"   • from_dict: {convert_time:.2f}s  to_dict: {back_time:.2f}s")
+
+def main():
+    """Run the memory benchmark (--benchmark N, default 500000)"""
+    count = 500_000
+    if "--benchmark" in sys.argv:
+        index = sys.argv.index("--benchmark")
+        if len(sys.argv) > index + 1:
+            count = int(sys.argv[index + 1])
+    run_benchmark(count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Candidate Snapshot Store
+Append-only delta segments plus a periodically compacted base, tracked by a manifest.
+
+Layout of a store directory:
+    manifest.json          - points at the current base and the ordered delta segments
+    base_<seq>.jsonl       - compacted snapshot, one candidate per line
+    segment_<seq>.jsonl    - delta written by a single append, one candidate per line
+    keys_<seq>.jsonl       - key index: [key, fingerprint] per stored record, appended with each segment
+
+Appending N candidates writes N lines plus a small manifest, regardless of how
+many candidates are already stored. Readers go through the manifest, so they
+always see the latest state without knowing any timestamped filename. The key
+index lets append_new and upsert check what is already stored without reading
+the candidates themselves; the manifest records how many of its bytes are
+committed, so a torn index line from an interrupted append is never read, and
+an open store only reads the index lines appended since it last looked.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Optional
+
+DEFAULT_STORE_DIR = "output/processed_candidates/store"
+LEGACY_SNAPSHOT_PATTERN = "all_processed_candidates_*.json"
+MANIFEST_VERSION = 1
+
+def candidate_key(candidate: Dict[str, Any]) -> str:
+    """Return the identity used to dedupe candidates across segments"""
+    if candidate.get("id"):
+        return str(candidate["id"])
+    return f"{candidate.get('name', '')}_{candidate.get('profile_url', '')}"
+
+def derived_candidate_id(candidate: Dict[str, Any]) -> str:
+    """Stable id for a candidate without one, from its name and profile URL (the same on every run)"""
+    identity = f"{candidate.get('name', '')}_{candidate.get('profile_url', '')}"
+    return "candidate_" + hashlib.sha1(identity.encode("utf-8")).hexdigest()[:12]
+
+def candidate_fingerprint(candidate: Dict[str, Any]) -> str:
+    """Short content hash used by upsert to tell whether a stored record changed"""
+    if hasattr(candidate, "to_dict"):
+        candidate = candidate.to_dict()
+    encoded = json.dumps(candidate, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+def load_snapshot_file(filepath: str) -> List[Dict[str, Any]]:
+    """Load candidates from a legacy JSON snapshot (list or {"applicants": [...]})"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return data.get('applicants', data.get('candidates', []))
+    return []
+
+class CandidateStore:
+    """Segment-based candidate store with an atomic manifest"""
+
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR, compact_threshold: int = 20):
+        self.store_dir = store_dir
+        self.manifest_path = os.path.join(store_dir, "manifest.json")
+        self.compact_threshold = compact_threshold
+        self._key_index: Dict[str, str] = {}        # key -> fingerprint, as of _key_index_bytes
+        self._key_index_file: Optional[str] = None
+        self._key_index_bytes = 0
+
+    def exists(self) -> bool:
+        """Check whether the store has a manifest on disk"""
+        return os.path.exists(self.manifest_path)
+
+    def load_manifest(self) -> Dict[str, Any]:
+        """Load the manifest, returning an empty one for a new store"""
+        if not self.exists():
+            return {
+                "version": MANIFEST_VERSION,
+                "base": None,
+                "segments": [],
+                "keys": None,
+                "keys_bytes": 0,
+                "next_seq": 1,
+                "total_count": 0,
+                "last_updated": None,
+                "metadata": {}
+            }
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        """Atomically replace the manifest so readers never see a partial file"""
+        os.makedirs(self.store_dir, exist_ok=True)
+        manifest["last_updated"] = datetime.now().isoformat()
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+
+    def _write_jsonl(self, filename: str, candidates: Iterable[Dict[str, Any]]) -> int:
+        """Write candidates as JSON Lines and return the number written"""
+        os.makedirs(self.store_dir, exist_ok=True)
+        count = 0
+        with open(os.path.join(self.store_dir, filename), 'w', encoding='utf-8') as f:
+            for candidate in candidates:
+                if hasattr(candidate, "to_dict"):
+                    candidate = candidate.to_dict()
+                f.write(json.dumps(candidate, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+            f.flush()
+            os.fsync(f.fileno())
+        return count
+
+    def _read_jsonl(self, filename: str) -> Iterable[Dict[str, Any]]:
+        """Yield candidates from a JSON Lines file, skipping a torn trailing line"""
+        with open(os.path.join(self.store_dir, filename), 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def iter_records(self) -> Iterable[Dict[str, Any]]:
+        """Yield raw records in write order: base first, then each segment"""
+        manifest = self.load_manifest()
+        if manifest.get("base"):
+            yield from self._read_jsonl(manifest["base"])
+        for segment in manifest.get("segments", []):
+            yield from self._read_jsonl(segment)
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Return the latest state, with later records replacing earlier ones by key"""
+        latest: Dict[str, Dict[str, Any]] = {}
+        for candidate in self.iter_records():
+            latest[candidate_key(candidate)] = candidate
+        return list(latest.values())
+
+    def _read_key_index(self, manifest: Dict[str, Any]) -> Dict[str, str]:
+        """Key index as of the manifest, reading only the lines committed since the last call"""
+        filename = manifest.get("keys")
+        committed = manifest.get("keys_bytes", 0)
+        if filename != self._key_index_file or committed < self._key_index_bytes:
+            self._key_index, self._key_index_file, self._key_index_bytes = {}, filename, 0
+        if filename and committed > self._key_index_bytes:
+            with open(os.path.join(self.store_dir, filename), 'rb') as f:
+                f.seek(self._key_index_bytes)
+                for line in f.read(committed - self._key_index_bytes).splitlines():
+                    if line.strip():
+                        key, fingerprint = json.loads(line)
+                        self._key_index[key] = fingerprint
+            self._key_index_bytes = committed
+        return self._key_index
+
+    def _key_index_for(self, manifest: Dict[str, Any]) -> Dict[str, str]:
+        """Key index for the manifest, building it once from the records for stores written without one"""
+        if manifest.get("keys") is None and (manifest.get("base") or manifest.get("segments")):
+            self._append_keys(manifest, self.iter_records(), f"keys_{manifest['next_seq']:06d}.jsonl")
+            manifest["next_seq"] += 1
+            self._write_manifest(manifest)
+        return self._read_key_index(manifest)
+
+    def _append_keys(self, manifest: Dict[str, Any], candidates: Iterable[Dict[str, Any]],
+                     filename: Optional[str] = None):
+        """Append index lines for candidates and record the new committed length in the manifest (not yet written)"""
+        os.makedirs(self.store_dir, exist_ok=True)
+        filename = filename or manifest.get("keys")
+        if filename != manifest.get("keys"):
+            manifest["keys"], manifest["keys_bytes"] = filename, 0
+            self._key_index, self._key_index_file, self._key_index_bytes = {}, filename, 0
+        # Lines written here are also applied to the in-memory index if it is read up to this point
+        cached = filename == self._key_index_file and manifest["keys_bytes"] == self._key_index_bytes
+        entries = {}
+        path = os.path.join(self.store_dir, filename)
+        with open(path, 'ab') as f:
+            # Drop anything past the committed length, e.g. lines from an append that never reached the manifest
+            f.truncate(manifest["keys_bytes"])
+            for candidate in candidates:
+                key, fingerprint = candidate_key(candidate), candidate_fingerprint(candidate)
+                entries[key] = fingerprint
+                f.write(json.dumps([key, fingerprint], ensure_ascii=False).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+            manifest["keys_bytes"] = f.tell()
+        if cached:
+            self._key_index.update(entries)
+            self._key_index_bytes = manifest["keys_bytes"]
+
+    def keys(self) -> set:
+        """Return the set of candidate keys currently stored"""
+        return set(self._key_index_for(self.load_manifest()))
+
+    def append(self, candidates: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Append candidates as a new delta segment; cost is proportional to len(candidates)"""
+        manifest = self.load_manifest()
+        self._key_index_for(manifest)
+        if metadata:
+            manifest.setdefault("metadata", {}).update(metadata)
+
+        if not candidates:
+            if metadata:
+                self._write_manifest(manifest)
+            return None
+
+        seq = manifest["next_seq"]
+        segment_name = f"segment_{seq:06d}.jsonl"
+        written = self._write_jsonl(segment_name, candidates)
+        self._append_keys(manifest, candidates, manifest.get("keys") or f"keys_{seq:06d}.jsonl")
+
+        manifest["segments"].append(segment_name)
+        manifest["next_seq"] = seq + 1
+        # Upper bound until the next compaction collapses replaced records
+        manifest["total_count"] = manifest.get("total_count", 0) + written
+        self._write_manifest(manifest)
+
+        if len(manifest["segments"]) >= self.compact_threshold:
+            self.compact()
+
+        return os.path.join(self.store_dir, segment_name)
+
+    def append_new(self, candidates: List[Dict[str, Any]],
+                   metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Append only candidates whose candidate_key is not already stored; returns the ones added"""
+        index = self._key_index_for(self.load_manifest())
+        seen = set()
+        added = []
+        for candidate in candidates:
+            identifier = candidate_key(candidate)
+            if identifier not in index and identifier not in seen:
+                seen.add(identifier)
+                added.append(candidate)
+        self.append(added, metadata)
+        return added
+
+    def upsert(self, candidates: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Append candidates that are new or differ from their stored version; returns the ones written"""
+        index = self._key_index_for(self.load_manifest())
+        changed = [c for c in candidates if index.get(candidate_key(c)) != candidate_fingerprint(c)]
+        self.append(changed, metadata)
+        return changed
+
+    def compact(self, candidates: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Fold base and segments into a new base; pass candidates to replace the state outright"""
+        manifest = self.load_manifest()
+        if candidates is None:
+            candidates = self.load_all()
+
+        seq = manifest["next_seq"]
+        base_name = f"base_{seq:06d}.jsonl"
+        written = self._write_jsonl(base_name, candidates)
+
+        obsolete = ([manifest["base"]] if manifest.get("base") else []) + manifest.get("segments", [])
+        if manifest.get("keys"):
+            obsolete.append(manifest["keys"])
+        self._append_keys(manifest, candidates, f"keys_{seq:06d}.jsonl")
+        manifest["base"] = base_name
+        manifest["segments"] = []
+        manifest["next_seq"] = seq + 1
+        manifest["total_count"] = written
+        self._write_manifest(manifest)
+
+        # Old files are only removed once the new manifest is durable
+        for filename in obsolete:
+            try:
+                os.remove(os.path.join(self.store_dir, filename))
+            except FileNotFoundError:
+                pass
+
+        return os.path.join(self.store_dir, base_name)
+
+    def import_legacy_snapshot(self, processed_dir: Optional[str] = None) -> Optional[str]:
+        """Seed an empty store from the newest all_processed_candidates_<timestamp>.json"""
+        if self.exists():
+            return None
+        if processed_dir is None:
+            processed_dir = os.path.dirname(os.path.normpath(self.store_dir))
+        snapshots = glob.glob(os.path.join(processed_dir, LEGACY_SNAPSHOT_PATTERN))
+        if not snapshots:
+            return None
+        latest = max(snapshots, key=os.path.getmtime)
+        self.compact(load_snapshot_file(latest))
+        print(f"📦 Imported legacy snapshot {latest} into {self.store_dir}")
+        return latest
+
+def open_store(store_dir: str = DEFAULT_STORE_DIR) -> CandidateStore:
+    """Open the candidate store, importing the latest legacy snapshot on first use"""
+    store = CandidateStore(store_dir)
+    store.import_legacy_snapshot()
+    return store
+
+def main():
+    """Print a summary of the store; pass --compact to fold all segments into a new base"""
+    store = open_store()
+    if "--compact" in sys.argv:
+        print(f"🗜️ Compacted store into {store.compact()}")
+
+    manifest = store.load_manifest()
+    print(f"📁 Store: {store.store_dir}")
+    print(f"   • Base: {manifest.get('base')}")
+    print(f"   • Segments: {len(manifest.get('segments', []))}")
+    print(f"   • Candidates: {len(store.load_all())}")
+    print(f"   • Last updated: {manifest.get('last_updated')}")
+
+if __name__ == "__main__":
+    main()
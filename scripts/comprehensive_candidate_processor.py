@@ -12,6 +12,9 @@ import time
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from candidate_quality import apply_scores, quality_summary
+from skill_vocabulary import keyword_match_count
+
 class ComprehensiveCandidateProcessor:
     def __init__(self):
         self.downloads_dir = "context/Applicant Page Downloads"
@@ -75,6 +78,9 @@ class ComprehensiveCandidateProcessor:
                 if applicant:
                     applicants.append(applicant)
             
+            # Score the whole job in one batch; stores data_quality_score on each applicant
+            apply_scores(applicants)
+            
             print(f"\n✅ Successfully extracted {len(applicants)} applicants with complete data")
             return applicants
             
@@ -200,7 +206,7 @@ class ComprehensiveCandidateProcessor:
                 "lookup_data": {},
                 "is_rated": False,
                 "processing_date": datetime.now().isoformat(),
-                "data_quality_score": self.calculate_data_quality_score(rate_match, success_match, hours_match, jobs_match, skills, proposal),
+                "data_quality_score": 0.0,  # set per batch by apply_scores
                 "extraction_method": "comprehensive_html_parser"
             }
             
@@ -318,7 +324,7 @@ class ComprehensiveCandidateProcessor:
         
         # Skills match - 25% weight
         job_keywords = self.jobs[job_type]["keywords"]
-        skill_matches = sum(1 for skill in skills if any(keyword.lower() in skill.lower() for keyword in job_keywords))
+        skill_matches = keyword_match_count(skills, job_keywords)
         rating += min(skill_matches * 0.25, 1.25)  # Max 1.25 points
         
         # Hourly rate (reasonable range) - 15% weight
@@ -336,26 +342,6 @@ class ComprehensiveCandidateProcessor:
         
         return min(rating, 5.0)  # Cap at 5.0
     
-    def calculate_data_quality_score(self, rate_match, success_match, hours_match, jobs_match, skills: List[str], proposal: str) -> float:
-        """Calculate data quality score (0-1)"""
-        score = 0.0
-        total_fields = 6
-        
-        if rate_match:
-            score += 1.0
-        if success_match:
-            score += 1.0
-        if hours_match:
-            score += 1.0
-        if jobs_match:
-            score += 1.0
-        if skills and len(skills) > 0:
-            score += 1.0
-        if proposal and len(proposal) > 20:
-            score += 1.0
-        
-        return score / total_fields
-    
     def calculate_comprehensive_ranking_score(self, applicant: Dict, job_type: str) -> float:
         """Calculate comprehensive ranking score"""
         score = 0.0
@@ -388,7 +374,7 @@ class ComprehensiveCandidateProcessor:
         # Skills match (25% weight)
         skills = applicant.get("skills", [])
         job_keywords = job_config["keywords"]
-        skill_matches = sum(1 for skill in skills if any(keyword.lower() in skill.lower() for keyword in job_keywords))
+        skill_matches = keyword_match_count(skills, job_keywords)
         score += min(skill_matches / len(job_keywords), 1.0) * 0.25
         
         # Hourly rate (15% weight)
@@ -518,24 +504,7 @@ class ComprehensiveCandidateProcessor:
     
     def calculate_overall_data_quality(self, applicants: List[Dict]) -> Dict:
         """Calculate overall data quality metrics"""
-        total_applicants = len(applicants)
-        if total_applicants == 0:
-            return {}
-        
-        quality_scores = [app.get("data_quality_score", 0) for app in applicants]
-        avg_quality = sum(quality_scores) / len(quality_scores)
-        
-        complete_profiles = sum(1 for app in applicants if app.get("data_quality_score", 0) > 0.8)
-        partial_profiles = sum(1 for app in applicants if 0.4 <= app.get("data_quality_score", 0) <= 0.8)
-        incomplete_profiles = sum(1 for app in applicants if app.get("data_quality_score", 0) < 0.4)
-        
-        return {
-            "average_quality_score": round(avg_quality, 2),
-            "complete_profiles": complete_profiles,
-            "partial_profiles": partial_profiles,
-            "incomplete_profiles": incomplete_profiles,
-            "total_applicants": total_applicants
-        }
+        return quality_summary(applicants)
 
 def main():
     processor = ComprehensiveCandidateProcessor()
@@ -71,22 +71,19 @@ class RealJobPostingConnector:
         # Step 1: Navigate to the job page
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_navigate(url='{job_url}')")
         
-        # Step 2: Wait for page load
-        await asyncio.sleep(5)
-        
-        # Step 3: Check if we're on the right page
+        # Step 2: Check if we're on the right page
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => document.title')")
         
-        # Step 4: Look for "View Proposals" button
+        # Step 3: Look for "View Proposals" button
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => {{")
         print(f"  const viewProposalsBtn = document.querySelector('[data-test=\"view-proposals\"]') || document.querySelector('a[href*=\"proposals\"]');")
         print(f"  return viewProposalsBtn ? viewProposalsBtn.href : null;")
         print(f"}}')")
         
-        # Step 5: If found, navigate to proposals page
+        # Step 4: If found, navigate to proposals page
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_navigate(url='[PROPOSALS_URL]')")
         
-        # Step 6: Extract all applicant data
+        # Step 5: Extract all applicant data
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => {{")
         print(f"  const applicants = [];")
         print(f"  const proposalCards = document.querySelectorAll('[data-test=\"proposal-card\"]');")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Crawl Frontier
+Persistent scrape checkpoints: every brief page and profile URL with its state.
+
+A scrape records each URL in the frontier table before fetching it, under a
+scope (the brief being crawled). A URL moves through
+
+    queued --claim()--> in_flight --done()--> done      (result stored as JSON)
+                                  --failed()-> failed   (re-queued by the next
+                                                         claim() until it has used
+                                                         max_attempts)
+                                  --release()-> queued  (not fetched after all)
+
+and every transition is committed immediately, so a crash loses at most the
+pages that were in flight; opening the frontier for a crawl puts those back
+in the queue. A restarted crawl picks up its queued pages and profiles, and
+done profiles are read back from their stored results instead of being
+fetched again. A profile that is already done under another scope (someone
+who applied to two briefs) is added as done with the same result, and add()
+says so, so the crawl can collect that result straight away.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+DEFAULT_FRONTIER_PATH = "../output/applicants/crawl_frontier.db"
+MAX_ATTEMPTS = 3               # fetches of one URL before it stays failed
+
+STATES = ("queued", "in_flight", "done", "failed")
+
+class CrawlFrontier:
+    """SQLite-backed crawl state; every state change is committed as it happens"""
+
+    def __init__(self, db_path: str = DEFAULT_FRONTIER_PATH, max_attempts: int = MAX_ATTEMPTS, resume: bool = True):
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS frontier (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT,
+                kind TEXT,
+                scope TEXT,
+                parent TEXT,
+                state TEXT,
+                attempts INTEGER DEFAULT 0,
+                result TEXT,
+                error TEXT,
+                updated_at TEXT,
+                UNIQUE (scope, url)
+            );
+            CREATE INDEX IF NOT EXISTS frontier_scope_state ON frontier (scope, kind, state);
+        ''')
+        self.recovered = self.recover() if resume else 0
+
+    def recover(self) -> int:
+        """Put URLs left in flight by an interrupted run back in the queue"""
+        cursor = self.conn.execute(
+            "UPDATE frontier SET state = 'queued', updated_at = ? WHERE state = 'in_flight'",
+            (datetime.now().isoformat(),)
+        )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def add(self, url: str, kind: str, scope: str, parent: Optional[str] = None) -> Optional[str]:
+        """Queue a URL (as done if another scope fetched it); the state it got, or None if the scope already has it"""
+        fetched = self.conn.execute(
+            "SELECT result FROM frontier WHERE url = ? AND kind = ? AND state = 'done' AND result IS NOT NULL LIMIT 1",
+            (url, kind)
+        ).fetchone()
+        cursor = self.conn.execute('''
+            INSERT OR IGNORE INTO frontier (url, kind, scope, parent, state, result, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (url, kind, scope, parent, "done" if fetched else "queued", fetched[0] if fetched else None,
+              datetime.now().isoformat()))
+        self.conn.commit()
+        if cursor.rowcount != 1:
+            return None
+        return "done" if fetched else "queued"
+
+    def claim(self, kind: str, scope: str, limit: int = 1) -> List[str]:
+        """Mark up to limit queued (or retryable failed) URLs in flight, oldest first, and return them"""
+        if limit <= 0:
+            return []
+        urls = [row[0] for row in self.conn.execute('''
+            SELECT url FROM frontier
+            WHERE scope = ? AND kind = ? AND (state = 'queued' OR (state = 'failed' AND attempts < ?))
+            ORDER BY seq LIMIT ?
+        ''', (scope, kind, self.max_attempts, limit))]
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            "UPDATE frontier SET state = 'in_flight', attempts = attempts + 1, updated_at = ? WHERE scope = ? AND url = ?",
+            [(now, scope, url) for url in urls]
+        )
+        self.conn.commit()
+        return urls
+
+    def done(self, scope: str, url: str, result: Any = None):
+        """Mark a URL fetched, storing its result"""
+        self.conn.execute(
+            "UPDATE frontier SET state = 'done', result = ?, error = NULL, updated_at = ? WHERE scope = ? AND url = ?",
+            (json.dumps(result, ensure_ascii=False) if result is not None else None, datetime.now().isoformat(),
+             scope, url)
+        )
+        self.conn.commit()
+
+    def failed(self, scope: str, url: str, error: str):
+        """Mark a fetch failed; the URL is claimable again until it has used max_attempts"""
+        self.conn.execute(
+            "UPDATE frontier SET state = 'failed', error = ?, updated_at = ? WHERE scope = ? AND url = ?",
+            (error, datetime.now().isoformat(), scope, url)
+        )
+        self.conn.commit()
+
+    def release(self, scope: str, url: str):
+        """Put a claimed URL back in the queue unfetched, without using up one of its attempts"""
+        self.conn.execute(
+            "UPDATE frontier SET state = 'queued', attempts = MAX(0, attempts - 1), updated_at = ? "
+            "WHERE scope = ? AND url = ? AND state = 'in_flight'",
+            (datetime.now().isoformat(), scope, url)
+        )
+        self.conn.commit()
+
+    def state(self, scope: str, url: str) -> Optional[str]:
+        row = self.conn.execute("SELECT state FROM frontier WHERE scope = ? AND url = ?", (scope, url)).fetchone()
+        return row[0] if row else None
+
+    def result(self, scope: str, url: str) -> Any:
+        """Stored result of a done URL, or None"""
+        row = self.conn.execute(
+            "SELECT result FROM frontier WHERE scope = ? AND url = ? AND state = 'done' AND result IS NOT NULL",
+            (scope, url)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def results(self, scope: str, kind: str = "profile") -> List[Any]:
+        """Stored results of a scope's done URLs, in the order they were queued"""
+        return [json.loads(row[0]) for row in self.conn.execute(
+            "SELECT result FROM frontier WHERE scope = ? AND kind = ? AND state = 'done' AND result IS NOT NULL ORDER BY seq",
+            (scope, kind)
+        )]
+
+    def counts(self, scope: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """{kind: {state: count}} for one scope, or for the whole frontier"""
+        query = "SELECT kind, state, COUNT(*) FROM frontier"
+        params: tuple = ()
+        if scope is not None:
+            query += " WHERE scope = ?"
+            params = (scope,)
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind, state, count in self.conn.execute(query + " GROUP BY kind, state", params):
+            counts.setdefault(kind, {})[state] = count
+        return counts
+
+    def scopes(self) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT scope FROM frontier ORDER BY scope")]
+
+    def reset(self, scope: str):
+        """Forget a scope so its next crawl starts from the beginning"""
+        self.conn.execute("DELETE FROM frontier WHERE scope = ?", (scope,))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+def main():
+    """Show crawl progress per brief (--db PATH, --reset SCOPE)"""
+    db_path = sys.argv[sys.argv.index("--db") + 1] if "--db" in sys.argv else DEFAULT_FRONTIER_PATH
+    if not os.path.exists(db_path):
+        print(f"❌ No crawl frontier at {db_path}")
+        return
+    frontier = CrawlFrontier(db_path, resume=False)
+    if "--reset" in sys.argv:
+        scope = sys.argv[sys.argv.index("--reset") + 1]
+        frontier.reset(scope)
+        print(f"🗑️ Reset crawl state for {scope}")
+    for scope in frontier.scopes():
+        print(f"🔗 {scope}")
+        for kind, states in sorted(frontier.counts(scope).items()):
+            summary = ", ".join(f"{states.get(state, 0)} {state}" for state in STATES if states.get(state))
+            print(f"   • {kind}: {summary}")
+    frontier.close()
+
+if __name__ == "__main__":
+    main()
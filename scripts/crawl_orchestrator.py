@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Crawl Orchestrator
+Runs several briefs (or search categories) at once over one tab pool, under a single result budget.
+
+Scrapers used to crawl their briefs one after another, so the pool sat
+mostly idle while a brief paged through its proposals, and whichever brief
+came first could spend all of max_applicants. CrawlOrchestrator.run starts
+every crawl together; they share the scraper's TabPool, whose FairShare
+hands free tabs to the crawls in turn, so every brief makes progress from
+the start. A CrawlBudget is the one count of results for the whole run: a
+unit is reserved as work starts (for a profile, when it gets its tab, so
+the budget is spent in fair-share order too), settled when it finishes and
+given back if it fails, and a crawl stops paging once its queued work
+would use up what is left. While they run, a CrawlProgress line every
+PROGRESS_INTERVAL seconds shows each crawl's pages, results and failures,
+the budget and the overall rate.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Awaitable, Callable, Optional
+
+PROGRESS_INTERVAL = 5.0        # seconds between live progress lines
+
+class CrawlBudget:
+    """Results left for the whole run; reservations cover work in flight so crawls never overshoot it"""
+
+    def __init__(self, total: Optional[int] = None):
+        self.total = total         # None: unlimited
+        self.collected = 0
+        self.in_flight = 0
+
+    def remaining(self) -> Optional[int]:
+        if self.total is None:
+            return None
+        return max(0, self.total - self.collected - self.in_flight)
+
+    def exhausted(self) -> bool:
+        return self.remaining() == 0
+
+    def reserve(self, wanted: int) -> int:
+        """Reserve up to `wanted` results and return how many were granted"""
+        remaining = self.remaining()
+        granted = max(0, wanted if remaining is None else min(wanted, remaining))
+        self.in_flight += granted
+        return granted
+
+    def settle(self, collected: bool):
+        """Close one reservation: count the result, or give the budget back for another crawl to use"""
+        self.in_flight = max(0, self.in_flight - 1)
+        if collected:
+            self.collected += 1
+
+    def add_collected(self, count: int):
+        """Count results gathered outside a reservation (e.g. read back from an earlier run)"""
+        self.collected += count
+
+@dataclass
+class CrawlStatus:
+    """Counters for one crawl"""
+    pages: int = 0             # listing or brief pages read
+    found: int = 0             # result links (or tiles) seen
+    collected: int = 0
+    failed: int = 0
+    finished: bool = False
+
+class CrawlProgress:
+    """Per-crawl counters and the one-line summary printed while crawls run"""
+
+    def __init__(self):
+        self.crawls: Dict[str, CrawlStatus] = {}
+        self.started = time.monotonic()
+
+    def crawl(self, name: str) -> CrawlStatus:
+        if name not in self.crawls:
+            self.crawls[name] = CrawlStatus()
+        return self.crawls[name]
+
+    def summary(self, budget: Optional[CrawlBudget] = None) -> str:
+        elapsed = time.monotonic() - self.started
+        collected = sum(status.collected for status in self.crawls.values())
+        parts = []
+        for name, status in self.crawls.items():
+            part = f"{name} {status.collected}/{status.found}"
+            if status.failed:
+                part += f" ({status.failed} failed)"
+            parts.append(part + (" ✓" if status.finished else f" p{status.pages}"))
+        if budget is not None and budget.total is not None:
+            parts.append(f"budget {budget.collected}/{budget.total} ({budget.in_flight} in flight)")
+        rate = f"{collected / elapsed:.2f}/s" if elapsed >= 1 else "-/s"
+        parts.append(f"{collected} in {elapsed:.0f}s, {rate}")
+        return " · ".join(parts)
+
+class CrawlOrchestrator:
+    """Runs named crawls concurrently and reports their progress until all are done"""
+
+    def __init__(self, budget: Optional[CrawlBudget] = None, progress: Optional[CrawlProgress] = None,
+                 interval: float = PROGRESS_INTERVAL):
+        self.budget = budget or CrawlBudget()
+        self.progress = progress or CrawlProgress()
+        self.interval = interval
+
+    async def _report(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            print(f"📈 {self.progress.summary(self.budget)}")
+
+    async def _run_one(self, name: str, crawl: Callable[[], Awaitable[List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        status = self.progress.crawl(name)
+        try:
+            return await crawl()
+        except Exception as e:
+            print(f"❌ Crawl {name} stopped: {e}")
+            return []
+        finally:
+            status.finished = True
+
+    async def run(self, crawls: Dict[str, Callable[[], Awaitable[List[Dict[str, Any]]]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Start every crawl at once; their results by name once all have finished"""
+        for name in crawls:
+            self.progress.crawl(name)
+        print(f"🚦 Crawling {len(crawls)} at once: {', '.join(crawls)}")
+        reporter = asyncio.create_task(self._report())
+        try:
+            results = await asyncio.gather(*(self._run_one(name, crawl) for name, crawl in crawls.items()))
+        finally:
+            reporter.cancel()
+        print(f"🏁 {self.progress.summary(self.budget)}")
+        return dict(zip(crawls, results))
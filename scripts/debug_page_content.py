@@ -5,9 +5,9 @@ Debug Page Content - See what's actually on Upwork job pages
 
 import asyncio
 import json
-import subprocess
 import sys
-from typing import Any
+
+from mcp_browser_client import MCPError, check_gateway, get_client, close_client
 
 class PageDebugger:
     """Debug what's on Upwork job pages"""
@@ -22,62 +22,20 @@ class PageDebugger:
         ]
     
     async def check_mcp_server(self) -> bool:
-        """Check if Docker MCP server is running"""
-        print("🔍 Checking Docker MCP server status...")
-        try:
-            result = subprocess.run(['docker', 'mcp', 'gateway', 'status'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print("✅ Docker MCP gateway is running")
-                self.mcp_server_running = True
-                return True
-            else:
-                print("❌ Docker MCP gateway is not running")
-                return False
-        except Exception as e:
-            print(f"❌ Error checking Docker MCP gateway: {e}")
-            return False
-    
-    async def make_real_mcp_call(self, tool_name: str, **kwargs) -> Any:
-        """Make a real MCP call to the Docker MCP server"""
-        if not self.mcp_server_running:
-            print("❌ MCP server not running")
-            return None
-            
-        print(f"🔧 Making REAL MCP call: {tool_name}")
-        
-        # Simulate the MCP call
-        await asyncio.sleep(1)
-        
-        if tool_name == "mcp_MCP_DOCKER_browser_navigate":
-            url = kwargs.get('url', '')
-            print(f"🌐 REAL MCP: Navigating to {url}")
-            return {"success": True, "url": url}
-            
-        elif tool_name == "mcp_MCP_DOCKER_browser_evaluate":
-            function = kwargs.get('function', '')
-            print(f"💻 REAL MCP: Executing JavaScript")
-            return {"result": "page_content_loaded"}
-            
-        return None
+        """Check that the Docker MCP gateway answers (health check cached by the shared client)"""
+        self.mcp_server_running = await check_gateway()
+        return self.mcp_server_running
     
     async def navigate_to_page(self, url: str) -> bool:
-        """Navigate to a page using real MCP"""
+        """Navigate to a page over the shared MCP session"""
         try:
             print(f"🔄 Navigating to: {url}")
-            result = await self.make_real_mcp_call(
-                "mcp_MCP_DOCKER_browser_navigate", 
-                url=url
-            )
-            
-            if result and result.get("success"):
-                print(f"✅ Successfully navigated to {url}")
-                return True
-            else:
-                print(f"❌ Failed to navigate to {url}")
-                return False
+            client = await get_client()
+            await client.navigate_and_wait(url, network_idle=True)
+            print(f"✅ Successfully navigated to {url} ({client.last_wait:.1f}s to settle)")
+            return True
                 
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ Navigation error: {e}")
             return False
     
@@ -92,8 +50,6 @@ class PageDebugger:
         if not success:
             return
         
-        await asyncio.sleep(3)
-        
         # Debug page content
         js_code = """
         () => {
@@ -143,28 +99,15 @@ class PageDebugger:
         }
         """
         
-        print("🔧 Making REAL MCP call: mcp_MCP_DOCKER_browser_evaluate")
-        print("💻 REAL MCP: Executing JavaScript")
-        
-        # Simulate result
-        result = {
-            "title": "Upwork Job Page",
-            "cloudflare": {
-                "hasCfWrapper": False,
-                "hasCfVerification": False,
-                "hasCfPleaseWait": False,
-                "titleIncludesCloudflare": False,
-                "titleIncludesChecking": False
-            },
-            "allLinks": [
-                {"text": "View Proposals", "href": "https://www.upwork.com/jobs/~021945256288324407279/proposals", "hasProposals": True, "hasApplicants": False, "hrefHasProposals": True, "hrefHasApplicants": False},
-                {"text": "View Applicants", "href": "https://www.upwork.com/jobs/~021945256288324407279/applicants", "hasProposals": False, "hasApplicants": True, "hrefHasProposals": False, "hrefHasApplicants": True}
-            ],
-            "allButtons": [
-                {"text": "View Proposals", "hasProposals": True, "hasApplicants": False}
-            ],
-            "bodyText": "This is a sample job posting page with View Proposals link..."
-        }
+        try:
+            client = await get_client()
+            result = await client.evaluate(js_code)
+        except MCPError as e:
+            print(f"❌ JavaScript evaluation error: {e}")
+            return
+        if not isinstance(result, dict):
+            print(f"❌ Unexpected page debug result: {result}")
+            return
         
         print(f"📄 Page Title: {result.get('title')}")
         print(f"🛡️ Cloudflare: {result.get('cloudflare')}")
@@ -186,14 +129,17 @@ async def main():
     """Main function"""
     debugger = PageDebugger()
     
-    # Check MCP server
-    if not await debugger.check_mcp_server():
-        print("❌ Cannot proceed without MCP server")
-        return
-    
-    # Debug each URL
-    for url in debugger.test_urls:
-        await debugger.debug_page_content(url)
+    try:
+        # Check MCP server
+        if not await debugger.check_mcp_server():
+            print("❌ Cannot proceed without MCP server")
+            return
+        
+        # Debug each URL
+        for url in debugger.test_urls:
+            await debugger.debug_page_content(url)
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
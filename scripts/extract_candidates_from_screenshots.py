@@ -4,11 +4,11 @@ Extract Candidates from Upwork Screenshots
 Processes new screenshots to extract candidate data
 """
 
-import json
-import os
 from datetime import datetime
 from typing import Dict, List, Any
 
+from candidate_store import open_store
+
 def extract_candidates_from_screenshot_data() -> List[Dict[str, Any]]:
     """
     Extract candidates from the screenshot data provided
@@ -368,14 +368,7 @@ def merge_with_existing_candidates(new_candidates: List[Dict[str, Any]]) -> List
     """Merge new candidates with existing ones, avoiding duplicates"""
     
     # Load existing candidates
-    existing_file = "output/processed_candidates/all_processed_candidates_20250719_031346.json"
-    
-    if os.path.exists(existing_file):
-        with open(existing_file, 'r') as f:
-            existing_data = json.load(f)
-            existing_candidates = existing_data.get('applicants', [])
-    else:
-        existing_candidates = []
+    existing_candidates = open_store().load_all()
     
     # Create a set of existing candidate IDs to avoid duplicates
     existing_ids = {c['id'] for c in existing_candidates}
@@ -389,29 +382,16 @@ def merge_with_existing_candidates(new_candidates: List[Dict[str, Any]]) -> List
     return existing_candidates
 
 def save_updated_candidates(candidates: List[Dict[str, Any]]):
-    """Save updated candidates to file"""
-    
-    # Create output directory
-    os.makedirs("output/processed_candidates", exist_ok=True)
+    """Append candidates not yet in the snapshot store as a new delta segment"""
     
-    # Generate filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"all_processed_candidates_{timestamp}.json"
-    filepath = f"output/processed_candidates/{filename}"
-    
-    # Save data
-    data = {
-        "applicants": candidates,
-        "total_count": len(candidates),
-        "last_updated": datetime.now().isoformat(),
+    store = open_store()
+    added = store.append_new(candidates, metadata={
         "source": "screenshot_extraction",
         "extraction_notes": "Extracted from new Upwork screenshots"
-    }
-    
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    })
+    print(f"➕ Appended {len(added)} candidates to the snapshot store")
     
-    return filepath
+    return store.manifest_path
 
 def main():
     print("🔄 Extracting candidates from new screenshots...")
@@ -428,12 +408,6 @@ def main():
     filepath = save_updated_candidates(all_candidates)
     print(f"💾 Saved updated candidates to: {filepath}")
     
-    # Update the main data file for the app
-    main_filepath = "output/processed_candidates/all_processed_candidates_20250719_031346.json"
-    with open(main_filepath, 'w') as f:
-        json.dump({"applicants": all_candidates}, f, indent=2)
-    print(f"🔄 Updated main data file: {main_filepath}")
-    
     # Generate status report
     print("\n📊 EXTRACTION SUMMARY:")
     print(f"   • New candidates extracted: {len(new_candidates)}")
@@ -9,10 +9,12 @@ import os
 from datetime import datetime
 from typing import Dict, List, Any
 
+from candidate_store import open_store
+
 class ExtractionStatusTracker:
     def __init__(self):
         self.status_file = "output/extraction_status.json"
-        self.current_data_file = "output/processed_candidates/all_processed_candidates_20250719_031346.json"
+        self.store = open_store()
         
     def load_current_status(self) -> Dict[str, Any]:
         """Load current extraction status"""
@@ -65,36 +67,34 @@ class ExtractionStatusTracker:
         status = self.load_current_status()
         
         # Count current candidates
-        if os.path.exists(self.current_data_file):
-            with open(self.current_data_file, 'r') as f:
-                data = json.load(f)
-                current_candidates = data.get('applicants', [])
-                
-                status["extraction_summary"]["total_candidates_saved"] = len(current_candidates)
-                status["extraction_summary"]["total_candidates_extracted"] = len(current_candidates)
-                
-                # Count by job posting
-                for candidate in current_candidates:
-                    job_title = candidate.get('job_title', '')
-                    if job_title in status["job_postings"]:
-                        status["job_postings"][job_title]["saved_candidates"] += 1
-                        status["job_postings"][job_title]["extracted_candidates"] += 1
-                
-                # Count rated candidates
-                rated_count = sum(1 for c in current_candidates if isinstance(c.get('rating'), (int, float)) and c.get('rating', 0) > 0)
-                status["extraction_summary"]["total_candidates_rated"] = rated_count
-                
-                # Update completion percentage
-                expected = status["extraction_summary"]["total_candidates_expected"]
-                saved = status["extraction_summary"]["total_candidates_saved"]
-                status["extraction_summary"]["extraction_completion_percentage"] = (saved / expected) * 100 if expected > 0 else 0
-                
-                # Update processing stages
-                if saved > 0:
-                    status["processing_stages"]["candidate_extraction"] = "completed"
-                    status["processing_stages"]["database_save"] = "completed"
-                    if rated_count > 0:
-                        status["processing_stages"]["rating_processing"] = "in_progress"
+        if self.store.exists():
+            current_candidates = self.store.load_all()
+            
+            status["extraction_summary"]["total_candidates_saved"] = len(current_candidates)
+            status["extraction_summary"]["total_candidates_extracted"] = len(current_candidates)
+            
+            # Count by job posting
+            for candidate in current_candidates:
+                job_title = candidate.get('job_title', '')
+                if job_title in status["job_postings"]:
+                    status["job_postings"][job_title]["saved_candidates"] += 1
+                    status["job_postings"][job_title]["extracted_candidates"] += 1
+            
+            # Count rated candidates
+            rated_count = sum(1 for c in current_candidates if isinstance(c.get('rating'), (int, float)) and c.get('rating', 0) > 0)
+            status["extraction_summary"]["total_candidates_rated"] = rated_count
+            
+            # Update completion percentage
+            expected = status["extraction_summary"]["total_candidates_expected"]
+            saved = status["extraction_summary"]["total_candidates_saved"]
+            status["extraction_summary"]["extraction_completion_percentage"] = (saved / expected) * 100 if expected > 0 else 0
+            
+            # Update processing stages
+            if saved > 0:
+                status["processing_stages"]["candidate_extraction"] = "completed"
+                status["processing_stages"]["database_save"] = "completed"
+                if rated_count > 0:
+                    status["processing_stages"]["rating_processing"] = "in_progress"
         
         status["extraction_summary"]["last_updated"] = datetime.now().isoformat()
         return status
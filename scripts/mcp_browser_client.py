@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+MCP Browser Client
+One long-lived asyncio session to the Docker MCP gateway, shared by every scraper.
+
+The gateway is started once (docker mcp gateway run, or MCP_GATEWAY_COMMAND)
+and spoken to over stdio as newline-delimited JSON-RPC. The initialize
+handshake and tool listing happen once per session; every later call is a
+single request/response on the open pipe. Requests carry ids and a reader
+task resolves each one's future when its response arrives, so concurrent
+coroutines can have calls in flight at the same time. The health check is a
+JSON-RPC ping whose result is cached for a short TTL, replacing a
+`docker mcp gateway status` subprocess per check. If the gateway exits, the
+next call starts a new session.
+
+Page tools (navigate, evaluate, click) act on the session's current tab, so
+callers that need several pages open at once should use one client each.
+
+Instead of sleeping a fixed time after navigating, callers wait on a
+readiness probe: a selector being present, the network going quiet, or
+their own JS predicate. The probe is polled with exponential backoff until it
+passes or a timeout runs out, so a page that is ready in 300 ms costs about
+300 ms, and a slow one gets up to the full timeout rather than a guess.
+"""
+
+import asyncio
+import collections
+import itertools
+import json
+import os
+import re
+import shlex
+import sys
+import time
+from typing import Dict, List, Any, Optional
+
+DEFAULT_GATEWAY_COMMAND = ["docker", "mcp", "gateway", "run"]
+PROTOCOL_VERSION = "2024-11-05"
+CALL_TIMEOUT = 60.0            # seconds to wait for one tool call
+START_TIMEOUT = 60.0           # seconds for the gateway to answer initialize
+HEALTH_TTL = 30.0              # seconds a health check result is reused
+STREAM_LIMIT = 32 * 1024 * 1024   # largest single message (page HTML can be big)
+
+TOOL_PREFIX = "mcp_MCP_DOCKER_"
+TOOL_ALIASES = {"browser_screenshot": "browser_take_screenshot"}
+
+READY_TIMEOUT = 15.0           # seconds to wait for a page to become ready
+POLL_INTERVAL = 0.05           # first readiness poll delay, doubled after each miss
+POLL_MAX_INTERVAL = 1.0        # longest delay between readiness polls
+NETWORK_IDLE_MS = 500          # quiet period (no resource finished) that counts as network idle
+CHALLENGE_TIMEOUT = 30.0       # seconds to wait for a Cloudflare challenge to clear itself
+
+# True once no Cloudflare interstitial is showing (pass as probe= to wait_until_ready)
+CLOUDFLARE_CLEARED = ("() => !document.querySelector('.cf-browser-verification, #cf-please-wait, .cf-wrapper')"
+                      " && !document.title.includes('Checking your browser')"
+                      " && !document.title.includes('Cloudflare')"
+                      " && !document.title.includes('Please wait')")
+
+RESULT_SECTION = re.compile(r'### Result\s*\n(.*?)(?=\n### |\Z)', re.S)
+CODE_FENCE = re.compile(r'^```\w*\n(.*?)\n?```$', re.S)
+
+class MCPError(Exception):
+    """A failed MCP request: the gateway is unreachable, timed out or returned an error"""
+
+def gateway_command() -> List[str]:
+    """Command that starts the gateway, from MCP_GATEWAY_COMMAND if set"""
+    command = os.environ.get("MCP_GATEWAY_COMMAND")
+    return shlex.split(command) if command else list(DEFAULT_GATEWAY_COMMAND)
+
+def tool_text(result: Dict[str, Any]) -> str:
+    """Text content of a tools/call result"""
+    return "\n".join(item.get("text", "") for item in result.get("content", []) if item.get("type") == "text")
+
+def parse_tool_result(result: Dict[str, Any]) -> Any:
+    """Value of a tools/call result: structured content, the JSON in its "### Result" section, or its text"""
+    if "structuredContent" in result:
+        return result["structuredContent"]
+    text = tool_text(result)
+    section = RESULT_SECTION.search(text)
+    value = (section.group(1) if section else text).strip()
+    fenced = CODE_FENCE.match(value)
+    if fenced:
+        value = fenced.group(1).strip()
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+def readiness_probe(selector: Optional[str] = None, network_idle: bool = False,
+                    probe: Optional[str] = None) -> str:
+    """JS function that is true once the document is parsed and every requested condition holds"""
+    checks = ["document.readyState !== 'loading'"]
+    if selector:
+        checks.append(f"!!document.querySelector({json.dumps(selector)})")
+    if network_idle:
+        checks.append("document.readyState === 'complete'")
+        checks.append("performance.now() - Math.max(0, ...performance.getEntriesByType('resource')"
+                      f".map(e => e.responseEnd)) >= {NETWORK_IDLE_MS}")
+    if probe:
+        checks.append(f"!!(({probe})())")
+    return "() => { /* readyProbe */ return " + " && ".join(checks) + "; }"
+
+class MCPBrowserClient:
+    """Persistent, multiplexed JSON-RPC session to an MCP server over stdio"""
+
+    def __init__(self, command: Optional[List[str]] = None, call_timeout: float = CALL_TIMEOUT,
+                 health_ttl: float = HEALTH_TTL):
+        self.command = command or gateway_command()
+        self.call_timeout = call_timeout
+        self.health_ttl = health_ttl
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.tools: Dict[str, Dict[str, Any]] = {}
+        self.server_info: Dict[str, Any] = {}
+        self.sessions = 0          # handshakes performed
+        self.calls = 0             # tool calls made
+        self.last_wait = 0.0       # seconds the last wait_until_ready() took
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._stderr: collections.deque = collections.deque(maxlen=20)
+        self._health: Optional[tuple] = None   # (checked at, healthy)
+
+    @property
+    def connected(self) -> bool:
+        return self.process is not None and self.process.returncode is None and self._reader is not None
+
+    async def start(self):
+        """Start the gateway and perform the MCP handshake, unless a session is already open"""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+            self._write_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.connected:
+                return
+            await self._close_process()
+            if self._reader:
+                await asyncio.gather(self._reader, return_exceptions=True)
+            self.loop = asyncio.get_running_loop()
+            try:
+                self.process = await asyncio.create_subprocess_exec(
+                    *self.command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE, limit=STREAM_LIMIT)
+            except OSError as e:
+                raise MCPError(f"cannot start {' '.join(self.command)}: {e}")
+            self._reader = asyncio.create_task(self._read_loop(self.process))
+            asyncio.create_task(self._read_stderr(self.process))
+
+            try:
+                init = await self._request("initialize", {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "upwork-scrapers", "version": "1.0"}
+                }, START_TIMEOUT)
+                await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+                listed = await self._request("tools/list", {}, START_TIMEOUT)
+            except MCPError:
+                await self._close_process()
+                raise
+            self.server_info = init.get("serverInfo", {})
+            self.tools = {tool["name"]: tool for tool in listed.get("tools", [])}
+            self.sessions += 1
+            self._health = (time.monotonic(), True)
+
+    async def _read_loop(self, process: asyncio.subprocess.Process):
+        """Resolve pending requests as responses arrive; fail them all when the gateway exits"""
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue      # not JSON-RPC (stray log output)
+                if "method" in message:
+                    if "id" in message:
+                        await self._answer_server_request(message)
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if "error" in message:
+                    error = message["error"]
+                    future.set_exception(MCPError(f"{error.get('message', 'error')} ({error.get('code')})"))
+                else:
+                    future.set_result(message.get("result", {}))
+        except (ValueError, asyncio.LimitOverrunError) as e:
+            self._stderr.append(f"unreadable response: {e}")
+        finally:
+            # Requests still waiting belong to this session unless a new one has already started
+            if self.process is process or self.process is None:
+                detail = f": {self._stderr[-1]}" if self._stderr else ""
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(MCPError(f"MCP gateway closed the session{detail}"))
+                self._pending.clear()
+                self._reader = None
+
+    async def _read_stderr(self, process: asyncio.subprocess.Process):
+        while True:
+            line = await process.stderr.readline()
+            if not line:
+                break
+            self._stderr.append(line.decode("utf-8", "replace").rstrip())
+
+    async def _answer_server_request(self, message: Dict[str, Any]):
+        """Reply to requests the server sends us: ping succeeds, anything else is unsupported"""
+        if message["method"] == "ping":
+            await self._send({"jsonrpc": "2.0", "id": message["id"], "result": {}})
+        else:
+            await self._send({"jsonrpc": "2.0", "id": message["id"],
+                              "error": {"code": -32601, "message": f"Method not found: {message['method']}"}})
+
+    async def _send(self, message: Dict[str, Any]):
+        data = (json.dumps(message) + "\n").encode("utf-8")
+        async with self._write_lock:
+            try:
+                self.process.stdin.write(data)
+                await self.process.stdin.drain()
+            except (ConnectionError, AttributeError) as e:
+                raise MCPError(f"MCP gateway is not accepting requests: {e}")
+
+    async def _request(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise MCPError(f"{method} timed out after {timeout:g}s")
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send one JSON-RPC request over the session (starting it if needed) and return its result"""
+        await self.start()
+        return await self._request(method, params or {}, timeout or self.call_timeout)
+
+    def resolve_tool(self, name: str) -> str:
+        """Gateway tool name for a scraper tool name (mcp_MCP_DOCKER_browser_navigate -> browser_navigate)"""
+        if name.startswith(TOOL_PREFIX):
+            name = name[len(TOOL_PREFIX):]
+        if self.tools and name not in self.tools and TOOL_ALIASES.get(name) in self.tools:
+            name = TOOL_ALIASES[name]
+        return name
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None,
+                        timeout: Optional[float] = None) -> Any:
+        """Call a tool and return its parsed result; tool errors raise MCPError"""
+        await self.start()
+        tool = self.resolve_tool(name)
+        self.calls += 1
+        result = await self._request("tools/call", {"name": tool, "arguments": arguments or {}},
+                                     timeout or self.call_timeout)
+        if result.get("isError"):
+            raise MCPError(f"{tool}: {tool_text(result).strip() or 'tool error'}")
+        return parse_tool_result(result)
+
+    async def navigate(self, url: str) -> bool:
+        """Open a URL in the session's current tab"""
+        await self.call_tool("browser_navigate", {"url": url})
+        return True
+
+    async def evaluate(self, function: str) -> Any:
+        """Run a JavaScript function in the page and return its JSON value"""
+        return await self.call_tool("browser_evaluate", {"function": function})
+
+    async def wait_until_ready(self, selector: Optional[str] = None, network_idle: bool = False,
+                               probe: Optional[str] = None, timeout: float = READY_TIMEOUT) -> bool:
+        """Poll a readiness probe with exponential backoff; False if it has not passed after timeout seconds"""
+        function = readiness_probe(selector, network_idle, probe)
+        start = time.monotonic()
+        delay = POLL_INTERVAL
+        try:
+            while True:
+                try:
+                    if await self.evaluate(function):
+                        return True
+                except MCPError:
+                    # The page can be mid-navigation; only a dead session is worth giving up on
+                    if not self.connected:
+                        raise
+                remaining = start + timeout - time.monotonic()
+                if remaining <= 0:
+                    return False
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, POLL_MAX_INTERVAL)
+        finally:
+            self.last_wait = time.monotonic() - start
+
+    async def navigate_and_wait(self, url: str, selector: Optional[str] = None, network_idle: bool = False,
+                                probe: Optional[str] = None, timeout: float = READY_TIMEOUT) -> bool:
+        """Open a URL, then wait until it is ready (see wait_until_ready); False if it never became ready"""
+        await self.navigate(url)
+        return await self.wait_until_ready(selector, network_idle, probe, timeout)
+
+    async def click(self, element: str, ref: str) -> Any:
+        return await self.call_tool("browser_click", {"element": element, "ref": ref})
+
+    async def screenshot(self, **arguments) -> Any:
+        return await self.call_tool("browser_screenshot", arguments)
+
+    async def check_health(self, force: bool = False) -> bool:
+        """Whether the gateway answers a ping; the answer is reused for health_ttl seconds"""
+        if not force and self._health and time.monotonic() - self._health[0] < self.health_ttl:
+            return self._health[1]
+        try:
+            await self.request("ping", timeout=10.0)
+            healthy = True
+        except MCPError as e:
+            self._stderr.append(str(e))
+            healthy = False
+        self._health = (time.monotonic(), healthy)
+        return healthy
+
+    def last_error(self) -> str:
+        return self._stderr[-1] if self._stderr else ""
+
+    async def _close_process(self):
+        process, self.process = self.process, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), 5)
+        except (asyncio.TimeoutError, ConnectionError):
+            process.kill()
+            await process.wait()
+
+    async def close(self):
+        """End the session and stop the gateway process"""
+        if self._start_lock is None:
+            return
+        async with self._start_lock:
+            await self._close_process()
+            if self._reader:
+                await asyncio.gather(self._reader, return_exceptions=True)
+        self._health = None
+
+_shared_client: Optional[MCPBrowserClient] = None
+
+async def get_client() -> MCPBrowserClient:
+    """The process-wide client, started on first use (a new one per event loop)"""
+    global _shared_client
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or (_shared_client.loop is not None and _shared_client.loop is not loop):
+        _shared_client = MCPBrowserClient()
+    await _shared_client.start()
+    return _shared_client
+
+async def check_gateway() -> bool:
+    """Print and return whether the Docker MCP gateway is reachable (cached health check)"""
+    print("🔍 Checking Docker MCP gateway...")
+    try:
+        client = await get_client()
+        healthy = await client.check_health()
+    except MCPError as e:
+        print(f"❌ Docker MCP gateway is not reachable: {e}")
+        print("💡 Check that Docker is running and the MCP Toolkit is enabled (or set MCP_GATEWAY_COMMAND)")
+        return False
+    if healthy:
+        name = client.server_info.get("name", "gateway")
+        print(f"✅ Docker MCP gateway is running ({name}, {len(client.tools)} tools)")
+    else:
+        print(f"❌ Docker MCP gateway is not responding: {client.last_error()}")
+    return healthy
+
+async def close_client():
+    """Close the shared session, if one was opened"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
+
+async def _main():
+    try:
+        if not await check_gateway():
+            return
+        client = await get_client()
+        if "--tools" in sys.argv:
+            for name in sorted(client.tools):
+                print(f"   • {name}")
+        if "--navigate" in sys.argv:
+            url = sys.argv[sys.argv.index("--navigate") + 1]
+            start = time.perf_counter()
+            ready = await client.navigate_and_wait(url, network_idle=True)
+            print(f"🌐 Navigated to {url} in {time.perf_counter() - start:.2f}s "
+                  f"({'ready' if ready else 'not ready'} after {client.last_wait:.2f}s wait)")
+        if "--eval" in sys.argv:
+            function = sys.argv[sys.argv.index("--eval") + 1]
+            start = time.perf_counter()
+            value = await client.evaluate(function)
+            print(f"💻 {json.dumps(value, ensure_ascii=False)[:2000]} ({time.perf_counter() - start:.2f}s)")
+        print(f"📊 {client.sessions} session(s), {client.calls} tool call(s)")
+    finally:
+        await close_client()
+
+def main():
+    """Check the gateway, then optionally --tools, --navigate URL and --eval 'JS function'"""
+    asyncio.run(_main())
+
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,18 @@ Merge New Candidates with Existing Data
 Combines the new UX/Conversion Designer candidates with existing applicant data
 """
 
-import json
-import os
 from datetime import datetime
 from typing import List, Dict, Any
 
+from candidate_store import open_store
+
 def load_existing_candidates() -> List[Dict[str, Any]]:
-    """Load existing candidates from JSON file"""
-    try:
-        with open('output/processed_candidates/all_processed_candidates_20250719_024619.json', 'r') as f:
-            data = json.load(f)
-            # Handle both list and dict formats
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict):
-                return data.get('applicants', [])
-            else:
-                return []
-    except FileNotFoundError:
-        print("No existing candidates file found, starting fresh")
+    """Load the latest candidate state from the snapshot store"""
+    store = open_store()
+    if not store.exists():
+        print("No existing candidates found, starting fresh")
         return []
+    return store.load_all()
 
 def create_new_candidates() -> List[Dict[str, Any]]:
     """Create new candidates from the screenshot data"""
@@ -252,30 +244,20 @@ def main():
     # Calculate stats
     stats = calculate_stats(merged_candidates)
     
-    # Create final data structure
-    final_data = {
-        "applicants": merged_candidates,
+    # Append only the candidates that were not already stored
+    store = open_store()
+    added_candidates = store.append_new(new_candidates, metadata={
         "stats": stats,
-        "last_updated": datetime.now().isoformat(),
-        "total_applicants": len(merged_candidates),
-        "new_applicants_added": len(new_candidates)
-    }
-    
-    # Save merged data
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"output/processed_candidates/all_processed_candidates_{timestamp}.json"
-    
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
-    with open(output_file, 'w') as f:
-        json.dump(final_data, f, indent=2)
+        "source": "merge_new_candidates"
+    })
+    output_file = store.manifest_path
     
-    print(f"✅ Saved merged data to: {output_file}")
+    print(f"✅ Appended {len(added_candidates)} candidates to store: {output_file}")
     
     # Print summary
     print("\n📊 Merge Summary:")
     print(f"Existing candidates: {len(existing_candidates)}")
-    print(f"New candidates: {len(new_candidates)}")
+    print(f"New candidates: {len(added_candidates)}")
     print(f"Total candidates: {len(merged_candidates)}")
     print(f"Job positions: {stats['positions']}")
     print(f"Average rating: {stats['averageRating']}")
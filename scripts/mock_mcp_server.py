@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Mock MCP Server
+Local stand-in for the Docker MCP gateway that serves fixture pages over stdio.
+
+Speaks the same newline-delimited JSON-RPC as the gateway and implements
+the browser tools the scrapers use (browser_navigate, browser_evaluate,
+browser_click, browser_take_screenshot). There is no JavaScript engine: a
+fixture page is a title plus an ordered list of rules, and browser_evaluate
+returns the result of the first rule that fits the function. A rule either
+has a "script" (the page_cache.script_hash of one exact function, which is
+what recordings use) or a "match" text that appears in the function source;
+the scrapers' extraction scripts all contain a distinctive string (a
+console.log message, a variable name or a selector), which is what the
+synthetic rules key on. page_extraction's batched scripts are matched by
+their "pageExtract:<kind>" marker, and since they wait for the page
+in-page, the server holds their answer until the page is ready. Readiness
+probes (mcp_browser_client.readiness_probe) are answered before any rule:
+false until --ready-delay seconds after the navigation, true after. Each
+server process has its own current page, like a browser tab.
+
+Fixture pages come from
+    --synthetic N      a brief with N applicants, their profiles, and search pages
+    --fixtures FILE    JSON {url: {"title": ..., "rules": [...]}}, e.g. a recording
+    --html-dir DIR     pages saved from a browser ("Save Page As"); without a JS
+                       engine these answer title and HTML snapshot scripts only
+and a real session can be recorded into a fixtures file by running the server
+as a proxy in front of the gateway:
+    --record FILE [--upstream "docker mcp gateway run"]
+
+Failures are injected per tool call, to exercise retries and measure tail
+latency: --fail-rate P (tool error), --slow-rate P with --slow S (S extra
+seconds), --crash-rate P (the process exits mid-call, as a dying gateway
+would), and --block-rate P (a navigation lands on a Cloudflare challenge
+that does not clear). --seed makes the injected failures other than
+crashes repeatable.
+
+Point the scrapers at it with
+    MCP_GATEWAY_COMMAND="python3 scripts/mock_mcp_server.py --synthetic 100"
+"""
+
+import glob
+import html
+import json
+import os
+import random
+import re
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+from mcp_browser_client import gateway_command, parse_tool_result
+from page_cache import script_hash
+from page_extraction import EXTRACTION_SCHEMA
+
+MOCK_BRIEF_URL = "https://www.upwork.com/jobs/~mock0000000000000001"
+MOCK_PROFILE_SEARCH_URL = "https://www.upwork.com/search/profiles/?q=mock"
+MOCK_JOB_SEARCH_URL = "https://www.upwork.com/search/jobs/?q=mock"
+MOCK_PAGE_SIZE = 10            # applicant links per proposals page
+SEARCH_PAGE_SIZE = 10          # results on a search page
+NAVIGATE_LATENCY = 0.2         # seconds per navigation
+EVALUATE_LATENCY = 0.02        # seconds per script evaluation
+READY_DELAY = 0.3              # seconds after a navigation until readiness probes pass
+
+TOOLS = ["browser_navigate", "browser_evaluate", "browser_click", "browser_take_screenshot"]
+
+CHALLENGE_TITLE = "Checking your browser - Cloudflare"
+SAVED_FROM = re.compile(r'<!--\s*saved from url=\(\d+\)(\S+?)\s*-->', re.I)
+TITLE_TAG = re.compile(r'<title[^>]*>(.*?)</title>', re.I | re.S)
+PAGE_TITLE_LINE = re.compile(r'Page Title:\s*(.*)')
+
+# Rules every synthetic page answers: login state, the Cloudflare check and the stealth setup
+COMMON_RULES = [
+    {"match": "isLoggedIn", "result": {"isLoggedIn": True, "hasLoginButton": False, "hasLogoutButton": True}},
+    {"match": "isBlocked", "result": {"isBlocked": False, "message": "No Cloudflare challenge"}},
+    {"match": "antiDetection", "result": {"antiDetection": True}},
+]
+
+def profile_url(index: int) -> str:
+    return f"https://www.upwork.com/freelancers/~mock{index:06d}"
+
+def extraction(kind: str, url: str, title: str, data: Dict[str, Any], cloudflare: bool = False) -> Dict[str, Any]:
+    """A page_extraction result for a fixture page"""
+    return {"schema": EXTRACTION_SCHEMA, "kind": kind, "url": url, "title": title, "ready": not cloudflare,
+            "loggedIn": not cloudflare, "cloudflare": cloudflare, "data": data}
+
+def mock_profile(index: int) -> Dict[str, Any]:
+    """Fields of one synthetic freelancer, the same wherever they are shown"""
+    rng = random.Random(index)
+    role = rng.choice(["UX Designer", "Shopify Developer", "UI/UX Designer", "Frontend Developer"])
+    return {
+        "name": f"Mock Applicant {index}",
+        "title": f"Senior {role}",
+        "hourly_rate": f"${rng.randint(25, 120)}.00/hr",
+        "total_earned": f"${rng.randint(1, 400)}K+",
+        "location": rng.choice(["United States", "Canada", "Poland", "India", "Brazil"]),
+        "skills": rng.sample(["Figma", "Shopify", "Liquid", "UX Research", "Prototyping", "React", "CSS"], 4),
+        "description": f"{role} with {rng.randint(2, 15)} years of experience.",
+        "rating": f"{rng.uniform(4.0, 5.0):.1f}",
+        "member_since": str(rng.randint(2012, 2023))
+    }
+
+def profile_fixture(index: int) -> Dict[str, Any]:
+    """A freelancer profile page whose every profile script returns the same record"""
+    profile = mock_profile(index)
+    title = f"{profile['name']} - {profile['title'][len('Senior '):]} - Upwork"
+    return {"title": title, "rules": [
+        {"match": "pageExtract:profile", "result": extraction("profile", profile_url(index), title, profile)},
+        *COMMON_RULES,
+        {"match": "profile", "result": profile}
+    ]}
+
+def search_fixtures(applicants: int) -> Dict[str, Dict[str, Any]]:
+    """A freelancer search page (links and tiles) and a job search page"""
+    indexes = range(1, min(applicants, SEARCH_PAGE_SIZE) + 1)
+    tiles = []
+    for index in indexes:
+        profile = mock_profile(index)
+        tiles.append({"name": profile["name"], "title": profile["title"], "rate": profile["hourly_rate"],
+                      "rating": profile["rating"], "location": profile["location"], "skills": profile["skills"],
+                      "total_earnings": profile["total_earned"], "success_rate": "100%"})
+    jobs = [{"title": f"Mock job {index}", "client": "Mock Client", "budget": f"${index * 500}",
+             "description": "A synthetic job posting.", "skills": ["Figma", "Shopify"], "posted": "1 day ago",
+             "proposals": "5 to 10"} for index in range(1, SEARCH_PAGE_SIZE + 1)]
+    links = [profile_url(index) for index in indexes]
+    return {
+        MOCK_PROFILE_SEARCH_URL: {"title": "Freelancer search - Upwork", "rules": [
+            *COMMON_RULES,
+            {"match": "profileLinks", "result": {"links": links, "count": len(links)}},
+            {"match": "freelancer-tile", "result": tiles}
+        ]},
+        MOCK_JOB_SEARCH_URL: {"title": "Job search - Upwork", "rules": [
+            *COMMON_RULES,
+            {"match": "job-tile", "result": jobs}
+        ]},
+    }
+
+def synthetic_fixtures(applicants: int, brief_url: str = MOCK_BRIEF_URL,
+                       page_size: int = MOCK_PAGE_SIZE) -> Dict[str, Dict[str, Any]]:
+    """A brief with paginated proposals and one profile page per applicant, plus the home and search pages"""
+    links = [profile_url(i) for i in range(1, applicants + 1)]
+    pages = max(1, -(-applicants // page_size))
+    proposals_url = f"{brief_url}/proposals"
+    fixtures: Dict[str, Dict[str, Any]] = {"https://www.upwork.com": {"title": "Upwork", "rules": list(COMMON_RULES)}}
+
+    for page in range(1, pages + 1):
+        page_links = links[(page - 1) * page_size:page * page_size]
+        url = brief_url if page == 1 else f"{brief_url}?page={page}"
+        fixtures[url] = {"title": "Mock brief - Upwork", "rules": [
+            {"match": "pageExtract:brief", "result": extraction("brief", url, "Mock brief - Upwork", {
+                "section": {"selector": "[data-test=\"proposals\"]"}, "links": page_links, "proposalsUrl": None,
+                "pagination": {"hasNext": page < pages, "currentPage": page, "maxPage": pages}
+            })},
+            *COMMON_RULES,
+            {"match": "cloudflareIndicators", "result": {"isCloudflare": False, "hasViewProposals": True,
+                                                          "text": "View proposals", "href": proposals_url}},
+            # For scrapers that read the proposals list on the brief page; the links script also names the section
+            {"match": "proposalsSection", "result": {"links": page_links}},
+            {"match": "proposals-section", "result": {"found": True, "selector": "[data-test=\"proposals-section\"]"}}
+        ]}
+    fixtures[proposals_url] = {"title": "Proposals - Upwork", "rules": [
+        *COMMON_RULES,
+        {"match": "proposalsSection", "result": {"links": links}},
+        {"match": "proposals-section", "result": {"found": True, "selector": "[data-test=\"proposals-section\"]"}}
+    ]}
+    for index in range(1, applicants + 1):
+        fixtures[profile_url(index)] = profile_fixture(index)
+    fixtures.update(search_fixtures(applicants))
+    return fixtures
+
+def load_fixtures(path: str) -> Dict[str, Dict[str, Any]]:
+    """Fixture pages from a JSON file: {url: {"title": ..., "rules": [{"match" or "script": ..., "result": ...}]}}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_saved_pages(directory: str) -> Dict[str, Dict[str, Any]]:
+    """Fixture pages from browser-saved HTML files, at the URL they were saved from (else their file URL)"""
+    fixtures: Dict[str, Dict[str, Any]] = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.htm*"))):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        saved_from = SAVED_FROM.search(content[:4096])
+        url = saved_from.group(1) if saved_from else "file://" + os.path.abspath(path)
+        title = TITLE_TAG.search(content)
+        fixtures[url] = {"title": html.unescape(title.group(1).strip()) if title else os.path.basename(path),
+                         "html": content, "rules": []}
+    return fixtures
+
+class FailureInjector:
+    """Decides, per tool call, whether to fail, stall, crash or serve a challenge page"""
+
+    def __init__(self, fail_rate: float = 0.0, slow_rate: float = 0.0, slow: float = 5.0,
+                 crash_rate: float = 0.0, block_rate: float = 0.0, seed: Optional[int] = None):
+        self.fail_rate = fail_rate
+        self.slow_rate = slow_rate
+        self.slow = slow
+        self.crash_rate = crash_rate
+        self.block_rate = block_rate
+        self.rng = random.Random(seed)
+        # Unseeded: a restarted server replays the seeded sequence, and would crash at the same call again
+        self.crash_rng = random.Random()
+
+    def before_call(self) -> Optional[str]:
+        """Error text for a failed call, or None; may stall or exit the process first"""
+        if self.crash_rate and self.crash_rng.random() < self.crash_rate:
+            os._exit(1)
+        if self.slow_rate and self.rng.random() < self.slow_rate:
+            time.sleep(self.slow)
+        if self.fail_rate and self.rng.random() < self.fail_rate:
+            return "Target page, context or browser has been closed"
+        return None
+
+    def blocks_navigation(self) -> bool:
+        return bool(self.block_rate) and self.rng.random() < self.block_rate
+
+class MockBrowser:
+    """One tab's worth of state: the current fixture page"""
+
+    def __init__(self, fixtures: Dict[str, Dict[str, Any]], navigate_latency: float = NAVIGATE_LATENCY,
+                 evaluate_latency: float = EVALUATE_LATENCY, ready_delay: float = READY_DELAY,
+                 failures: Optional[FailureInjector] = None):
+        self.fixtures = fixtures
+        self.navigate_latency = navigate_latency
+        self.evaluate_latency = evaluate_latency
+        self.ready_delay = ready_delay
+        self.failures = failures or FailureInjector()
+        self.url = "about:blank"
+        self.page: Dict[str, Any] = {"title": "", "rules": []}
+        self.ready_at = 0.0
+        self.blocked = False
+
+    def navigate(self, url: str) -> str:
+        time.sleep(self.navigate_latency)
+        self.url = url
+        self.page = self.fixtures.get(url, {"title": "Page not found", "rules": []})
+        self.ready_at = time.monotonic() + self.ready_delay
+        self.blocked = self.failures.blocks_navigation()
+        title = CHALLENGE_TITLE if self.blocked else self.page["title"]
+        return f"### Page state\n- Page URL: {url}\n- Page Title: {title}"
+
+    def evaluate(self, function: str) -> Any:
+        time.sleep(self.evaluate_latency)
+        if self.blocked:
+            return self.evaluate_challenge(function)
+        if "readyProbe" in function:
+            return time.monotonic() >= self.ready_at
+        if "pageExtract" in function:
+            time.sleep(max(0.0, self.ready_at - time.monotonic()))
+        key = script_hash(function)
+        for rule in self.page.get("rules", []):
+            if rule.get("script") == key or ("match" in rule and rule["match"] in function):
+                return rule["result"]
+        if "pageExtract" in function:
+            return None           # no recorded extraction for this page
+        if "outerHTML" in function:
+            return self.page.get("html") or (f"<html><head><title>{self.page['title']}</title></head>"
+                                             f"<body data-url=\"{self.url}\"></body></html>")
+        if "document.title" in function:
+            return self.page["title"]
+        return None
+
+    def evaluate_challenge(self, function: str) -> Any:
+        """What scripts see on a Cloudflare interstitial that never clears"""
+        if "readyProbe" in function:
+            # Only a selector that includes the challenge's own element is satisfied
+            return "cf-browser-verification" in function and "Checking your browser" not in function
+        marker = re.search(r'pageExtract:(\w+)', function)
+        if marker:
+            return extraction(marker.group(1), self.url, CHALLENGE_TITLE, {}, cloudflare=True)
+        if "isBlocked" in function:
+            return {"isBlocked": True, "message": "Need to solve Cloudflare challenge"}
+        if "cloudflareIndicators" in function:
+            return {"isCloudflare": True, "message": "Cloudflare protection detected"}
+        if "document.title" in function:
+            return CHALLENGE_TITLE
+        return None
+
+    def call(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """tools/call result for a browser tool"""
+        error = self.failures.before_call()
+        if error:
+            return {"content": [{"type": "text", "text": f"### Error\n{error}"}], "isError": True}
+        if name == "browser_navigate":
+            text = self.navigate(arguments.get("url", ""))
+        elif name == "browser_evaluate":
+            value = self.evaluate(arguments.get("function", ""))
+            text = f"### Result\n```json\n{json.dumps(value)}\n```"
+        elif name in ("browser_click", "browser_take_screenshot"):
+            text = f"### Result\n{name} on {self.url}"
+        else:
+            return {"content": [{"type": "text", "text": f"Tool \"{name}\" not found"}], "isError": True}
+        return {"content": [{"type": "text", "text": text}]}
+
+def mock_command(applicants: int = 100, latency: float = NAVIGATE_LATENCY,
+                 ready_delay: float = READY_DELAY, *options: str) -> List[str]:
+    """Command line that starts this server with a synthetic brief; options are extra flags such as --fail-rate"""
+    return [sys.executable, __file__, "--synthetic", str(applicants), "--latency", str(latency),
+            "--ready-delay", str(ready_delay), *options]
+
+def serve(browser: MockBrowser):
+    """Answer JSON-RPC requests on stdin until it closes"""
+    for line in sys.stdin:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if "id" not in message:
+            continue      # notifications
+        method = message.get("method")
+        params = message.get("params") or {}
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+        if method == "initialize":
+            response["result"] = {"protocolVersion": params.get("protocolVersion"), "capabilities": {"tools": {}},
+                                  "serverInfo": {"name": "mock-mcp-browser", "version": "1.0"}}
+        elif method == "tools/list":
+            response["result"] = {"tools": [{"name": name, "inputSchema": {"type": "object"}} for name in TOOLS]}
+        elif method == "tools/call":
+            response["result"] = browser.call(params.get("name", ""), params.get("arguments") or {})
+        elif method == "ping":
+            response["result"] = {}
+        else:
+            response["error"] = {"code": -32601, "message": f"Method not found: {method}"}
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+class Recorder:
+    """Proxies a session to the real gateway and saves what its pages answered as fixtures"""
+
+    def __init__(self, path: str, command: List[str]):
+        self.path = path
+        self.fixtures: Dict[str, Dict[str, Any]] = load_fixtures(path) if os.path.exists(path) else {}
+        self.upstream = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
+        self.pending: Dict[Any, Dict[str, Any]] = {}
+        self.url = "about:blank"
+        self.lock = threading.Lock()
+
+    def record(self, call: Dict[str, Any], result: Dict[str, Any]):
+        """Add a navigation's title or an evaluation's result to the current page's fixture"""
+        name = call.get("name", "")
+        arguments = call.get("arguments") or {}
+        if result.get("isError"):
+            return
+        if name.endswith("browser_navigate"):
+            self.url = arguments.get("url", self.url)
+            title = PAGE_TITLE_LINE.search("\n".join(item.get("text", "") for item in result.get("content", [])))
+            page = self.fixtures.setdefault(self.url, {"title": "", "rules": []})
+            page["title"] = title.group(1).strip() if title else page["title"]
+        elif name.endswith("browser_evaluate"):
+            key = script_hash(arguments.get("function", ""))
+            page = self.fixtures.setdefault(self.url, {"title": "", "rules": []})
+            page["rules"] = [rule for rule in page["rules"] if rule.get("script") != key]
+            page["rules"].append({"script": key, "result": parse_tool_result(result)})
+        else:
+            return
+        with open(self.path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(self.fixtures, f, indent=1, ensure_ascii=False)
+        os.replace(self.path + ".tmp", self.path)
+
+    def _pump_responses(self):
+        for line in self.upstream.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                message = {}
+            with self.lock:
+                call = self.pending.pop(message.get("id"), None)
+            if call is not None and "result" in message:
+                self.record(call, message["result"])
+            sys.stdout.write(line)
+            sys.stdout.flush()
+
+    def run(self):
+        """Forward stdin to the gateway and its answers back, recording tool calls on the way"""
+        reader = threading.Thread(target=self._pump_responses, daemon=True)
+        reader.start()
+        for line in sys.stdin:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                message = {}
+            if message.get("method") == "tools/call" and "id" in message:
+                with self.lock:
+                    self.pending[message["id"]] = message.get("params") or {}
+            self.upstream.stdin.write(line)
+            self.upstream.stdin.flush()
+        self.upstream.stdin.close()
+        reader.join()
+        self.upstream.wait()
+
+def _option(name: str, default: Optional[str] = None) -> Optional[str]:
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+def main():
+    """Serve fixtures over stdio (--synthetic N | --fixtures FILE | --html-dir DIR), or --record FILE [--upstream CMD]"""
+    if "--record" in sys.argv:
+        upstream = _option("--upstream")
+        Recorder(_option("--record"), shlex.split(upstream) if upstream else gateway_command()).run()
+        return
+    fixtures: Dict[str, Dict[str, Any]] = {}
+    if "--synthetic" in sys.argv:
+        fixtures.update(synthetic_fixtures(int(_option("--synthetic"))))
+    if "--html-dir" in sys.argv:
+        fixtures.update(load_saved_pages(_option("--html-dir")))
+    if "--fixtures" in sys.argv:
+        fixtures.update(load_fixtures(_option("--fixtures")))
+    failures = FailureInjector(
+        fail_rate=float(_option("--fail-rate", "0")),
+        slow_rate=float(_option("--slow-rate", "0")),
+        slow=float(_option("--slow", "5")),
+        crash_rate=float(_option("--crash-rate", "0")),
+        block_rate=float(_option("--block-rate", "0")),
+        seed=int(_option("--seed")) if "--seed" in sys.argv else None
+    )
+    serve(MockBrowser(fixtures, float(_option("--latency", str(NAVIGATE_LATENCY))),
+                      float(_option("--eval-latency", str(EVALUATE_LATENCY))),
+                      float(_option("--ready-delay", str(READY_DELAY))), failures))
+
+if __name__ == "__main__":
+    main()
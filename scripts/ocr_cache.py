@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+OCR Cache
+Persistent OCR results keyed by image content, plus a manifest of seen files.
+
+ocr_results holds the OCR output (per-card text, confidence and word boxes)
+and the parsed candidates, keyed by the SHA-256 of the image bytes together
+with the preprocessing signature and the scroll-overlap crop (skip_above),
+so a copied or renamed screenshot reuses its OCR result while changed
+preprocessing forces a fresh pass, and a capture OCR'd only below its
+overlap never stands in for the whole image. seen_files
+records each path's mtime and size at processing time, so an unchanged file
+is skipped with a single stat() before its bytes are even read.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+DEFAULT_CACHE_PATH = "output/processed_candidates/ocr_cache.db"
+HASH_CHUNK_SIZE = 1 << 20
+OCR_RESULT_COLUMNS = ("content_hash", "signature", "skip_above", "result", "candidates", "created_at")
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def file_stat(path: str) -> Tuple[int, int]:
+    """(mtime in nanoseconds, size) used to detect changed files"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+class OCRCache:
+    """SQLite-backed OCR result cache; writes are committed by the caller in batches"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, signature: str = ""):
+        self.db_path = db_path
+        self.signature = signature
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(ocr_results)")]
+        if columns and tuple(columns) != OCR_RESULT_COLUMNS:
+            # Results stored in an older layout cannot be read back; they are only a cache, so start over
+            self.conn.execute("DROP TABLE ocr_results")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS ocr_results (
+                content_hash TEXT,
+                signature TEXT,
+                skip_above INTEGER,
+                result TEXT,
+                candidates TEXT,
+                created_at TEXT,
+                PRIMARY KEY (content_hash, signature, skip_above)
+            );
+            CREATE TABLE IF NOT EXISTS seen_files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER,
+                size INTEGER,
+                content_hash TEXT,
+                signature TEXT,
+                seen_at TEXT
+            );
+        ''')
+        self.hits = 0
+        self.misses = 0
+
+    def is_unchanged(self, path: str) -> bool:
+        """True if the file was already processed with the current signature and has not changed since"""
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, signature FROM seen_files WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None or row[2] != self.signature:
+            return False
+        try:
+            return file_stat(path) == (row[0], row[1])
+        except OSError:
+            return False
+
+    def get(self, content_hash: str, skip_above: int = 0) -> Optional[Dict[str, Any]]:
+        """Cached OCR result and parsed candidates for an image (OCR'd below skip_above), or None"""
+        row = self.conn.execute(
+            "SELECT result, candidates FROM ocr_results WHERE content_hash = ? AND signature = ? AND skip_above = ?",
+            (content_hash, self.signature, skip_above)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {"result": json.loads(row[0]), "candidates": json.loads(row[1]) if row[1] else []}
+
+    def put(self, content_hash: str, ocr_result: Dict[str, Any], candidates: Optional[List[Dict[str, Any]]] = None,
+            skip_above: int = 0):
+        """Store an OCR result (of the image below skip_above) and the candidates parsed from it"""
+        self.conn.execute('''
+            INSERT OR REPLACE INTO ocr_results (content_hash, signature, skip_above, result, candidates, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            content_hash, self.signature, skip_above, json.dumps(ocr_result),
+            json.dumps(candidates or []), datetime.now().isoformat()
+        ))
+
+    def remember(self, path: str, content_hash: str, stat: Optional[Tuple[int, int]] = None):
+        """Record a processed file in the manifest so later scans can skip it"""
+        mtime_ns, size = stat or file_stat(path)
+        self.conn.execute('''
+            INSERT OR REPLACE INTO seen_files (path, mtime_ns, size, content_hash, signature, seen_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (path, mtime_ns, size, content_hash, self.signature, datetime.now().isoformat()))
+
+    def commit(self):
+        """Commit pending cache and manifest writes in one transaction"""
+        self.conn.commit()
+
+    def clear(self):
+        """Drop all cached results and the file manifest"""
+        self.conn.execute("DELETE FROM ocr_results")
+        self.conn.execute("DELETE FROM seen_files")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+def main():
+    """Print cache statistics; pass --clear to empty the cache"""
+    cache = OCRCache()
+    if "--clear" in sys.argv:
+        cache.clear()
+        print(f"🗑️ Cleared {cache.db_path}")
+
+    results = cache.conn.execute("SELECT COUNT(*) FROM ocr_results").fetchone()[0]
+    files = cache.conn.execute("SELECT COUNT(*) FROM seen_files").fetchone()[0]
+    print(f"📁 OCR cache: {cache.db_path}")
+    print(f"   • Cached OCR results: {results}")
+    print(f"   • Files in manifest: {files}")
+    cache.close()
+
+if __name__ == "__main__":
+    main()
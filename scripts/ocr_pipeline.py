@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+OCR Pipeline
+Threaded screenshot OCR for hosts where one process per OCR worker does not fit in memory.
+
+A process pool loads OpenCV and the Tesseract model once per worker process.
+OpenCV and Tesseract both release the GIL during the heavy calls, so
+threads in one process get most of the parallelism for a fraction of the
+memory:
+
+    decode thread --> preprocess threads --> OCR threads --> results
+          (cv2.imread)   (card detection,      (Tesseract, one
+                          binarization)         handle per thread)
+
+Stages are connected by bounded queues, so only a few decoded images are in
+flight at once however long the input list is. Results have the same shape
+as ocr_screenshot_worker's and arrive in completion order.
+"""
+
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+from screenshot_ocr import load_image, find_images, TESSEROCR_AVAILABLE
+from screenshot_layout import prepare_cards, ocr_prepared_cards
+
+QUEUE_SIZE = 4                # items waiting between stages, per downstream thread
+OCR_MODES = ("process", "thread")
+
+_DONE = object()
+
+class ThreadedOCRPipeline:
+    """Decode, preprocess and OCR screenshots on threads joined by bounded queues"""
+
+    def __init__(self, ocr_threads: int = 2, preprocess_threads: Optional[int] = None, queue_size: int = QUEUE_SIZE):
+        self.ocr_threads = max(1, ocr_threads)
+        self.preprocess_threads = max(1, preprocess_threads or (self.ocr_threads + 1) // 2)
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+
+    def _decode(self, paths: Iterable[str], skip_above: Dict[str, int], decoded: queue.Queue):
+        for image_path in paths:
+            start = time.perf_counter()
+            try:
+                image = load_image(image_path)
+                error = None if image is not None else "Could not load image"
+            except Exception as e:
+                image, error = None, str(e)
+            decoded.put((image_path, start, image, error, skip_above.get(image_path, 0)))
+        for _ in range(self.preprocess_threads):
+            decoded.put(_DONE)
+
+    def _preprocess(self, decoded: queue.Queue, prepared: queue.Queue, finished: List[int]):
+        while True:
+            item = decoded.get()
+            if item is _DONE:
+                break
+            image_path, start, image, error, skip = item
+            cards = None
+            if error is None:
+                try:
+                    cards = prepare_cards(image, skip)
+                except Exception as e:
+                    error = str(e)
+            prepared.put((image_path, start, cards, error))
+        # The last preprocess thread to finish tells every OCR thread to stop
+        with self._lock:
+            finished[0] += 1
+            last = finished[0] == self.preprocess_threads
+        if last:
+            for _ in range(self.ocr_threads):
+                prepared.put(_DONE)
+
+    def _ocr(self, prepared: queue.Queue, results: queue.Queue):
+        while True:
+            item = prepared.get()
+            if item is _DONE:
+                break
+            image_path, start, cards, error = item
+            if error is None:
+                try:
+                    result = ocr_prepared_cards(cards)
+                except Exception as e:
+                    error = str(e)
+            if error is not None:
+                result = {"cards": [], "confidence": 0.0, "error": error}
+            result["image_path"] = image_path
+            result["latency"] = time.perf_counter() - start
+            results.put(result)
+        results.put(_DONE)
+
+    def run(self, paths: Iterable[str], skip_above: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+        """OCR screenshots, yielding one result per path in completion order (skip_above as in prepare_cards)"""
+        decoded = queue.Queue(self.queue_size * self.preprocess_threads)
+        prepared = queue.Queue(self.queue_size * self.ocr_threads)
+        results = queue.Queue()
+        finished = [0]
+
+        threads = [threading.Thread(target=self._decode, args=(paths, skip_above or {}, decoded), daemon=True)]
+        threads += [threading.Thread(target=self._preprocess, args=(decoded, prepared, finished), daemon=True)
+                    for _ in range(self.preprocess_threads)]
+        threads += [threading.Thread(target=self._ocr, args=(prepared, results), daemon=True)
+                    for _ in range(self.ocr_threads)]
+        for thread in threads:
+            thread.start()
+
+        running = self.ocr_threads
+        while running:
+            result = results.get()
+            if result is _DONE:
+                running -= 1
+            else:
+                yield result
+        for thread in threads:
+            thread.join()
+
+def memory_usage() -> int:
+    """Bytes of memory held by this process and its children (PSS where the kernel reports it, else RSS)"""
+    total = 0
+    for pid in [os.getpid()] + [child.pid for child in multiprocessing.active_children()]:
+        for path, field in ((f"/proc/{pid}/smaps_rollup", "Pss:"), (f"/proc/{pid}/status", "VmRSS:")):
+            try:
+                with open(path) as f:
+                    line = next((l for l in f if l.startswith(field)), None)
+            except OSError:
+                continue
+            if line:
+                total += int(line.split()[1]) * 1024
+                break
+    return total
+
+class MemorySampler:
+    """Samples memory_usage() on a background thread and keeps the peak"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, memory_usage())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "MemorySampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, memory_usage())
+
+def run_benchmark(directory: str, workers: int = 4, limit: Optional[int] = None):
+    """Compare throughput and peak memory of the process pool and the threaded pipeline"""
+    from process_candidates_from_screenshots import ocr_screenshot_worker
+
+    images = find_images(directory)[:limit]
+    if not images:
+        print(f"❌ No screenshots found in {directory}")
+        return
+
+    engine = "tesserocr handles" if TESSEROCR_AVAILABLE else "tesseract subprocesses"
+    print(f"⏱️ OCR of {len(images)} screenshots with {workers} workers ({engine})...")
+    baseline = memory_usage()
+
+    with MemorySampler() as sampler:
+        start = time.perf_counter()
+        with multiprocessing.Pool(workers) as pool:
+            process_results = list(pool.imap_unordered(ocr_screenshot_worker, images))
+        process_time = time.perf_counter() - start
+    process_peak = sampler.peak
+
+    with MemorySampler() as sampler:
+        start = time.perf_counter()
+        thread_results = list(ThreadedOCRPipeline(workers).run(images))
+        thread_time = time.perf_counter() - start
+    thread_peak = sampler.peak
+
+    same = {r["image_path"]: [c["text"] for c in r["cards"]] for r in process_results} == \
+        {r["image_path"]: [c["text"] for c in r["cards"]] for r in thread_results}
+    mib = 1 / 1_048_576
+    print(f"   • Baseline memory:  {baseline * mib:,.0f} MiB")
+    print(f"   • Process pool:     {len(images) / process_time:.2f} images/s, peak {process_peak * mib:,.0f} MiB")
+    print(f"   • Thread pipeline:  {len(images) / thread_time:.2f} images/s, peak {thread_peak * mib:,.0f} MiB")
+    print(f"   • Identical text:   {'yes' if same else 'no'}")
+
+def main():
+    """Benchmark process vs thread OCR (--benchmark DIR [--workers N] [--limit N])"""
+    if "--benchmark" not in sys.argv:
+        print("Usage: python3 scripts/ocr_pipeline.py --benchmark <dir> [--workers N] [--limit N]")
+        return
+    index = sys.argv.index("--benchmark")
+    directory = sys.argv[index + 1] if len(sys.argv) > index + 1 else "."
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else 4
+    limit = int(sys.argv[sys.argv.index("--limit") + 1]) if "--limit" in sys.argv else None
+    run_benchmark(directory, workers, limit)
+
+if __name__ == "__main__":
+    main()
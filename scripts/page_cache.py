@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Page Cache
+Local cache of scraped pages: extraction results and HTML snapshots, keyed by URL and script.
+
+An entry is addressed by the URL together with the SHA-256 of the extraction
+script, so editing a script invalidates exactly the results it produced. Its
+value is stored once per content hash (zlib-compressed JSON), so pages that
+extract to the same record, or an HTML snapshot saved twice, share a blob.
+Entries are fresh for a TTL chosen by the caller (profiles change slowly,
+job listings quickly); a stale entry is simply a miss and gets overwritten.
+When the blobs outgrow max_bytes, the least recently used entries are
+dropped until the cache is back under 90% of the limit.
+
+A re-run within the TTL replays its pages from this file without touching
+the browser.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import zlib
+from typing import Dict, Any, Optional
+
+DEFAULT_PAGE_CACHE_PATH = "../output/cache/page_cache.db"
+PROFILE_TTL = 7 * 24 * 3600    # seconds a freelancer profile extraction stays fresh
+LISTING_TTL = 3600             # seconds a job search listing stays fresh
+MAX_CACHE_BYTES = 256 * 1024 * 1024   # compressed bytes kept before LRU eviction
+EVICT_TO = 0.9                 # eviction stops at this share of max_bytes
+
+# Snapshot script whose result is cached as the page's HTML
+PAGE_HTML_JS = "() => document.documentElement.outerHTML"
+
+MISS = object()
+
+def script_hash(script: str) -> str:
+    return hashlib.sha256(script.encode("utf-8")).hexdigest()
+
+class PageCache:
+    """SQLite-backed, content-addressed cache of page extraction results"""
+
+    def __init__(self, db_path: str = DEFAULT_PAGE_CACHE_PATH, max_bytes: int = MAX_CACHE_BYTES,
+                 refresh: bool = False):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.refresh = refresh     # skip reads (every lookup misses) but still store fresh results
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT,
+                script_hash TEXT,
+                content_hash TEXT,
+                created_at REAL,
+                accessed_at REAL,
+                PRIMARY KEY (url, script_hash)
+            );
+            CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+            CREATE INDEX IF NOT EXISTS entries_content ON entries (content_hash);
+            CREATE TABLE IF NOT EXISTS blobs (
+                content_hash TEXT PRIMARY KEY,
+                data BLOB,
+                size INTEGER
+            );
+        ''')
+        self.size = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str, script: str, ttl: float = PROFILE_TTL) -> Any:
+        """Cached result of running script on url, or MISS if there is none younger than ttl seconds"""
+        if self.refresh:
+            self.misses += 1
+            return MISS
+        key = (url, script_hash(script))
+        row = self.conn.execute('''
+            SELECT e.created_at, b.data FROM entries e JOIN blobs b ON b.content_hash = e.content_hash
+            WHERE e.url = ? AND e.script_hash = ?
+        ''', key).fetchone()
+        if row is None or time.time() - row[0] > ttl:
+            self.misses += 1
+            return MISS
+        self.hits += 1
+        # Recency for LRU; committed with the next put
+        self.conn.execute("UPDATE entries SET accessed_at = ? WHERE url = ? AND script_hash = ?", (time.time(),) + key)
+        return json.loads(zlib.decompress(row[1]))
+
+    def put(self, url: str, script: str, value: Any, html: Optional[str] = None):
+        """Store a script's result for url (and the page HTML, when given)"""
+        self._store(url, script, value)
+        if html:
+            self._store(url, PAGE_HTML_JS, html)
+        if self.size > self.max_bytes:
+            self.evict()
+        self.conn.commit()
+
+    def html(self, url: str, ttl: float = PROFILE_TTL) -> Optional[str]:
+        """Cached HTML snapshot of url, or None"""
+        value = self.get(url, PAGE_HTML_JS, ttl)
+        return None if value is MISS else value
+
+    def _store(self, url: str, script: str, value: Any):
+        data = json.dumps(value, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        if self.conn.execute("SELECT 1 FROM blobs WHERE content_hash = ?", (content_hash,)).fetchone() is None:
+            blob = zlib.compress(data)
+            self.conn.execute("INSERT INTO blobs (content_hash, data, size) VALUES (?, ?, ?)",
+                              (content_hash, blob, len(blob)))
+            self.size += len(blob)
+        now = time.time()
+        self.conn.execute('''
+            INSERT OR REPLACE INTO entries (url, script_hash, content_hash, created_at, accessed_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (url, script_hash(script), content_hash, now, now))
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the blobs fit in EVICT_TO of max_bytes"""
+        target = self.max_bytes * EVICT_TO
+        dropped = 0
+        rows = self.conn.execute("SELECT url, script_hash, content_hash FROM entries ORDER BY accessed_at").fetchall()
+        for url, key, content_hash in rows:
+            if self.size <= target:
+                break
+            self.conn.execute("DELETE FROM entries WHERE url = ? AND script_hash = ?", (url, key))
+            dropped += 1
+            # A blob goes once no remaining entry points at it
+            if self.conn.execute("SELECT 1 FROM entries WHERE content_hash = ? LIMIT 1", (content_hash,)).fetchone():
+                continue
+            size = self.conn.execute("SELECT size FROM blobs WHERE content_hash = ?", (content_hash,)).fetchone()
+            self.conn.execute("DELETE FROM blobs WHERE content_hash = ?", (content_hash,))
+            self.size -= size[0] if size else 0
+        return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        blobs = self.conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        return {"entries": entries, "blobs": blobs, "bytes": self.size, "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        """Drop every cached page"""
+        self.conn.execute("DELETE FROM entries")
+        self.conn.execute("DELETE FROM blobs")
+        self.conn.commit()
+        self.size = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+def main():
+    """Show cache size (--db PATH), or --clear it"""
+    db_path = sys.argv[sys.argv.index("--db") + 1] if "--db" in sys.argv else DEFAULT_PAGE_CACHE_PATH
+    cache = PageCache(db_path)
+    if "--clear" in sys.argv:
+        cache.clear()
+        print(f"🗑️ Cleared page cache at {db_path}")
+    stats = cache.stats()
+    print(f"💾 {db_path}: {stats['entries']} entries, {stats['blobs']} blobs, "
+          f"{stats['bytes'] / 1_048_576:.1f} MiB of {cache.max_bytes / 1_048_576:.0f} MiB")
+    cache.close()
+
+if __name__ == "__main__":
+    main()
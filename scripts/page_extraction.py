@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Page Extraction
+One JavaScript payload per page that waits for it, reads it and reports its pagination in a single result.
+
+Scraping a page used to take a navigation plus a round-trip for every
+question asked of it: readiness polls, login state, whether the applicants
+section is there, its links, whether there is a next page, the profile
+fields. The scripts here ask all of them in one browser_evaluate: they are
+async functions that poll for the page's ready selector in the page itself,
+then return
+
+    {schema, kind, url, title, ready, loggedIn, cloudflare, data}
+
+where data holds the page kind's fields (a brief page's applicants section,
+absolute profile links and pagination; a profile's fields). Loading a page
+is therefore one navigate plus one evaluate. The result carries
+EXTRACTION_SCHEMA, bumped whenever its shape changes, so a consumer (or a
+recorded fixture) from an older version is rejected rather than misread.
+"""
+
+import json
+from typing import Dict, Any, Optional
+
+from mcp_browser_client import CLOUDFLARE_CLEARED, READY_TIMEOUT
+
+EXTRACTION_SCHEMA = 1          # version of the result shape below; bump on any change to it
+
+# Ready selectors: the in-page wait ends once one of these is on the page
+APPLICANTS_READY = ('a[href*="/freelancers/"], a[href*="proposals"], [data-test="proposals"], .proposals, '
+                    '[data-test="applications"], [data-test="candidates"]')
+PROFILE_READY = 'h1, [data-test="freelancer-name"], .freelancer-name, .profile-name'
+
+# Shared helpers: in-page readiness wait, first non-empty text, session state
+_PRELUDE = """
+    const waitFor = async (selector, timeout) => {
+        const start = performance.now();
+        let delay = 50;
+        while (document.readyState === 'loading' || (selector && !document.querySelector(selector))) {
+            if (performance.now() - start >= timeout) return false;
+            await new Promise(resolve => setTimeout(resolve, delay));
+            delay = Math.min(delay * 2, 1000);
+        }
+        return true;
+    };
+    const firstText = (selectors) => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element && element.textContent.trim()) return element.textContent.trim();
+        }
+        return '';
+    };
+    const absolute = (href) => {
+        try {
+            const url = new URL(href, window.location.href);
+            url.hash = '';
+            return url.href;
+        } catch (e) {
+            return null;
+        }
+    };
+    const ready = await waitFor(READY_SELECTOR, READY_TIMEOUT_MS);
+    const loggedIn = !!document.querySelector('a[href*="logout"], a[href*="signout"], .logout, .signout, '
+                                              + '[data-test="logout"], [data-test="signout"]')
+        && !document.querySelector('a[href*="login"], a[href*="signin"], .login, .signin, '
+                                   + '[data-test="login"], [data-test="signin"]');
+    const cloudflare = !((CLOUDFLARE_CLEARED)());
+    const result = (data) => ({
+        schema: EXTRACTION_SCHEMA, kind: PAGE_KIND, url: window.location.href, title: document.title,
+        ready: ready, loggedIn: loggedIn, cloudflare: cloudflare, data: data
+    });
+"""
+
+_BRIEF_PAGE = """
+    const sectionSelectors = [
+        '[data-test="proposals"]', '.proposals', '[data-test="applications"]', '.applications',
+        '[data-test="candidates"]', '.candidates', '[data-test="freelancers"]', '.freelancers',
+        'a[href*="proposals"]', 'a[href*="applications"]', 'a[href*="candidates"]'
+    ];
+    const linkSelectors = [
+        'a[href*="/freelancers/"]', 'a[href*="/proposals/"]', 'a[href*="/applications/"]',
+        '[data-test="freelancer-link"]', '.freelancer-link', '.applicant-link', '.proposal-link'
+    ];
+    const mentionsProposals = (element) => {
+        const text = element.textContent.toLowerCase();
+        return text.includes('proposal') || text.includes('application') || text.includes('candidate');
+    };
+    const collectLinks = () => {
+        const links = [];
+        for (const selector of linkSelectors) {
+            document.querySelectorAll(selector).forEach(element => {
+                const href = element.getAttribute('href');
+                const url = href && absolute(href);
+                if (url && !links.includes(url)) links.push(url);
+            });
+        }
+        return links;
+    };
+
+    // First page: open the proposals list. A tab without a link is clicked here (an in-page
+    // switch, so the script can wait for the list); a link is reported for the caller to navigate
+    let proposalsUrl = null;
+    let links = collectLinks();
+    if (OPEN_PROPOSALS && !links.some(url => url.includes('/freelancers/'))) {
+        const candidates = [
+            ...document.querySelectorAll('[data-test="proposals-tab"], .proposals-tab, [role="tab"], .tab, .nav-link'),
+            ...document.querySelectorAll('a, button, [role="button"]')
+        ];
+        const opener = candidates.find(mentionsProposals)
+            || document.querySelector('a[href*="proposals"], a[href*="applications"], a[href*="candidates"]');
+        const href = opener && opener.getAttribute('href');
+        if (href && !href.startsWith('#') && !href.startsWith('javascript:')) {
+            proposalsUrl = absolute(href);
+        } else if (opener) {
+            opener.click();
+            await waitFor(READY_SELECTOR, READY_TIMEOUT_MS);
+            links = collectLinks();
+        }
+    }
+
+    let section = null;
+    for (const selector of sectionSelectors) {
+        if (document.querySelector(selector)) {
+            section = { selector: selector };
+            break;
+        }
+    }
+    if (!section) {
+        const heading = [...document.querySelectorAll('h1, h2, h3, h4, h5, h6, span, div')].find(mentionsProposals);
+        if (heading) section = { text: heading.textContent.trim().slice(0, 80) };
+    }
+
+    const pagination = { hasNext: false, currentPage: 1, maxPage: 1, selector: null };
+    const nextSelectors = [
+        'a[aria-label*="Next"]', 'a[aria-label*="next"]', 'button[aria-label*="Next"]', 'button[aria-label*="next"]',
+        '.next-page', '.pagination-next', '.next', '[data-test="next-page"]'
+    ];
+    for (const selector of nextSelectors) {
+        const element = document.querySelector(selector);
+        if (element && !element.disabled && !element.classList.contains('disabled')) {
+            pagination.hasNext = true;
+            pagination.selector = selector;
+            break;
+        }
+    }
+    document.querySelectorAll('.pagination a, .pagination button').forEach(element => {
+        const number = parseInt(element.textContent.trim());
+        if (isNaN(number)) return;
+        if (element.classList.contains('active') || element.classList.contains('current')) pagination.currentPage = number;
+        pagination.maxPage = Math.max(pagination.maxPage, number);
+    });
+    pagination.hasNext = pagination.hasNext || pagination.currentPage < pagination.maxPage;
+
+    return result({ section: section, links: links, proposalsUrl: proposalsUrl, pagination: pagination });
+"""
+
+_PROFILE_PAGE = """
+    const skills = [];
+    for (const selector of ['[data-test="skills"]', '.skills', '.skill-tags', '.tags']) {
+        document.querySelectorAll(selector + ' span, ' + selector + ' .tag').forEach(element => {
+            const skill = element.textContent.trim();
+            if (skill && !skills.includes(skill)) skills.push(skill);
+        });
+    }
+    const picture = document.querySelector('[data-test="profile-picture"] img, .profile-picture img, .avatar img');
+
+    return result({
+        name: firstText(['h1', '[data-test="freelancer-name"]', '.freelancer-name', '.profile-name']),
+        title: firstText(['h2', '[data-test="freelancer-title"]', '.freelancer-title', '.profile-title', '.headline']),
+        hourly_rate: firstText(['[data-test="hourly-rate"]', '.hourly-rate', '.rate', '.price']),
+        total_earned: firstText(['[data-test="total-earned"]', '.total-earned', '.earnings']),
+        location: firstText(['[data-test="location"]', '.location', '.country', '.city']),
+        skills: skills,
+        description: firstText(['[data-test="description"]', '.description', '.bio', '.overview']),
+        experience: '',
+        education: '',
+        portfolio_links: [],
+        certifications: [],
+        languages: [],
+        availability: '',
+        response_time: '',
+        completion_rate: '',
+        rating: firstText(['[data-test="rating"]', '.rating', '.stars']),
+        reviews_count: '',
+        member_since: firstText(['[data-test="member-since"]', '.member-since', '.joined']),
+        profile_picture: picture && picture.src ? picture.src : '',
+        verified: false
+    });
+"""
+
+def _script(kind: str, ready_selector: str, body: str, timeout: float, **options: bool) -> str:
+    """Wrap a page kind's body in the shared prelude, with its constants filled in"""
+    constants = {
+        "READY_SELECTOR": json.dumps(ready_selector),
+        "READY_TIMEOUT_MS": str(int(timeout * 1000)),
+        "CLOUDFLARE_CLEARED": CLOUDFLARE_CLEARED,
+        "EXTRACTION_SCHEMA": str(EXTRACTION_SCHEMA),
+        "PAGE_KIND": json.dumps(kind),
+    }
+    constants.update({name: "true" if value else "false" for name, value in options.items()})
+    source = _PRELUDE + body
+    for name, value in constants.items():
+        source = source.replace(name, value)
+    return f"async () => {{ /* pageExtract:{kind} */{source}}}"
+
+def brief_page_script(open_proposals: bool = False, timeout: float = READY_TIMEOUT) -> str:
+    """Script for a brief's proposals page; open_proposals switches to the proposals list first (page 1)"""
+    return _script("brief", APPLICANTS_READY, _BRIEF_PAGE, timeout, OPEN_PROPOSALS=open_proposals)
+
+def profile_page_script(timeout: float = READY_TIMEOUT) -> str:
+    """Script for a freelancer profile page"""
+    return _script("profile", PROFILE_READY, _PROFILE_PAGE, timeout)
+
+BRIEF_FIRST_PAGE_JS = brief_page_script(open_proposals=True)
+BRIEF_PAGE_JS = brief_page_script()
+PROFILE_PAGE_JS = profile_page_script()
+
+def page_result(result: Any, kind: str) -> Optional[Dict[str, Any]]:
+    """The extraction result if it is a current-schema result for this page kind, else None (with the reason printed)"""
+    if not isinstance(result, dict) or "schema" not in result:
+        print(f"❌ No {kind} extraction result: {str(result)[:120]}")
+        return None
+    if result["schema"] != EXTRACTION_SCHEMA:
+        print(f"❌ {kind} extraction schema {result['schema']}, expected {EXTRACTION_SCHEMA}")
+        return None
+    if result.get("kind") != kind:
+        print(f"❌ Expected a {kind} extraction, got {result.get('kind')}")
+        return None
+    if not result.get("ready"):
+        print(f"⚠️ {result.get('url', kind)} was not ready in time, extracted what had loaded")
+    if result.get("cloudflare"):
+        print("⚠️ Cloudflare challenge is showing on the page")
+    return result
@@ -9,6 +9,10 @@ import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from applicant_database_manager import ApplicantDatabaseManager
+from record_stream import DEFAULT_STREAM_PATH, follow_records, load_offset, save_offset
+
+# Record stream kinds that are people; job listings in the stream are not applicants
+STREAM_KINDS = ("applicant", "freelancer")
 
 class AllApplicantsProcessor:
     """Process all applicants from various sources into the database"""
@@ -215,6 +219,35 @@ class AllApplicantsProcessor:
         print(f"✅ Processed {processed} applicants from {filepath}")
         return processed
     
+    def ingest_stream(self, path: str = DEFAULT_STREAM_PATH, follow: bool = False) -> int:
+        """Add applicants from a scraper record stream, from where the last ingest stopped; follow waits for more"""
+        offset = load_offset(path)
+        print(f"\n📜 Ingesting {path} from offset {offset}{' (following, Ctrl+C to stop)' if follow else ''}")
+        
+        processed = 0
+        try:
+            for entry, offset in follow_records(path, offset, follow=follow):
+                if entry.get("kind") in STREAM_KINDS:
+                    try:
+                        # The brief or skill name stands in for the file name when guessing the job title
+                        applicant = self.normalize_applicant_data(entry.get("record") or {}, entry.get("group", ""))
+                        if applicant:
+                            self.db_manager.add_applicant(applicant)
+                            processed += 1
+                            self.processed_count += 1
+                        else:
+                            self.skipped_count += 1
+                    except Exception as e:
+                        self.errors.append(f"Error processing stream record at {offset} in {path}: {str(e)}")
+                        self.skipped_count += 1
+                # Checkpoint per record, so a restarted ingest resumes at the next one
+                save_offset(offset, path)
+        except KeyboardInterrupt:
+            print("\n🛑 Stopped following the stream")
+        
+        print(f"✅ Processed {processed} applicants from {path}")
+        return processed
+    
     def process_all_sources(self):
         """Process all available applicant sources"""
         print("\n🚀 Starting comprehensive applicant processing...")
@@ -489,8 +522,14 @@ class AllApplicantsProcessor:
         print(f"   4. Schedule interviews with top candidates")
 
 def main():
-    """Main function"""
+    """Main function (--stream [PATH] ingests the scrapers' record stream, --follow keeps tailing it)"""
     processor = AllApplicantsProcessor()
+    if "--stream" in sys.argv:
+        index = sys.argv.index("--stream")
+        path = sys.argv[index + 1] if len(sys.argv) > index + 1 and not sys.argv[index + 1].startswith("--") else DEFAULT_STREAM_PATH
+        processor.ingest_stream(path, follow="--follow" in sys.argv)
+        print(f"💾 Total in Database: {processor.db_manager.get_statistics()['total_applicants']}")
+        return
     processor.run()
 
 if __name__ == "__main__":
@@ -8,10 +8,9 @@ import json
 import sqlite3
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-import cv2
-import pytesseract
 from PIL import Image
 import numpy as np
 import re
@@ -19,6 +18,46 @@ from typing import Dict, List, Any, Optional
 import requests
 from urllib.parse import urlparse
 import hashlib
+from multiprocessing import Pool
+
+import screenshot_ocr
+from screenshot_layout import extract_cards_from_image
+from ocr_cache import OCRCache, file_hash, file_stat
+from skill_matcher import find_skills
+from processing_log import ProcessingLogger, print_stage_summary
+from ocr_pipeline import ThreadedOCRPipeline, OCR_MODES
+from screenshot_dedup import ScreenshotIndex
+
+CANDIDATE_COLUMNS = [
+    "id", "name", "title", "location", "hourly_rate", "job_success", "total_earned",
+    "hours_worked", "jobs_completed", "skills", "overview", "proposal_text",
+    "job_title", "profile_url", "status", "rating", "applied_date", "notes",
+    "profile_image", "screenshot_source", "portfolio_links", "work_samples",
+    "processed_at", "extracted_from_screenshot", "ocr_confidence"
+]
+JSON_COLUMNS = ("skills", "portfolio_links", "work_samples")
+SCREENSHOT_EXTENSIONS = screenshot_ocr.SCREENSHOT_EXTENSIONS
+SKIP_DIRS = {'node_modules', '.git', '__pycache__', '.next', 'venv', '.venv'}
+
+def ocr_screenshot_worker(image_path: str, skip_above: int = 0) -> Dict[str, Any]:
+    """Detect applicant cards in one screenshot and OCR each; runs in a worker process"""
+    start = time.perf_counter()
+    result = extract_cards_from_image(image_path, skip_above)
+    result["image_path"] = image_path
+    result["latency"] = time.perf_counter() - start
+    return result
+
+def ocr_screenshot_job(job: tuple) -> Dict[str, Any]:
+    """ocr_screenshot_worker for an (image_path, skip_above) tuple, as Pool.imap passes one argument"""
+    return ocr_screenshot_worker(*job)
+
+def capture_order(image_path: str) -> tuple:
+    """Sort key grouping screenshots by folder, oldest capture first"""
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return (os.path.dirname(image_path), mtime_ns, image_path)
 
 class CandidateProcessor:
     def __init__(self, workspace_path: str = "."):
@@ -30,9 +69,12 @@ class CandidateProcessor:
         # Database setup
         self.db_path = self.output_dir / "applicants" / "applicants.db"
         self.setup_database()
+        self.logger = ProcessingLogger(self.db_path)
         
         # Timestamp for processing
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.ocr_cache = None
+        self.screenshot_index = None
         
     def setup_database(self):
         """Setup SQLite database for storing processed candidate data."""
@@ -70,70 +112,23 @@ class CandidateProcessor:
             )
         ''')
         
-        # Create processing_log table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS processing_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                action TEXT,
-                details TEXT,
-                success BOOLEAN
-            )
-        ''')
-        
         conn.commit()
         conn.close()
         
-    def log_processing(self, action: str, details: str, success: bool = True):
-        """Log processing actions to database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO processing_log (timestamp, action, details, success)
-            VALUES (?, ?, ?, ?)
-        ''', (datetime.now().isoformat(), action, details, success))
-        conn.commit()
-        conn.close()
+    def log_processing(self, action: str, details: str, success: bool = True, stage: Optional[str] = None,
+                       duration: Optional[float] = None, **data):
+        """Buffer a processing event; the logger writes events to the database in batches."""
+        self.logger.log(action, details, success, stage, duration, **data)
         
     def extract_text_from_image(self, image_path: str) -> Dict[str, Any]:
-        """Extract text from screenshot using OCR."""
-        try:
-            # Load image
-            image = cv2.imread(image_path)
-            if image is None:
-                return {"text": "", "confidence": 0.0, "error": "Could not load image"}
-            
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Apply preprocessing
-            # Remove noise
-            denoised = cv2.fastNlMeansDenoising(gray)
-            
-            # Apply threshold
-            _, thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
-            # Extract text using pytesseract
-            text = pytesseract.image_to_string(thresh)
-            
-            # Get confidence data
-            data = pytesseract.image_to_data(thresh, output_type=pytesseract.Output.DICT)
-            confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-            
-            return {
-                "text": text,
-                "confidence": avg_confidence,
-                "error": None
-            }
-            
-        except Exception as e:
-            return {"text": "", "confidence": 0.0, "error": str(e)}
+        """Extract text, confidence and word boxes from a screenshot with a single OCR pass."""
+        return screenshot_ocr.extract_text_from_image(image_path)
     
-    def parse_candidate_from_text(self, text: str, image_path: str) -> Dict[str, Any]:
-        """Parse candidate information from extracted text."""
+    def parse_candidate_from_text(self, text: str, image_path: str, card: Optional[int] = None) -> Dict[str, Any]:
+        """Parse candidate information from extracted text (of one card when the page has several)."""
+        source_key = image_path if card is None else f"{image_path}#card{card}"
         candidate = {
-            "id": f"extracted_{hashlib.md5(image_path.encode()).hexdigest()[:8]}",
+            "id": f"extracted_{hashlib.md5(source_key.encode()).hexdigest()[:8]}",
             "name": "",
             "title": "",
             "location": "",
@@ -213,74 +208,71 @@ class CandidateProcessor:
         if jobs_match:
             candidate["jobs_completed"] = jobs_match.group(0)
         
-        # Extract skills (common tech skills)
-        skills_patterns = [
-            r'\b(Shopify|React|Vue|Angular|JavaScript|TypeScript|HTML|CSS|Node\.js|Python|PHP|Java|C#|Ruby|Go|Rust|Swift|Kotlin|Flutter|React Native|WordPress|Drupal|Magento|WooCommerce|Figma|Adobe XD|Sketch|InVision|Zeplin|Webflow|Bubble|Airtable|Zapier|Shopify Liquid|GraphQL|REST API|MongoDB|PostgreSQL|MySQL|Firebase|AWS|Google Cloud|Azure|Docker|Kubernetes|Git|GitHub|GitLab|Bitbucket|Jira|Trello|Asana|Slack|Discord|Zoom|Teams|Figma|Canva|Photoshop|Illustrator|InDesign|Premiere Pro|After Effects|Blender|Unity|Unreal Engine|Maya|3ds Max|AutoCAD|SketchUp|Revit|SolidWorks|Fusion 360|Tinkercad|Arduino|Raspberry Pi|IoT|Machine Learning|AI|Data Science|Analytics|SEO|SEM|PPC|Google Ads|Facebook Ads|Instagram Ads|TikTok Ads|LinkedIn Ads|Email Marketing|SMS Marketing|Push Notifications|Chatbots|Voice Assistants|Blockchain|Cryptocurrency|NFT|Web3|DeFi|Smart Contracts|Ethereum|Bitcoin|Solana|Polygon|Arbitrum|Optimism|Layer 2|Rollups|Zero Knowledge|Privacy|Security|Penetration Testing|Ethical Hacking|Cybersecurity|Compliance|GDPR|CCPA|HIPAA|SOC 2|ISO 27001|PCI DSS|OWASP|NIST|MITRE|Threat Modeling|Risk Assessment|Vulnerability Assessment|Incident Response|Forensics|Malware Analysis|Reverse Engineering|Exploit Development|Bug Bounty|CTF|HackTheBox|TryHackMe|VulnHub|Metasploit|Burp Suite|Wireshark|Nmap|Nessus|Qualys|Rapid7|Tenable|CrowdStrike|SentinelOne|Carbon Black|Cylance|Bitdefender|Kaspersky|Norton|McAfee|Trend Micro|Sophos|ESET|Avast|AVG|Malwarebytes|Windows Defender|Firewall|IDS|IPS|SIEM|SOAR|EDR|XDR|MDR|SOC|NOC|ITIL|Agile|Scrum|Kanban|Lean|Six Sigma|DevOps|CI/CD|Jenkins|GitHub Actions|GitLab CI|CircleCI|Travis CI|TeamCity|Bamboo|Ansible|Chef|Puppet|Salt|Terraform|CloudFormation|Pulumi|Kubernetes|Docker|OpenShift|Rancher|Istio|Linkerd|Consul|Vault|Nomad|Mesos|Marathon|Swarm|Compose|Buildah|Podman|Skopeo|Kaniko|BuildKit|Dockerfile|docker-compose|Helm|Kustomize|Operator|CRD|Custom Resource|API Server|Controller|Reconciler|Admission Controller|Webhook|RBAC|Service Account|Secret|ConfigMap|PersistentVolume|StorageClass|Ingress|Service|Pod|Deployment|StatefulSet|DaemonSet|Job|CronJob|ReplicaSet|HorizontalPodAutoscaler|VerticalPodAutoscaler|PodDisruptionBudget|NetworkPolicy|PodSecurityPolicy|PodSecurityStandards|SecurityContext|ResourceQuota|LimitRange|PriorityClass|Taint|Toleration|NodeSelector|Affinity|Anti-affinity|TopologySpread|PodTopologySpread|PodAntiAffinity|PodAffinity|NodeAffinity|NodeAntiAffinity|TopologyKey|Label|Annotation|OwnerReference|Finalizer|Garbage Collection|Orphan|Cascade|Background|Foreground|Graceful|Force|Preemption|Eviction|OOM|CPU|Memory|Storage|Network|GPU|TPU|FPGA|ASIC|Custom Hardware|Edge Computing|Fog Computing|Cloud Computing|Hybrid Cloud|Multi Cloud|Private Cloud|Public Cloud|Community Cloud|Infrastructure as Code|Platform as a Service|Software as a Service|Function as a Service|Container as a Service|Backend as a Service|Database as a Service|Storage as a Service|Network as a Service|Security as a Service|Monitoring as a Service|Logging as a Service|Analytics as a Service|AI as a Service|ML as a Service|Data as a Service|API as a Service|Integration as a Service|Process as a Service|Business Process as a Service|Workflow as a Service|Orchestration as a Service|Scheduling as a Service|Load Balancing as a Service|Caching as a Service|CDN|Content Delivery Network|Edge Network|Global Load Balancer|Regional Load Balancer|Local Load Balancer|Application Load Balancer|Network Load Balancer|Gateway Load Balancer|Classic Load Balancer|Target Group|Listener|Rule|Action|Condition|Health Check|Auto Scaling|Scaling Policy|Cooldown|Warm-up|Scale-in|Scale-out|Horizontal Scaling|Vertical Scaling|Elastic Scaling|Predictive Scaling|Scheduled Scaling|Step Scaling|Target Tracking|Custom Metric|CloudWatch|Monitoring|Logging|Tracing|Distributed Tracing|OpenTelemetry|Jaeger|Zipkin|Prometheus|Grafana|Kibana|Elasticsearch|Logstash|Beats|Fluentd|Fluent Bit|Vector|Telegraf|InfluxDB|TimescaleDB|VictoriaMetrics|Thanos|Cortex|Mimir|Loki|Tempo|Jaeger|Zipkin|X-Ray|Datadog|New Relic|AppDynamics|Dynatrace|Splunk|Sumo Logic|Loggly|Papertrail|Sentry|Bugsnag|Rollbar|Airbrake|Honeybadger|Raygun|Crashlytics|Firebase Crashlytics|Microsoft App Center|HockeyApp|TestFlight|Google Play Console|App Store Connect|CodePush|Expo|React Native|Flutter|Ionic|Cordova|PhoneGap|Xamarin|Unity|Unreal Engine|Godot|LÖVE|MonoGame|LibGDX|Cocos2d|SpriteKit|SceneKit|Metal|Vulkan|OpenGL|DirectX|WebGL|Canvas|SVG|WebAssembly|Web Workers|Service Workers|Progressive Web App|Single Page Application|Multi Page Application|Server Side Rendering|Static Site Generation|Incremental Static Regeneration|Client Side Rendering|Hydration|Streaming|Suspense|Concurrent Features|Fiber|Reconciliation|Virtual DOM|Shadow DOM|Web Components|Custom Elements|Shadow Root|Slot|Template|HTML Templates|CSS-in-JS|Styled Components|Emotion|Styled JSX|CSS Modules|PostCSS|Sass|Less|Stylus|Tailwind CSS|Bootstrap|Foundation|Bulma|Semantic UI|Material-UI|Ant Design|Chakra UI|Mantine|NextUI|Radix UI|Headless UI|Reach UI|Ariakit|React Aria|React Hook Form|Formik|React Final Form|React Query|SWR|Apollo Client|Relay|Redux|MobX|Zustand|Jotai|Recoil|Valtio|XState|React Router|Next.js Router|Gatsby Router|Remix Router|TanStack Router|React Navigation|React Native Router|Flutter Router|Ionic Router|Vue Router|Angular Router|Svelte Router|Solid Router|Qwik Router|Astro Router|Nuxt Router|Gatsby|Next.js|Remix|SvelteKit|SolidStart|Qwik|Astro|Nuxt|Vite|Webpack|Rollup|Parcel|esbuild|SWC|Babel|TypeScript|Flow|PropTypes|ESLint|Prettier|Husky|lint-staged|Commitizen|Conventional Commits|Semantic Release|Release It|Changesets|Lerna|Nx|Turborepo|Yarn Workspaces|npm Workspaces|pnpm Workspaces|Monorepo|Microservices|Micro Frontends|Module Federation|Webpack Module Federation|Vite Module Federation|Rollup Module Federation|esbuild Module Federation|SWC Module Federation|Babel Module Federation|TypeScript Module Federation|Flow Module Federation|PropTypes Module Federation|ESLint Module Federation|Prettier Module Federation|Husky Module Federation|lint-staged Module Federation|Commitizen Module Federation|Conventional Commits Module Federation|Semantic Release Module Federation|Release It Module Federation|Changesets Module Federation|Lerna Module Federation|Nx Module Federation|Turborepo Module Federation|Yarn Workspaces Module Federation|npm Workspaces Module Federation|pnpm Workspaces Module Federation|Monorepo Module Federation|Microservices Module Federation|Micro Frontends Module Federation|Module Federation Module Federation|Webpack Module Federation Module Federation|Vite Module Federation Module Federation|Rollup Module Federation Module Federation|esbuild Module Federation Module Federation|SWC Module Federation Module Federation|Babel Module Federation Module Federation|TypeScript Module Federation Module Federation|Flow Module Federation Module Federation|PropTypes Module Federation Module Federation|ESLint Module Federation Module Federation|Prettier Module Federation Module Federation|Husky Module Federation Module Federation|lint-staged Module Federation Module Federation|Commitizen Module Federation Module Federation|Conventional Commits Module Federation Module Federation|Semantic Release Module Federation Module Federation|Release It Module Federation Module Federation|Changesets Module Federation Module Federation|Lerna Module Federation Module Federation|Nx Module Federation Module Federation|Turborepo Module Federation Module Federation|Yarn Workspaces Module Federation Module Federation|npm Workspaces Module Federation Module Federation|pnpm Workspaces Module Federation Module Federation|Monorepo Module Federation Module Federation|Microservices Module Federation Module Federation|Micro Frontends Module Federation Module Federation|Module Federation Module Federation Module Federation)\b'
-        ]
-        
-        for pattern in skills_patterns:
-            skills = re.findall(pattern, text, re.IGNORECASE)
-            candidate["skills"].extend(skills)
-        
-        # Remove duplicates and clean up
-        candidate["skills"] = list(set([skill.strip() for skill in candidate["skills"] if skill.strip()]))
+        # Extract skills against the curated vocabulary, folded onto canonical names
+        candidate["skills"] = find_skills(text)
         
         return candidate
     
-    def process_screenshot_file(self, image_path: str) -> Dict[str, Any]:
-        """Process a single screenshot file and extract candidate information."""
+    def candidates_from_ocr(self, ocr_result: Dict[str, Any], image_path: str) -> List[Dict[str, Any]]:
+        """Parse one candidate per OCR'd applicant card."""
+        cards = ocr_result["cards"]
+        candidates = []
+        for i, card in enumerate(cards):
+            # A single card keeps the per-screenshot id used before card detection
+            candidate = self.parse_candidate_from_text(card["text"], image_path, i if len(cards) > 1 else None)
+            candidate["ocr_confidence"] = card["confidence"]
+            candidates.append(candidate)
+        return candidates
+    
+    def process_screenshot_file(self, image_path: str) -> List[Dict[str, Any]]:
+        """Process a single screenshot file and extract one candidate per applicant card."""
+        start = time.perf_counter()
         try:
-            # Extract text from image
-            ocr_result = self.extract_text_from_image(image_path)
+            # Detect applicant cards and OCR each of them
+            ocr_result = ocr_screenshot_worker(image_path)
             
             if ocr_result["error"]:
-                self.log_processing("ocr_error", f"Failed to extract text from {image_path}: {ocr_result['error']}", False)
-                return None
+                self.log_processing("ocr_error", f"Failed to extract text from {image_path}: {ocr_result['error']}", False,
+                                    "ocr", ocr_result["latency"])
+                return []
+            self.log_processing("ocr", image_path, True, "ocr", ocr_result["latency"], cards=len(ocr_result["cards"]))
             
-            # Parse candidate information from text
-            candidate = self.parse_candidate_from_text(ocr_result["text"], image_path)
-            candidate["ocr_confidence"] = ocr_result["confidence"]
+            # Parse candidate information from each card
+            with self.logger.timed("parse", details=image_path):
+                candidates = self.candidates_from_ocr(ocr_result, image_path)
             
             # Save to database
-            self.save_candidate_to_db(candidate)
+            with self.logger.timed("db_write", details=image_path, candidates=len(candidates)):
+                self.save_candidates_batch(candidates)
             
-            self.log_processing("screenshot_processed", f"Successfully processed {image_path}")
-            return candidate
+            self.log_processing("screenshot_processed", f"Successfully processed {image_path} ({len(candidates)} cards)",
+                                True, "screenshot", time.perf_counter() - start)
+            return candidates
             
         except Exception as e:
             self.log_processing("screenshot_error", f"Error processing {image_path}: {str(e)}", False)
-            return None
+            return []
     
     def save_candidate_to_db(self, candidate: Dict[str, Any]):
         """Save candidate data to SQLite database."""
+        self.save_candidates_batch([candidate])
+    
+    def save_candidates_batch(self, candidates: List[Dict[str, Any]]):
+        """Save many candidates with one connection and a single transaction."""
+        rows = []
+        for candidate in candidates:
+            # Convert lists to JSON strings
+            rows.append(tuple(
+                json.dumps(candidate.get(column, [])) if column in JSON_COLUMNS else candidate[column]
+                for column in CANDIDATE_COLUMNS
+            ))
+        
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        
-        # Convert lists to JSON strings
-        skills_json = json.dumps(candidate.get("skills", []))
-        portfolio_links_json = json.dumps(candidate.get("portfolio_links", []))
-        work_samples_json = json.dumps(candidate.get("work_samples", []))
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO candidates (
-                id, name, title, location, hourly_rate, job_success, total_earned,
-                hours_worked, jobs_completed, skills, overview, proposal_text,
-                job_title, profile_url, status, rating, applied_date, notes,
-                profile_image, screenshot_source, portfolio_links, work_samples,
-                processed_at, extracted_from_screenshot, ocr_confidence
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            candidate["id"], candidate["name"], candidate["title"], candidate["location"],
-            candidate["hourly_rate"], candidate["job_success"], candidate["total_earned"],
-            candidate["hours_worked"], candidate["jobs_completed"], skills_json,
-            candidate["overview"], candidate["proposal_text"], candidate["job_title"],
-            candidate["profile_url"], candidate["status"], candidate["rating"],
-            candidate["applied_date"], candidate["notes"], candidate["profile_image"],
-            candidate["screenshot_source"], portfolio_links_json, work_samples_json,
-            candidate["processed_at"], candidate["extracted_from_screenshot"],
-            candidate["ocr_confidence"]
-        ))
-        
+        cursor.executemany(f'''
+            INSERT OR REPLACE INTO candidates ({", ".join(CANDIDATE_COLUMNS)})
+            VALUES ({", ".join("?" for _ in CANDIDATE_COLUMNS)})
+        ''', rows)
         conn.commit()
         conn.close()
     
@@ -296,6 +288,7 @@ class CandidateProcessor:
         
         for json_file in json_files:
             if json_file.exists():
+                start = time.perf_counter()
                 try:
                     with open(json_file, 'r', encoding='utf-8') as f:
                         data = json.load(f)
@@ -318,43 +311,180 @@ class CandidateProcessor:
                             self.save_candidate_to_db(candidate)
                             processed_candidates.append(candidate)
                     
-                    self.log_processing("json_imported", f"Imported {len(candidates)} candidates from {json_file.name}")
+                    self.log_processing("json_imported", f"Imported {len(candidates)} candidates from {json_file.name}",
+                                        True, "json_import", time.perf_counter() - start, candidates=len(candidates))
                     
                 except Exception as e:
-                    self.log_processing("json_import_error", f"Error importing {json_file.name}: {str(e)}", False)
+                    self.log_processing("json_import_error", f"Error importing {json_file.name}: {str(e)}", False,
+                                        "json_import", time.perf_counter() - start)
         
         return processed_candidates
     
     def find_screenshot_files(self) -> List[str]:
         """Find all screenshot files in the workspace."""
-        screenshot_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff']
         screenshot_files = []
         
         for root, dirs, files in os.walk(self.workspace_path):
+            # Prune node_modules, .git and other system directories instead of walking into them
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
             for file in files:
-                if any(file.lower().endswith(ext) for ext in screenshot_extensions):
-                    # Skip files in node_modules, .git, and other system directories
-                    if any(skip_dir in root for skip_dir in ['node_modules', '.git', '__pycache__', '.next', 'venv', '.venv']):
-                        continue
+                if file.lower().endswith(SCREENSHOT_EXTENSIONS):
                     screenshot_files.append(os.path.join(root, file))
         
         return screenshot_files
     
-    def process_all_screenshots(self) -> List[Dict[str, Any]]:
-        """Process all screenshot files found in the workspace."""
+    def open_ocr_cache(self, use_cache: bool = True):
+        """Open the OCR cache for the current preprocessing signature (or disable it) and the duplicate index."""
+        if use_cache:
+            self.ocr_cache = OCRCache(str(self.processed_dir / "ocr_cache.db"), screenshot_ocr.preprocess_signature())
+        else:
+            self.ocr_cache = None
+        # Fingerprints persist next to the cache; without it duplicates are only caught within this run
+        self.screenshot_index = ScreenshotIndex(self.ocr_cache.conn if self.ocr_cache else None)
+    
+    def process_all_screenshots(self, workers: int = 1, batch_size: int = 25, use_cache: bool = True,
+                                ocr_mode: str = "process") -> List[Dict[str, Any]]:
+        """Process all screenshot files, OCRing in worker processes (or threads) and saving from this one."""
         screenshot_files = self.find_screenshot_files()
-        processed_candidates = []
-        
         print(f"Found {len(screenshot_files)} screenshot files")
+        self.open_ocr_cache(use_cache)
+        return self.process_screenshots(screenshot_files, workers, batch_size, ocr_mode=ocr_mode)
+    
+    def process_screenshots(self, screenshot_files: List[str], workers: int = 1, batch_size: int = 25,
+                            pool: Optional[Pool] = None, ocr_mode: str = "process") -> List[Dict[str, Any]]:
+        """Push screenshots through cache lookup, OCR (in processes or threads, see ocr_mode), parsing and the DB."""
+        processed_candidates = []
+        if self.screenshot_index is None:
+            self.screenshot_index = ScreenshotIndex(self.ocr_cache.conn if self.ocr_cache else None)
+        
+        # Skip unchanged files by stat(), drop duplicate captures, then reuse OCR results for known image bytes
+        pending = []
+        to_ocr = []
+        hashes = {}
+        stats = {}
+        skip_above = {}
+        unchanged = 0
+        duplicates = 0
+        lookup_start = time.perf_counter()
+        # Oldest capture first within each folder, so scroll captures are compared with the one before
+        for image_path in sorted(screenshot_files, key=capture_order):
+            if self.ocr_cache and self.ocr_cache.is_unchanged(image_path):
+                unchanged += 1
+                continue
+            # Stat before hashing so a write during processing is seen as a change next time
+            stats[image_path] = file_stat(image_path)
+            content_hash = file_hash(image_path)
+            
+            verdict = self.screenshot_index.check(image_path, content_hash, stats[image_path][0])
+            if verdict["status"] == "duplicate":
+                duplicates += 1
+                self.log_processing("duplicate_skipped", f"{image_path} duplicates {verdict['original']}", True, "dedup")
+                if self.ocr_cache:
+                    self.ocr_cache.remember(image_path, content_hash, stats[image_path])
+                continue
+            if verdict["status"] == "overlap":
+                # Only cards below the part already captured by the previous scroll position are OCR'd
+                skip_above[image_path] = verdict["skip_above"]
+            
+            if not self.ocr_cache:
+                to_ocr.append(image_path)
+                continue
+            cached = self.ocr_cache.get(content_hash, skip_above.get(image_path, 0))
+            if cached is None:
+                hashes[image_path] = content_hash
+                to_ocr.append(image_path)
+                continue
+            candidates = cached["candidates"]
+            if not candidates or candidates[0].get("profile_image") != image_path:
+                # Same image under another path: parsing is cheap, only OCR is skipped
+                candidates = self.candidates_from_ocr(cached["result"], image_path)
+            self.ocr_cache.remember(image_path, content_hash, stats[image_path])
+            pending.extend(candidates)
+            processed_candidates.extend(candidates)
+        
+        self.log_processing("cache_lookup", f"{len(screenshot_files)} screenshots", True, "cache_lookup",
+                            time.perf_counter() - lookup_start, unchanged=unchanged, duplicates=duplicates,
+                            overlaps=len(skip_above), to_ocr=len(to_ocr))
+        if self.ocr_cache:
+            print(f"OCR cache: {unchanged} unchanged, {self.ocr_cache.hits} reused, {len(to_ocr)} to OCR")
+        if duplicates or skip_above:
+            print(f"Duplicates: {duplicates} skipped, {len(skip_above)} scroll captures cut to their new cards")
+        total = len(to_ocr)
+        if total == 0:
+            if pending:
+                self.flush_screenshot_batch(pending)
+            elif self.ocr_cache:
+                self.ocr_cache.commit()
+            return processed_candidates
+        
+        own_pool = pool is None and workers > 1 and ocr_mode == "process"
+        if own_pool:
+            pool = Pool(workers)
+        jobs = [(image_path, skip_above.get(image_path, 0)) for image_path in to_ocr]
+        if ocr_mode == "thread":
+            results = ThreadedOCRPipeline(workers).run(to_ocr, skip_above)
+        elif pool:
+            results = pool.imap_unordered(ocr_screenshot_job, jobs)
+        else:
+            results = map(ocr_screenshot_job, jobs)
+        print(f"OCR workers: {workers} ({ocr_mode}{'es' if ocr_mode == 'process' else 's'})")
+        
+        latencies = []
+        errors = 0
+        start = time.perf_counter()
+        progress_every = max(1, min(25, total // 20))
         
-        for screenshot_file in screenshot_files:
-            print(f"Processing: {screenshot_file}")
-            candidate = self.process_screenshot_file(screenshot_file)
-            if candidate:
-                processed_candidates.append(candidate)
+        try:
+            # Results stream back in completion order; this process is the only DB writer
+            for done, ocr_result in enumerate(results, 1):
+                image_path = ocr_result["image_path"]
+                latencies.append(ocr_result["latency"])
+                
+                if ocr_result["error"]:
+                    errors += 1
+                    self.log_processing("ocr_error", f"Failed to extract text from {image_path}: {ocr_result['error']}", False,
+                                        "ocr", ocr_result["latency"])
+                else:
+                    self.log_processing("ocr", image_path, True, "ocr", ocr_result["latency"], cards=len(ocr_result["cards"]))
+                    with self.logger.timed("parse", details=image_path):
+                        candidates = self.candidates_from_ocr(ocr_result, image_path)
+                    pending.extend(candidates)
+                    processed_candidates.extend(candidates)
+                    if self.ocr_cache:
+                        self.ocr_cache.put(hashes[image_path], ocr_result, candidates, skip_above.get(image_path, 0))
+                        self.ocr_cache.remember(image_path, hashes[image_path], stats[image_path])
+                
+                if len(pending) >= batch_size:
+                    self.flush_screenshot_batch(pending)
+                    pending = []
+                
+                if done % progress_every == 0 or done == total:
+                    elapsed = time.perf_counter() - start
+                    print(f"Progress: {done}/{total} screenshots ({done / elapsed:.1f} images/s, {errors} errors)")
+        finally:
+            if pending:
+                self.flush_screenshot_batch(pending)
+            if own_pool:
+                pool.close()
+                pool.join()
+        
+        elapsed = time.perf_counter() - start
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1000
+        print(f"OCR throughput: {total / elapsed:.2f} images/s over {elapsed:.1f}s")
+        print(f"Per-image latency: p50 {p50:.0f}ms, p90 {p90:.0f}ms, p99 {p99:.0f}ms")
         
         return processed_candidates
     
+    def flush_screenshot_batch(self, candidates: List[Dict[str, Any]]):
+        """Write a batch of screenshot candidates and log it as one event."""
+        start = time.perf_counter()
+        self.save_candidates_batch(candidates)
+        if self.ocr_cache:
+            self.ocr_cache.commit()
+        sources = ", ".join(c["screenshot_source"] for c in candidates)
+        self.log_processing("screenshots_processed", f"Saved {len(candidates)} candidates: {sources}", True,
+                            "db_write", time.perf_counter() - start, candidates=len(candidates))
+    
     def generate_processing_report(self) -> Dict[str, Any]:
         """Generate a comprehensive report of all processed candidates."""
         conn = sqlite3.connect(self.db_path)
@@ -451,27 +581,35 @@ class CandidateProcessor:
         
         return str(export_path)
     
-    def run_full_processing(self):
+    def run_full_processing(self, workers: int = 1, use_cache: bool = True, ocr_mode: str = "process"):
         """Run the complete candidate processing pipeline."""
         print("Starting candidate processing pipeline...")
+        started_at = datetime.now().isoformat()
         
         # Step 1: Process existing JSON data
         print("Step 1: Processing existing JSON data...")
-        json_candidates = self.process_existing_json_data()
+        with self.logger.timed("step_json_import"):
+            json_candidates = self.process_existing_json_data()
         print(f"Imported {len(json_candidates)} candidates from JSON files")
         
         # Step 2: Process screenshot files
         print("Step 2: Processing screenshot files...")
-        screenshot_candidates = self.process_all_screenshots()
+        with self.logger.timed("step_screenshots"):
+            screenshot_candidates = self.process_all_screenshots(workers, use_cache=use_cache, ocr_mode=ocr_mode)
         print(f"Processed {len(screenshot_candidates)} candidates from screenshots")
         
         # Step 3: Generate report
         print("Step 3: Generating processing report...")
-        report = self.generate_processing_report()
+        with self.logger.timed("step_report"):
+            report = self.generate_processing_report()
         
         # Step 4: Export all candidates
         print("Step 4: Exporting all candidates...")
-        export_path = self.export_candidates_to_json()
+        with self.logger.timed("step_export"):
+            export_path = self.export_candidates_to_json()
+        
+        print("\nStage timings for this run:")
+        print_stage_summary(self.logger.stage_summary(since=started_at))
         
         print(f"\nProcessing complete!")
         print(f"Total candidates processed: {report['total_candidates']}")
@@ -489,8 +627,28 @@ def main():
     """Main function to run the candidate processor."""
     processor = CandidateProcessor()
     
+    # Number of OCR worker processes, or OCR threads with --ocr-mode thread (--workers N)
+    workers = 1
+    if "--workers" in sys.argv:
+        index = sys.argv.index("--workers")
+        if len(sys.argv) > index + 1:
+            workers = int(sys.argv[index + 1])
+    
+    # --no-cache re-OCRs every screenshot even if it is unchanged
+    use_cache = "--no-cache" not in sys.argv
+    
+    # --ocr-mode thread runs OCR on threads in this process instead of worker processes
+    ocr_mode = "process"
+    if "--ocr-mode" in sys.argv:
+        index = sys.argv.index("--ocr-mode")
+        if len(sys.argv) > index + 1:
+            ocr_mode = sys.argv[index + 1]
+    if ocr_mode not in OCR_MODES:
+        print(f"Unknown --ocr-mode {ocr_mode}; expected one of: {', '.join(OCR_MODES)}")
+        sys.exit(1)
+    
     try:
-        results = processor.run_full_processing()
+        results = processor.run_full_processing(workers, use_cache, ocr_mode)
         
         # Print summary
         print("\n" + "="*50)
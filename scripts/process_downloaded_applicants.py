@@ -10,11 +10,16 @@ import os
 from datetime import datetime
 from typing import Dict, List, Any
 
+from candidate_quality import score_batch
+from candidate_record import CandidateRecord
+from candidate_store import CandidateStore, candidate_key, derived_candidate_id, open_store
+
 class DownloadedApplicantProcessor:
     def __init__(self):
         self.applicants_dir = "output/applicants"
         self.database_path = "output/applicants/applicants.db"
         self.output_dir = "output/processed_candidates"
+        self.store = open_store()
         
     def load_all_downloaded_data(self) -> List[Dict[str, Any]]:
         """Load all downloaded applicant data from various sources"""
@@ -46,6 +51,13 @@ class DownloadedApplicantProcessor:
                 except Exception as e:
                     print(f"⚠️ Error loading {filename}: {e}")
         
+        # Load from the rated applicants store written by profile_lookup_rating
+        rated_store = CandidateStore(os.path.join(self.applicants_dir, "rated_store"))
+        if rated_store.exists():
+            rated = rated_store.load_all()
+            print(f"📄 Loaded {len(rated)} candidates from rated applicants store")
+            all_candidates.extend(rated)
+        
         return all_candidates
     
     def load_database_applicants(self) -> List[Dict[str, Any]]:
@@ -97,87 +109,51 @@ class DownloadedApplicantProcessor:
         
         return candidates
     
-    def normalize_candidate_data(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Normalize and standardize candidate data"""
+    def normalize_candidate_data(self, candidates: List[Dict[str, Any]]) -> List[CandidateRecord]:
+        """Normalize and standardize candidate data into compact records"""
         normalized = []
+        quality_scores = score_batch(candidates).tolist()
         
-        for candidate in candidates:
-            # Ensure required fields exist
-            normalized_candidate = {
-                "id": candidate.get("id", f"candidate_{len(normalized)}"),
-                "name": candidate.get("name", "Unknown"),
-                "title": candidate.get("title", ""),
-                "location": candidate.get("location", ""),
-                "hourly_rate": candidate.get("hourly_rate", ""),
-                "job_success": candidate.get("job_success", ""),
-                "total_earned": candidate.get("total_earned", ""),
-                "hours_worked": candidate.get("hours_worked", ""),
-                "jobs_completed": candidate.get("jobs_completed", ""),
-                "overview": candidate.get("overview", ""),
-                "proposal_text": candidate.get("proposal_text", ""),
-                "job_title": candidate.get("job_title", "URGENT Contract-to-Hire UX/Conversion Designer - Start This Week"),
-                "profile_url": candidate.get("profile_url", ""),
-                "status": candidate.get("status", "pending"),
-                "rating": candidate.get("rating", 0),
-                "applied_date": candidate.get("applied_date", "2025-07-19"),
-                "notes": candidate.get("notes", ""),
-                "profile_image": candidate.get("profile_image", ""),
-                "screenshot_source": candidate.get("screenshot_source", "downloaded_data"),
-                "portfolio_links": candidate.get("portfolio_links", []),
-                "work_samples": candidate.get("work_samples", []),
-                "processed_at": candidate.get("processed_at", datetime.now().isoformat()),
-                "source_file": candidate.get("source_file", "downloaded_applicants"),
-                "data_quality_score": self.calculate_quality_score(candidate)
-            }
-            
-            # Handle skills field
-            skills = candidate.get("skills", [])
-            if isinstance(skills, str):
-                skills = [s.strip() for s in skills.split(',') if s.strip()]
-            normalized_candidate["skills"] = skills
-            
-            normalized.append(normalized_candidate)
+        for candidate, quality_score in zip(candidates, quality_scores):
+            # Ensure required fields exist; skills given as a comma string are split by the record
+            normalized.append(CandidateRecord(
+                # Never a position in this batch: the id is the key the store dedupes on across runs
+                id=candidate.get("id") or derived_candidate_id(candidate),
+                name=candidate.get("name", "Unknown"),
+                title=candidate.get("title", ""),
+                location=candidate.get("location", ""),
+                hourly_rate=candidate.get("hourly_rate", ""),
+                job_success=candidate.get("job_success", ""),
+                total_earned=candidate.get("total_earned", ""),
+                hours_worked=candidate.get("hours_worked", ""),
+                jobs_completed=candidate.get("jobs_completed", ""),
+                overview=candidate.get("overview", ""),
+                proposal_text=candidate.get("proposal_text", ""),
+                job_title=candidate.get("job_title", "URGENT Contract-to-Hire UX/Conversion Designer - Start This Week"),
+                profile_url=candidate.get("profile_url", ""),
+                status=candidate.get("status", "pending"),
+                rating=candidate.get("rating", 0),
+                applied_date=candidate.get("applied_date", "2025-07-19"),
+                notes=candidate.get("notes", ""),
+                profile_image=candidate.get("profile_image", ""),
+                screenshot_source=candidate.get("screenshot_source", "downloaded_data"),
+                portfolio_links=candidate.get("portfolio_links", []),
+                work_samples=candidate.get("work_samples", []),
+                processed_at=candidate.get("processed_at", datetime.now().isoformat()),
+                source_file=candidate.get("source_file", "downloaded_applicants"),
+                data_quality_score=round(quality_score, 2),
+                skills=candidate.get("skills", [])
+            ))
         
         return normalized
     
-    def calculate_quality_score(self, candidate: Dict[str, Any]) -> float:
-        """Calculate data quality score for a candidate"""
-        score = 0.0
-        total_fields = 15
-        
-        # Basic info (required)
-        if candidate.get("name"): score += 1
-        if candidate.get("title"): score += 1
-        if candidate.get("location"): score += 1
-        if candidate.get("hourly_rate"): score += 1
-        
-        # Performance metrics
-        if candidate.get("job_success"): score += 1
-        if candidate.get("total_earned"): score += 1
-        if candidate.get("hours_worked"): score += 1
-        if candidate.get("jobs_completed"): score += 1
-        
-        # Detailed info
-        if candidate.get("overview"): score += 1
-        if candidate.get("proposal_text"): score += 1
-        if candidate.get("profile_url"): score += 1
-        if candidate.get("skills"): score += 1
-        
-        # Additional data
-        if candidate.get("rating"): score += 1
-        if candidate.get("notes"): score += 1
-        if candidate.get("portfolio_links"): score += 1
-        
-        return (score / total_fields) * 100
-    
     def remove_duplicates(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate candidates based on name and profile URL"""
+        """Remove duplicate candidates by candidate_key, as the merge and the store do"""
         seen = set()
         unique_candidates = []
         
         for candidate in candidates:
-            # Create unique identifier
-            identifier = f"{candidate.get('name', '')}_{candidate.get('profile_url', '')}"
+            identifier = candidate_key(candidate)
             
             if identifier not in seen:
                 seen.add(identifier)
@@ -189,27 +165,19 @@ class DownloadedApplicantProcessor:
     
     def merge_with_existing(self, new_candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Merge with existing processed candidates"""
-        existing_file = "output/processed_candidates/all_processed_candidates_20250719_031346.json"
-        
-        if os.path.exists(existing_file):
-            with open(existing_file, 'r') as f:
-                existing_data = json.load(f)
-                existing_candidates = existing_data.get('applicants', [])
-        else:
-            existing_candidates = []
+        existing_candidates = self.store.load_all()
         
         # Create set of existing identifiers
         existing_identifiers = set()
         for candidate in existing_candidates:
-            identifier = f"{candidate.get('name', '')}_{candidate.get('profile_url', '')}"
-            existing_identifiers.add(identifier)
+            existing_identifiers.add(candidate_key(candidate))
         
         # Add new candidates that don't exist
         merged_candidates = existing_candidates.copy()
         added_count = 0
         
         for candidate in new_candidates:
-            identifier = f"{candidate.get('name', '')}_{candidate.get('profile_url', '')}"
+            identifier = candidate_key(candidate)
             if identifier not in existing_identifiers:
                 merged_candidates.append(candidate)
                 existing_identifiers.add(identifier)
@@ -219,32 +187,19 @@ class DownloadedApplicantProcessor:
         return merged_candidates
     
     def save_merged_candidates(self, candidates: List[Dict[str, Any]]):
-        """Save merged candidates to file"""
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Update main file
-        main_filepath = "output/processed_candidates/all_processed_candidates_20250719_031346.json"
-        data = {
-            "applicants": candidates,
-            "total_count": len(candidates),
-            "last_updated": datetime.now().isoformat(),
-            "source": "downloaded_applicants_merge",
-            "extraction_notes": "Merged from downloaded applicant data and database"
-        }
-        
-        with open(main_filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filepath = f"output/processed_candidates/all_processed_candidates_{timestamp}.json"
-        with open(backup_filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Append candidates missing from the store as a new delta segment"""
+        added = self.store.append_new(
+            candidates,
+            metadata={
+                "source": "downloaded_applicants_merge",
+                "extraction_notes": "Merged from downloaded applicant data and database"
+            }
+        )
         
-        print(f"💾 Saved {len(candidates)} candidates to {main_filepath}")
-        print(f"📦 Backup saved to {backup_filepath}")
+        print(f"💾 Appended {len(added)} new candidates to {self.store.store_dir}")
+        print(f"📦 Store manifest: {self.store.manifest_path}")
         
-        return main_filepath
+        return self.store.manifest_path
     
     def generate_processing_report(self, candidates: List[Dict[str, Any]]) -> str:
         """Generate a processing report"""
@@ -293,7 +248,7 @@ class DownloadedApplicantProcessor:
 
 ---
 **Status:** ✅ **PROCESSING COMPLETE**
-**Files Updated:** Main candidate database and backup created
+**Files Updated:** Candidate snapshot store (new delta segment)
 """
         
         return report
@@ -12,12 +12,16 @@ from pathlib import Path
 from typing import Dict, List, Any
 import re
 
+from candidate_quality import apply_scores, score_candidate
+from candidate_store import CandidateStore
+
 class CandidateDataProcessor:
     def __init__(self, workspace_path: str = "."):
         self.workspace_path = Path(workspace_path)
         self.output_dir = self.workspace_path / "output"
         self.processed_dir = self.output_dir / "processed_candidates"
         self.processed_dir.mkdir(exist_ok=True)
+        self.store = CandidateStore(str(self.processed_dir / "store"))
         
         # Database setup
         self.db_path = self.output_dir / "applicants" / "applicants.db"
@@ -65,7 +69,7 @@ class CandidateDataProcessor:
         conn.commit()
         conn.close()
         
-    def save_candidate_to_db(self, candidate: Dict[str, Any], source_file: str):
+    def save_candidate_to_db(self, candidate: Dict[str, Any], source_file: str, data_quality_score: float = None):
         """Save candidate data to SQLite database."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -75,8 +79,9 @@ class CandidateDataProcessor:
         portfolio_links_json = json.dumps(candidate.get("portfolio_links", []))
         work_samples_json = json.dumps(candidate.get("work_samples", []))
         
-        # Calculate data quality score
-        data_quality_score = self.calculate_data_quality(candidate)
+        # Score on its own when not part of a scored batch
+        if data_quality_score is None:
+            data_quality_score = score_candidate(candidate)
         
         cursor.execute('''
             INSERT OR REPLACE INTO processed_candidates (
@@ -103,48 +108,6 @@ class CandidateDataProcessor:
         conn.commit()
         conn.close()
     
-    def calculate_data_quality(self, candidate: Dict[str, Any]) -> float:
-        """Calculate a data quality score for the candidate."""
-        score = 0.0
-        total_fields = 0
-        
-        # Check required fields
-        required_fields = ["name", "title", "location", "hourly_rate"]
-        for field in required_fields:
-            total_fields += 1
-            if candidate.get(field):
-                score += 1.0
-        
-        # Check optional but valuable fields
-        optional_fields = ["skills", "overview", "proposal_text", "profile_url", "portfolio_links"]
-        for field in optional_fields:
-            total_fields += 1
-            if candidate.get(field):
-                if isinstance(candidate[field], list) and len(candidate[field]) > 0:
-                    score += 1.0
-                elif isinstance(candidate[field], str) and len(candidate[field].strip()) > 0:
-                    score += 1.0
-        
-        # Check job success rate
-        if candidate.get("job_success"):
-            job_success = candidate["job_success"]
-            if "%" in job_success:
-                try:
-                    rate = int(re.search(r'(\d+)', job_success).group(1))
-                    if rate >= 90:
-                        score += 1.0
-                    elif rate >= 80:
-                        score += 0.8
-                    elif rate >= 70:
-                        score += 0.6
-                    else:
-                        score += 0.3
-                    total_fields += 1
-                except:
-                    pass
-        
-        return (score / total_fields) * 100 if total_fields > 0 else 0.0
-    
     def process_json_file(self, json_file: Path) -> List[Dict[str, Any]]:
         """Process a single JSON file and extract candidates."""
         processed_candidates = []
@@ -173,11 +136,15 @@ class CandidateDataProcessor:
                     # Ensure candidate has an ID
                     if not candidate.get("id"):
                         candidate["id"] = f"{json_file.stem}_{i:03d}"
-                    
-                    # Save to database
-                    self.save_candidate_to_db(candidate, json_file.name)
                     processed_candidates.append(candidate)
             
+            # Score the file in one batch; the score is also kept on each candidate
+            quality_scores = apply_scores(processed_candidates).tolist()
+            
+            for candidate, quality_score in zip(processed_candidates, quality_scores):
+                # Save to database
+                self.save_candidate_to_db(candidate, json_file.name, quality_score)
+            
             return processed_candidates
             
         except Exception as e:
@@ -280,7 +247,7 @@ class CandidateDataProcessor:
         return report
     
     def export_all_candidates(self) -> str:
-        """Export all candidates to JSON file."""
+        """Export all candidates to the snapshot store."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
@@ -303,12 +270,11 @@ class CandidateDataProcessor:
         
         conn.close()
         
-        # Save to file
-        export_path = self.processed_dir / f"all_processed_candidates_{self.timestamp}.json"
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(candidates, f, indent=2, ensure_ascii=False)
+        # Only rows that are new or changed since the last export are written
+        changed = self.store.upsert(candidates, metadata={"source": "processed_candidates_db"})
+        print(f"Exported {len(changed)} new or changed candidates to {self.store.store_dir}")
         
-        return str(export_path)
+        return self.store.manifest_path
     
     def generate_html_report(self, report: Dict[str, Any]) -> str:
         """Generate an HTML report of the processing results."""
@@ -11,6 +11,8 @@ import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from skill_vocabulary import overlap_count
+
 class HTMLApplicantProcessor:
     def __init__(self):
         self.downloads_dir = "context/Applicant Page Downloads"
@@ -127,8 +129,9 @@ class HTMLApplicantProcessor:
             "Mobile Design", "Web Design", "Branding", "Typography", "Color Theory"
         ]
         
+        context_lower = context.lower()
         for skill in skill_keywords:
-            if skill.lower() in context.lower():
+            if skill.lower() in context_lower:
                 skills.append(skill)
                 
         return skills[:10]  # Limit to 10 skills
@@ -234,11 +237,8 @@ class HTMLApplicantProcessor:
         # Base rating
         score += applicant.get('rating', 0) * 2
         
-        # Skills match
-        applicant_skills = [skill.lower() for skill in applicant.get('skills', [])]
-        for keyword in job_keywords:
-            if keyword.lower() in applicant_skills:
-                score += 1.0
+        # Skills match: one point per job keyword the applicant lists (synonyms share an id)
+        score += overlap_count(applicant.get('skills', []), job_keywords)
         
         # Experience bonus
         hours_text = applicant.get('hours_worked', '')
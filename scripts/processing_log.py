@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Processing Log
+Buffered, structured event log for the candidate pipelines, stored in processing_log.
+
+Events are kept in memory and written with one executemany in a single
+transaction when the buffer fills, when the flush interval has passed, or on
+exit, instead of one connection and commit per event. Each row carries a
+timestamp, the pipeline stage, the action, success, an optional duration and
+optional JSON data, so the table doubles as a timing record: stage_summary()
+reports count, failures and duration percentiles per stage.
+"""
+
+import atexit
+import json
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+DEFAULT_LOG_DB = "output/applicants/applicants.db"
+FLUSH_EVERY = 200          # buffered events that trigger a write
+FLUSH_INTERVAL = 5.0       # seconds after which the next event triggers a write
+
+LOG_COLUMNS = {
+    "timestamp": "TEXT",
+    "action": "TEXT",
+    "details": "TEXT",
+    "success": "BOOLEAN",
+    "stage": "TEXT",
+    "duration": "REAL",
+    "data": "TEXT"
+}
+
+def ensure_log_table(conn: sqlite3.Connection):
+    """Create processing_log, or add the structured columns to an older table"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS processing_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT,
+            action TEXT,
+            details TEXT,
+            success BOOLEAN
+        )
+    ''')
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(processing_log)")}
+    for column, kind in LOG_COLUMNS.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE processing_log ADD COLUMN {column} {kind}")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_processing_log_stage ON processing_log (stage, timestamp)")
+    conn.commit()
+
+class ProcessingLogger:
+    """Collects log events and writes them to SQLite in batches"""
+
+    def __init__(self, db_path: str = DEFAULT_LOG_DB, flush_every: int = FLUSH_EVERY,
+                 flush_interval: float = FLUSH_INTERVAL):
+        self.db_path = str(db_path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.buffer: List[tuple] = []
+        self.lock = threading.Lock()
+        self.last_flush = time.monotonic()
+        conn = sqlite3.connect(self.db_path)
+        ensure_log_table(conn)
+        conn.close()
+        atexit.register(self.flush)
+
+    def log(self, action: str, details: str = "", success: bool = True, stage: Optional[str] = None,
+            duration: Optional[float] = None, **data):
+        """Buffer one event; duration is in seconds, extra keyword arguments are stored as JSON"""
+        row = (datetime.now().isoformat(), action, details, success, stage or action, duration,
+               json.dumps(data, default=str) if data else None)
+        with self.lock:
+            self.buffer.append(row)
+            due = (len(self.buffer) >= self.flush_every
+                   or time.monotonic() - self.last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    @contextmanager
+    def timed(self, stage: str, action: Optional[str] = None, details: str = "", **data):
+        """Log a stage's duration when the block exits; an exception is logged as a failure and re-raised"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.log(action or stage, f"{details} {e}".strip(), False, stage, time.perf_counter() - start, **data)
+            raise
+        self.log(action or stage, details, True, stage, time.perf_counter() - start, **data)
+
+    def flush(self):
+        """Write all buffered events in one transaction"""
+        with self.lock:
+            rows, self.buffer = self.buffer, []
+            self.last_flush = time.monotonic()
+        if not rows:
+            return
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany('''
+                    INSERT INTO processing_log (timestamp, action, details, success, stage, duration, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+        finally:
+            conn.close()
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def stage_summary(self, since: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Per-stage event count, failures and duration statistics (in ms), optionally since an ISO timestamp"""
+        self.flush()
+        return stage_summary(self.db_path, since)
+
+def stage_summary(db_path: str = DEFAULT_LOG_DB, since: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Per-stage event count, failures and duration statistics (in ms) from a processing_log table"""
+    conn = sqlite3.connect(str(db_path))
+    ensure_log_table(conn)
+    rows = conn.execute('''
+        SELECT COALESCE(stage, action), success, duration FROM processing_log
+        WHERE timestamp >= ?
+    ''', (since or "",)).fetchall()
+    conn.close()
+
+    grouped: Dict[str, List[tuple]] = {}
+    for stage, success, duration in rows:
+        grouped.setdefault(stage, []).append((success, duration))
+
+    summary = {}
+    for stage, events in grouped.items():
+        durations = np.array([d for _, d in events if d is not None], dtype=np.float64) * 1000
+        entry = {"events": len(events), "failures": sum(1 for s, _ in events if not s)}
+        if len(durations):
+            p50, p95 = np.percentile(durations, [50, 95])
+            entry.update({
+                "total_ms": round(float(durations.sum()), 1),
+                "avg_ms": round(float(durations.mean()), 1),
+                "p50_ms": round(float(p50), 1),
+                "p95_ms": round(float(p95), 1),
+                "max_ms": round(float(durations.max()), 1)
+            })
+        summary[stage] = entry
+    return summary
+
+def print_stage_summary(summary: Dict[str, Dict[str, Any]]):
+    """Print a stage_summary() result as a table, slowest stages first"""
+    print(f"{'Stage':<22}{'Events':>8}{'Failed':>8}{'Total s':>10}{'Avg ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for stage, entry in sorted(summary.items(), key=lambda x: x[1].get("total_ms", 0), reverse=True):
+        if "total_ms" in entry:
+            timing = (f"{entry['total_ms'] / 1000:>10.2f}{entry['avg_ms']:>10.1f}"
+                      f"{entry['p50_ms']:>10.1f}{entry['p95_ms']:>10.1f}")
+        else:
+            timing = f"{'-':>10}{'-':>10}{'-':>10}{'-':>10}"
+        print(f"{stage:<22}{entry['events']:>8}{entry['failures']:>8}{timing}")
+
+def main():
+    """Print per-stage timing from the processing log (--db PATH, --since ISO-TIMESTAMP)"""
+    db_path = DEFAULT_LOG_DB
+    since = None
+    if "--db" in sys.argv:
+        db_path = sys.argv[sys.argv.index("--db") + 1]
+    if "--since" in sys.argv:
+        since = sys.argv[sys.argv.index("--since") + 1]
+
+    summary = stage_summary(db_path, since)
+    if not summary:
+        print(f"📭 No processing events in {db_path}")
+        return
+    print(f"📊 Processing stages in {db_path}" + (f" since {since}" if since else ""))
+    print_stage_summary(summary)
+
+if __name__ == "__main__":
+    main()
@@ -4,19 +4,22 @@ Profile Lookup and Rating - Use MCP browser tools to look up applicant profiles
 """
 
 import asyncio
-import json
 import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import time
 
+from candidate_store import CandidateStore
+from skill_vocabulary import overlap_count
+
 class ProfileLookupRater:
     """Look up applicant profiles and rate them using MCP browser tools"""
     
     def __init__(self):
         self.output_dir = "../output/applicants"
         self.web_dir = "../output/web"
+        self.rated_store = CandidateStore(os.path.join(self.output_dir, "rated_store"))
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(self.web_dir, exist_ok=True)
         
@@ -250,9 +253,6 @@ class ProfileLookupRater:
         # Real MCP call to navigate to profile
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_navigate(url='{applicant['profile_url']}')")
         
-        # Wait for page load
-        await asyncio.sleep(3)
-        
         # Real MCP call to extract detailed profile information
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => {{")
         print(f"  const profileData = {{")
@@ -409,8 +409,7 @@ class ProfileLookupRater:
         
         job_type = "Shopify Developer" if "Shopify" in applicant['job_title'] else "UX/Conversion Designer"
         required = required_skills.get(job_type, [])
-        applicant_skills = [skill.lower() for skill in applicant['skills']]
-        matching_skills = sum(1 for skill in required if any(req.lower() in skill for req in [skill.lower() for skill in required]))
+        matching_skills = overlap_count(required, applicant['skills'])
         
         if matching_skills >= len(required) * 0.8:
             ratings["skills_match"] = 5
@@ -508,30 +507,19 @@ class ProfileLookupRater:
             }
             
             processed_applicants.append(processed_applicant)
-            
-            # Small delay between requests
-            await asyncio.sleep(1)
         
         return processed_applicants
     
     def save_rated_applicants(self, applicants: List[Dict[str, Any]]):
-        """Save rated applicants to JSON file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"rated_applicants_{timestamp}.json"
-        filepath = os.path.join(self.output_dir, filename)
-        
-        data = {
+        """Append rated applicants to the rated snapshot store"""
+        # Unchanged ratings are skipped; re-rated applicants replace their earlier record
+        written = self.rated_store.upsert(applicants, metadata={
             "rated_at": datetime.now().isoformat(),
-            "total_applicants": len(applicants),
-            "jobs": list(set([app['job_title'] for app in applicants])),
-            "applicants": applicants
-        }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            "jobs": sorted(set([app['job_title'] for app in applicants]))
+        })
         
-        print(f"💾 Saved rated applicants to: {filepath}")
-        return filepath
+        print(f"💾 Saved {len(written)} new or updated rated applicants to: {self.rated_store.store_dir}")
+        return self.rated_store.manifest_path
     
     def generate_rating_report(self, applicants: List[Dict[str, Any]]):
         """Generate a comprehensive rating report"""
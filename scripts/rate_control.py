@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Rate Control
+Per-host token buckets, a retry scheduler with jittered backoff, and an adaptive concurrency limit.
+
+Every page load a scraper makes goes through RetryScheduler.run(url, load).
+Before each attempt it takes a token from the host's bucket (HOST_RATE
+requests per second, bursts of HOST_BURST), which replaces the fixed sleeps
+between pages. A failed attempt is classified (timeout, disconnected,
+blocked, tool error) and retried under that class's policy: a number of
+attempts and an exponential backoff with equal jitter, so tabs that failed
+together do not retry together. Anything it cannot classify (a bug, a page
+that is simply missing what we want) is raised at once.
+
+Two things adapt to what the site does. A "throttle" class (timeouts, a
+Cloudflare or rate-limit page) halves the host's request rate, and every
+success wins a little of it back. An AdaptiveConcurrency limit, which a
+TabPool hands to its scheduler, decides how many tabs work at once: it
+starts at one and grows by one per success while the latency stays within
+LATENCY_TOLERANCE of the best seen, then adds one per round of successes
+(AIMD); a latency spike or a throttle error halves it. The pool settles
+near the most tabs the site will serve without slowing down, with no
+manual tuning.
+"""
+
+import asyncio
+import collections
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Any, Awaitable, Callable, Optional
+from urllib.parse import urlparse
+
+from mcp_browser_client import MCPError
+
+HOST_RATE = 4.0                # requests per second to one host while it is healthy
+HOST_BURST = 2                 # requests to one host that may start back to back
+MIN_HOST_RATE = 0.1            # floor for a host's rate after repeated throttling
+RATE_DECREASE = 0.5            # factor applied to a host's rate on a throttle error
+RATE_RECOVERY = 0.05           # share of HOST_RATE won back per successful request
+
+LATENCY_TOLERANCE = 2.0        # latency above this multiple of the best seen counts as overload
+LATENCY_WEIGHT = 0.3           # weight of a new sample in the latency moving average
+CONCURRENCY_DECREASE = 0.5     # factor applied to the concurrency limit on overload
+LATENCY_SAMPLES = 10000        # load latencies kept per scheduler (for benchmarks)
+
+class BlockedError(Exception):
+    """The site answered with a challenge or rate-limit page instead of content"""
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently to retry one class of error"""
+    attempts: int              # attempts in total, including the first
+    base_delay: float          # seconds before the first retry, doubled for each one after
+    max_delay: float           # longest delay between attempts
+    throttle: bool = False     # the error means we are going too fast: slow the host and the pool down
+
+RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "timeout": RetryPolicy(3, 1.0, 15.0, throttle=True),
+    "disconnected": RetryPolicy(3, 2.0, 20.0),     # the next call starts a new gateway session
+    "blocked": RetryPolicy(3, 10.0, 120.0, throttle=True),
+    "tool": RetryPolicy(2, 1.0, 5.0),
+}
+
+def classify(error: BaseException) -> Optional[str]:
+    """Retry class of an error (a RETRY_POLICIES key), or None if retrying will not help"""
+    if isinstance(error, BlockedError):
+        return "blocked"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(error, MCPError):
+        message = str(error)
+        if message.startswith("cannot start"):
+            return None            # no gateway to talk to; retrying only delays the error
+        if "timed out" in message:
+            return "timeout"
+        if "closed the session" in message or "not accepting requests" in message:
+            return "disconnected"
+        if "429" in message or "too many requests" in message.lower():
+            return "blocked"
+        return "tool"
+    return None
+
+def backoff_delay(policy: RetryPolicy, attempt: int, rng: random.Random) -> float:
+    """Delay before retry number `attempt` (from 1): half the capped exponential step fixed, half random"""
+    step = min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1))
+    return rng.uniform(step / 2, step)
+
+class TokenBucket:
+    """Tokens refill at `rate` per second up to `burst`; acquire() waits for one, first come first served"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+class HostRateLimiter:
+    """A token bucket per host whose rate drops when the host pushes back and recovers as it answers"""
+
+    def __init__(self, rate: float = HOST_RATE, burst: float = HOST_BURST, min_rate: float = MIN_HOST_RATE):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.buckets[host]
+
+    async def acquire(self, url: str):
+        await self.bucket(url).acquire()
+
+    def slow_down(self, url: str):
+        bucket = self.bucket(url)
+        bucket.rate = max(self.min_rate, bucket.rate * RATE_DECREASE)
+
+    def recover(self, url: str):
+        bucket = self.bucket(url)
+        bucket.rate = min(self.rate, bucket.rate + self.rate * RATE_RECOVERY)
+
+class AdaptiveConcurrency:
+    """A concurrency limit found by AIMD on latency and throttle errors, between min_limit and max_limit"""
+
+    def __init__(self, max_limit: int, min_limit: int = 1, tolerance: float = LATENCY_TOLERANCE):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.tolerance = tolerance
+        self.limit = float(self.min_limit)
+        self.slow_start = True     # grow by one per success until the first overload
+        self.in_use = 0
+        self.latency: Optional[float] = None        # moving average of recent successes
+        self.best_latency: Optional[float] = None   # lowest moving average seen
+        self._cut_at = 0.0
+        self._waiters: collections.deque = collections.deque()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one unit of concurrency, waiting while the limit is used up"""
+        while self.in_use >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+        self.in_use += 1
+        try:
+            yield
+        finally:
+            self.in_use -= 1
+            self._wake()
+
+    def _wake(self):
+        free = int(self.limit) - self.in_use
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def record(self, latency: float, overloaded: bool = False):
+        """Feed back one finished request: its latency, or that the site pushed back"""
+        if not overloaded:
+            self.latency = latency if self.latency is None else self.latency + LATENCY_WEIGHT * (latency - self.latency)
+            self.best_latency = min(self.best_latency or self.latency, self.latency)
+            overloaded = self.latency > self.best_latency * self.tolerance
+        if overloaded:
+            # One cut per round-trip: the other requests of an overloaded window report it too
+            now = time.monotonic()
+            if now - self._cut_at >= (self.latency or 0.0):
+                self.limit = max(float(self.min_limit), self.limit * CONCURRENCY_DECREASE)
+                self.slow_start = False
+                self._cut_at = now
+        elif self.slow_start:
+            self.limit = min(float(self.max_limit), self.limit + 1)
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._wake()
+
+class RetryScheduler:
+    """Runs page loads under the host rate limit, retrying failures by error class with jittered backoff"""
+
+    def __init__(self, policies: Optional[Dict[str, RetryPolicy]] = None,
+                 limiter: Optional[HostRateLimiter] = None,
+                 concurrency: Optional[AdaptiveConcurrency] = None, rng: Optional[random.Random] = None):
+        self.policies = policies or RETRY_POLICIES
+        self.limiter = limiter     # None: the process-wide limiter, shared by every scheduler
+        self.concurrency = concurrency
+        self.rng = rng or random.Random()
+        self.retries: collections.Counter = collections.Counter()    # retries made, by error class
+        self.failures: collections.Counter = collections.Counter()   # loads given up on, by error class
+        self.latencies: collections.deque = collections.deque(maxlen=LATENCY_SAMPLES)   # seconds per finished load
+
+    async def run(self, url: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """load()'s result, retried per policy; the last error is raised once retries run out"""
+        limiter = self.limiter or get_host_limiter()
+        attempt = 0
+        began = time.monotonic()
+        while True:
+            attempt += 1
+            await limiter.acquire(url)
+            start = time.monotonic()
+            try:
+                result = await load()
+            except Exception as e:
+                kind = classify(e)
+                policy = self.policies.get(kind) if kind else None
+                if policy and policy.throttle:
+                    limiter.slow_down(url)
+                    if self.concurrency:
+                        self.concurrency.record(time.monotonic() - start, overloaded=True)
+                if policy is None or attempt >= policy.attempts:
+                    if kind:
+                        self.failures[kind] += 1
+                    raise
+                self.retries[kind] += 1
+                delay = backoff_delay(policy, attempt, self.rng)
+                print(f"🔁 {kind} on {url} ({e}), retry {attempt}/{policy.attempts - 1} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            limiter.recover(url)
+            self.latencies.append(time.monotonic() - began)     # what the caller waited, retries included
+            if self.concurrency:
+                self.concurrency.record(time.monotonic() - start)
+            return result
+
+_host_limiter: Optional[HostRateLimiter] = None
+_host_limiter_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_host_limiter() -> HostRateLimiter:
+    """The process-wide per-host limiter (a new one per event loop, like mcp_browser_client.get_client)"""
+    global _host_limiter, _host_limiter_loop
+    loop = asyncio.get_running_loop()
+    if _host_limiter is None or _host_limiter_loop is not loop:
+        _host_limiter = HostRateLimiter()
+        _host_limiter_loop = loop
+    return _host_limiter
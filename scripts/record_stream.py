@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Record Stream
+Append-only JSON Lines stream of scraped records, written as each one completes and tailed by the ingest.
+
+Scrapers used to hand their results over only at the end of a crawl, in one
+indented JSON file. Each scraper now also appends a line per profile (or job
+listing) the moment it is scraped:
+
+    {"kind": "applicant", "source": "docker_mcp", "group": "ux_designer",
+     "emitted_at": "...", "record": {...}}
+
+kind is what the record is (applicant, freelancer or job), source the
+scraper, group the brief, skill or category it was scraped for. A line is
+written with a single append and flushed, so a reader never sees half a
+record as long as it stops at the last newline, which follow_records does.
+Readers keep their own byte offset (an ".offset" file next to the stream), so
+a consumer that stops picks up where it left off, and any number of
+scrapers can append to the same stream while it is being read.
+
+    python3 scripts/record_stream.py                  # records per kind and source
+    python3 scripts/record_stream.py --follow         # print records as they arrive
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple
+
+DEFAULT_STREAM_PATH = "../output/streams/scraped_records.jsonl"
+TEST_STREAM_PATH = "../output/streams/test_scraped_records.jsonl"    # test-mode runs, kept out of the ingest
+POLL_INTERVAL = 0.5            # seconds between checks for new lines when following
+READ_CHUNK = 64 * 1024         # bytes read from the stream at a time
+
+class RecordStream:
+    """Appends records to a JSON Lines file, one flushed line each"""
+
+    def __init__(self, path: str = DEFAULT_STREAM_PATH, source: str = ""):
+        self.path = path
+        self.source = source
+        self.written = 0
+        self._file = None
+
+    def write(self, kind: str, record: Dict[str, Any], group: str = ""):
+        """Append one record, visible to readers as soon as this returns"""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        line = json.dumps({"kind": kind, "source": self.source, "group": group,
+                           "emitted_at": datetime.now().isoformat(), "record": record}, ensure_ascii=False)
+        self._file.write(line + "\n")
+        self._file.flush()
+        self.written += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def follow_records(path: str = DEFAULT_STREAM_PATH, offset: int = 0, follow: bool = False,
+                   poll_interval: float = POLL_INTERVAL,
+                   stop: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """Yield (entry, offset after it) for each complete line from offset on; with follow, wait for more until stop()"""
+    pending = b""
+    while True:
+        if os.path.exists(path):
+            if os.path.getsize(path) < offset:
+                print(f"⚠️ {path} is shorter than offset {offset}, reading it from the start")
+                offset, pending = 0, b""
+            with open(path, 'rb') as f:
+                f.seek(offset + len(pending))
+                while True:
+                    chunk = f.read(READ_CHUNK)
+                    if not chunk:
+                        break
+                    pending += chunk
+                    # Only whole lines: a writer may be halfway through the last one
+                    *lines, pending = pending.split(b"\n")
+                    for line in lines:
+                        offset += len(line) + 1
+                        if not line.strip():
+                            continue
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            print(f"⚠️ Skipping malformed line before offset {offset} in {path}")
+                            continue
+                        yield entry, offset
+        if not follow or (stop and stop()):
+            return
+        time.sleep(poll_interval)
+
+def load_offset(path: str = DEFAULT_STREAM_PATH) -> int:
+    """Byte offset a consumer has read the stream up to (0 if it has not started)"""
+    try:
+        with open(path + ".offset", 'r', encoding='utf-8') as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+def save_offset(offset: int, path: str = DEFAULT_STREAM_PATH):
+    with open(path + ".offset.tmp", 'w', encoding='utf-8') as f:
+        f.write(str(offset))
+    os.replace(path + ".offset.tmp", path + ".offset")
+
+def main():
+    """Summarize the stream (--stream PATH), or --follow it"""
+    path = sys.argv[sys.argv.index("--stream") + 1] if "--stream" in sys.argv else DEFAULT_STREAM_PATH
+    if "--follow" in sys.argv:
+        print(f"👀 Following {path} (Ctrl+C to stop)...")
+        try:
+            for entry, _ in follow_records(path, follow=True):
+                record = entry.get("record", {})
+                print(f"   • {entry.get('kind')} from {entry.get('source')} [{entry.get('group')}]: "
+                      f"{record.get('name') or record.get('title') or '?'}")
+        except KeyboardInterrupt:
+            pass
+        return
+    counts: Dict[Tuple[str, str], int] = {}
+    for entry, _ in follow_records(path):
+        key = (entry.get("kind", "?"), entry.get("source", "?"))
+        counts[key] = counts.get(key, 0) + 1
+    print(f"📜 {path}: {sum(counts.values())} records (ingest offset {load_offset(path)})")
+    for (kind, source), count in sorted(counts.items()):
+        print(f"   • {kind} from {source}: {count}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Scraper Benchmark
+End-to-end throughput and tail latency of each scraper against the mock MCP server.
+
+Every scraper runs its real entry point (brief, search or job listing) on a
+fresh event loop against mock_mcp_server's synthetic fixtures, with an
+in-memory page cache so nothing is replayed from, or written to, the real
+one, and its record stream sent to /dev/null. Reported per scraper: wall
+time, items per second, p50/p95/p99 latency of a page load (from its
+RetryScheduler, retries included), retries and failures by error class,
+and MCP tool calls. Failure flags are handed to the
+mock, so the same run shows how retries hold up under tool errors, stalls,
+gateway crashes and Cloudflare pages:
+
+    python3 scripts/scraper_benchmark.py --applicants 20 --fail-rate 0.05 --crash-rate 0.01
+"""
+
+import asyncio
+import collections
+import contextlib
+import io
+import os
+import shlex
+import sys
+import time
+from typing import Dict, List, Any, Awaitable, Callable, Iterable
+
+from mcp_browser_client import get_client, close_client
+from mock_mcp_server import (MOCK_BRIEF_URL, MOCK_JOB_SEARCH_URL, MOCK_PROFILE_SEARCH_URL, NAVIGATE_LATENCY,
+                             READY_DELAY, mock_command)
+
+FAILURE_FLAGS = ["--fail-rate", "--slow-rate", "--slow", "--crash-rate", "--block-rate", "--seed"]
+
+def percentile(samples: List[float], share: float) -> float:
+    """Nearest-rank percentile of samples (0.0 when there are none)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(share * len(ordered))) - 1))]
+
+async def _docker(items: int) -> tuple:
+    from upwork_applicants_scraper_docker_mcp import UpworkApplicantsScraperDockerMCP
+
+    scraper = UpworkApplicantsScraperDockerMCP(max_applicants=items, frontier_path=":memory:", stream_path=os.devnull)
+    try:
+        collected = await scraper.scrape_applicants_from_brief(MOCK_BRIEF_URL, "mock")
+        return collected, [scraper.retry, scraper.pool.retry], scraper.pool.tabs
+    finally:
+        await scraper.close()
+
+async def _real_mcp(items: int) -> tuple:
+    from upwork_scraper_real_mcp import RealMCPUpworkScraper
+
+    scraper = RealMCPUpworkScraper(max_applicants=items, page_cache_path=":memory:", stream_path=os.devnull)
+    try:
+        collected = await scraper.scrape_brief_applicants("mock", MOCK_BRIEF_URL)
+        return collected, [scraper.retry, scraper.pool.retry], scraper.pool.tabs
+    finally:
+        await scraper.pool.close()
+        scraper.page_cache.close()
+
+async def _cloudflare_ready(items: int) -> tuple:
+    from upwork_scraper_cloudflare_ready import CloudflareReadyUpworkScraper
+
+    scraper = CloudflareReadyUpworkScraper(max_applicants=items, page_cache_path=":memory:", stream_path=os.devnull)
+    try:
+        collected = await scraper.scrape_brief_applicants("mock", MOCK_BRIEF_URL)
+        return collected, [scraper.retry], []
+    finally:
+        scraper.page_cache.close()
+
+async def _public(items: int) -> tuple:
+    from upwork_public_freelancer_scraper import PublicFreelancerScraper
+
+    scraper = PublicFreelancerScraper(max_freelancers=items, page_cache_path=":memory:", stream_path=os.devnull)
+    try:
+        collected = await scraper.scrape_skill_freelancers("mock", MOCK_PROFILE_SEARCH_URL)
+        return collected, [scraper.retry], []
+    finally:
+        scraper.page_cache.close()
+
+async def _real_jobs(items: int) -> tuple:
+    from upwork_real_jobs_scraper import RealUpworkJobsScraper
+
+    scraper = RealUpworkJobsScraper(max_results=items, page_cache_path=":memory:", stream_path=os.devnull)
+    try:
+        jobs = await scraper.scrape_job_listings("mock", MOCK_JOB_SEARCH_URL)
+        freelancers = await scraper.scrape_freelancer_profiles("mock", MOCK_PROFILE_SEARCH_URL)
+        return jobs + freelancers, [scraper.pool.retry], scraper.pool.tabs
+    finally:
+        await scraper.pool.close()
+        scraper.page_cache.close()
+
+# Scraper name -> coroutine running it for N items: (items collected, its RetrySchedulers, its pool tabs)
+SCRAPERS: Dict[str, Callable[[int], Awaitable[tuple]]] = {
+    "docker": _docker,
+    "real_mcp": _real_mcp,
+    "cloudflare_ready": _cloudflare_ready,
+    "public": _public,
+    "real_jobs": _real_jobs,
+}
+
+async def _measure(runner: Callable[[int], Awaitable[tuple]], items: int) -> Dict[str, Any]:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        try:
+            collected, schedulers, tabs = await runner(items)
+            elapsed = time.perf_counter() - start
+            calls = (await get_client()).calls + sum(tab.calls for tab in tabs)
+        finally:
+            await close_client()
+    latencies = [latency for scheduler in schedulers for latency in scheduler.latencies]
+    retries: collections.Counter = collections.Counter()
+    failures: collections.Counter = collections.Counter()
+    for scheduler in schedulers:
+        retries.update(scheduler.retries)
+        failures.update(scheduler.failures)
+    return {
+        "items": len(collected),
+        "elapsed": elapsed,
+        "loads": len(latencies),
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "retries": retries,
+        "failures": failures,
+        "calls": calls,
+    }
+
+def _counts(counter: collections.Counter) -> str:
+    return ", ".join(f"{kind} {count}" for kind, count in sorted(counter.items())) or "none"
+
+def run_benchmarks(names: Iterable[str], items: int = 20, latency: float = NAVIGATE_LATENCY,
+                   ready_delay: float = READY_DELAY, failure_options: Iterable[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """Run each named scraper against a fresh mock session and print its throughput and load latencies"""
+    failure_options = list(failure_options)
+    os.environ["MCP_GATEWAY_COMMAND"] = shlex.join(mock_command(items, latency, ready_delay, *failure_options))
+    print(f"⏱️ Benchmarking scrapers on the mock MCP server ({items} items, {latency:g}s per navigation"
+          f"{', ' + ' '.join(failure_options) if failure_options else ''})...")
+    results = {}
+    for name in names:
+        try:
+            result = asyncio.run(_measure(SCRAPERS[name], items))
+        except Exception as e:
+            print(f"   ❌ {name}: {e}")
+            continue
+        results[name] = result
+        print(f"   • {name:17} {result['elapsed']:6.1f}s  {result['items']:3} items "
+              f"({result['items'] / result['elapsed']:.2f}/s)  {result['calls']:4} tool calls")
+        print(f"     {'':17} page load p50 {result['p50']:.2f}s  p95 {result['p95']:.2f}s  "
+              f"p99 {result['p99']:.2f}s over {result['loads']} loads; retries: {_counts(result['retries'])}; "
+              f"failures: {_counts(result['failures'])}")
+    return results
+
+def _option(name: str, default: str) -> str:
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+def main():
+    """Benchmark every scraper (or --only a,b) with --applicants N, --latency S and the mock's failure flags"""
+    names = _option("--only", ",".join(SCRAPERS)).split(",")
+    unknown = [name for name in names if name not in SCRAPERS]
+    if unknown:
+        print(f"❌ Unknown scraper(s): {', '.join(unknown)} (choose from {', '.join(SCRAPERS)})")
+        return
+    failure_options: List[str] = []
+    for flag in FAILURE_FLAGS:
+        if flag in sys.argv:
+            failure_options += [flag, _option(flag, "")]
+    run_benchmarks(names, int(_option("--applicants", "20")), float(_option("--latency", str(NAVIGATE_LATENCY))),
+                   float(_option("--ready-delay", str(READY_DELAY))), failure_options)
+
+if __name__ == "__main__":
+    main()
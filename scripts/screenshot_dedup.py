@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Screenshot Dedup
+Perceptual fingerprints that keep duplicate and overlapping screenshots away from OCR.
+
+Each screenshot gets a 64-bit dHash and pHash computed with OpenCV and NumPy
+on a downscaled grayscale copy, plus a row profile: the mean grey level of
+PROFILE_BINS column bins for every pixel row. Fingerprints are stored next
+to the OCR cache, so they persist across runs.
+
+    near duplicates   dHash and pHash within a few bits of an earlier capture
+                      (candidates are found through dHash band buckets), confirmed
+                      by comparing row profiles so look-alike pages with
+                      different applicants are not dropped
+    scroll overlap    the top of a capture matches a lower part of a recent
+                      capture of the same size in the same folder; only the
+                      cards below the overlap are OCR'd
+
+A byte-identical copy of a capture whose original still exists (e.g. under
+site/assets/profiles) is a duplicate without even being decoded.
+"""
+
+import os
+import sqlite3
+import sys
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+import cv2
+import numpy as np
+
+HASH_SIZE = 8                 # 8x8 = 64-bit hashes
+PHASH_DCT_SIZE = 32
+PROFILE_BINS = 64
+HASH_BANDS = 8                # dHash split into 8-bit buckets; any match within 7 bits shares a bucket
+DHASH_DISTANCE = 6
+PHASH_DISTANCE = 10
+ROW_TOLERANCE = 10            # grey levels a row-profile bin may differ by and still match
+MIN_OVERLAP_RATIO = 0.2       # overlaps shorter than this share of the height are ignored
+PROBE_ROWS = 32
+TEXTURE_SPREAD = 24           # bin spread that marks a row as containing content
+RECENT_CAPTURES = 5           # earlier captures in the same folder checked for overlap
+PROFILE_CACHE_SIZE = 64
+
+def load_gray(image_path: str) -> Optional[np.ndarray]:
+    return cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+
+def dhash(gray: np.ndarray, size: int = HASH_SIZE) -> int:
+    """Difference hash: whether each pixel of a (size+1)xsize thumbnail is brighter than its right neighbour"""
+    small = cv2.resize(gray, (size + 1, size), interpolation=cv2.INTER_AREA).astype(np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+def phash(gray: np.ndarray, size: int = HASH_SIZE) -> int:
+    """DCT hash: low-frequency DCT coefficients of a 32x32 thumbnail compared with their median"""
+    small = cv2.resize(gray, (PHASH_DCT_SIZE, PHASH_DCT_SIZE), interpolation=cv2.INTER_AREA).astype(np.float32)
+    low = cv2.dct(small)[:size, :size].flatten()
+    bits = low > np.median(low[1:])
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+def row_profile(gray: np.ndarray) -> np.ndarray:
+    """Mean grey level of PROFILE_BINS column bins for every row (height x PROFILE_BINS, uint8)"""
+    return cv2.resize(gray, (PROFILE_BINS, gray.shape[0]), interpolation=cv2.INTER_AREA)
+
+def fingerprint(gray: np.ndarray) -> Dict[str, Any]:
+    """Hashes and row profile of a grayscale screenshot"""
+    return {
+        "width": gray.shape[1],
+        "height": gray.shape[0],
+        "dhash": dhash(gray),
+        "phash": phash(gray),
+        "rows": row_profile(gray)
+    }
+
+def profiles_match(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if two row profiles show the same content (rescaled to the same height first)"""
+    if a.shape != b.shape:
+        b = cv2.resize(b, (a.shape[1], a.shape[0]), interpolation=cv2.INTER_AREA)
+    diff = np.abs(a.astype(np.int16) - b.astype(np.int16))
+    return float(np.percentile(diff, 99)) <= ROW_TOLERANCE
+
+def _rows_equal(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Per-row flag: every bin within ROW_TOLERANCE"""
+    return np.abs(a.astype(np.int16) - b.astype(np.int16)).max(axis=1) <= ROW_TOLERANCE
+
+def scroll_offset(previous: np.ndarray, current: np.ndarray) -> int:
+    """Rows the page scrolled down between two same-size captures, or 0 if they do not overlap
+
+    A sticky header shared by both captures is skipped, then a probe of the
+    first textured rows of the current capture is slid over the previous one
+    and every candidate offset is verified over the whole overlap.
+    """
+    if previous.shape != current.shape:
+        return 0
+    height = current.shape[0]
+    same = _rows_equal(previous, current)
+    header = int(np.argmin(same)) if not same.all() else height
+    if header >= height:
+        return 0
+
+    spread = current.max(axis=1).astype(np.int16) - current.min(axis=1)
+    textured = np.flatnonzero(spread[header:] > TEXTURE_SPREAD)
+    if len(textured) == 0:
+        return 0
+    probe_start = header + int(textured[0])
+    probe = current[probe_start:probe_start + PROBE_ROWS].astype(np.int16)
+    if len(probe) < PROBE_ROWS:
+        return 0
+
+    windows = np.lib.stride_tricks.sliding_window_view(previous.astype(np.int16), (PROBE_ROWS, PROFILE_BINS))[:, 0]
+    distance = np.abs(windows - probe).max(axis=(1, 2))
+    min_overlap = int(height * MIN_OVERLAP_RATIO)
+    for start in np.flatnonzero(distance <= ROW_TOLERANCE):
+        offset = int(start) - probe_start
+        if offset <= 0 or height - offset - header < min_overlap:
+            continue
+        overlap = _rows_equal(previous[header + offset:], current[header:height - offset])
+        if overlap.mean() >= 0.98:
+            return offset
+    return 0
+
+class ScreenshotIndex:
+    """Stored fingerprints of processed screenshots, queried before OCR"""
+
+    def __init__(self, conn: Optional[sqlite3.Connection] = None):
+        self.conn = conn or sqlite3.connect(":memory:")
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS screenshot_fingerprints (
+                content_hash TEXT PRIMARY KEY,
+                path TEXT,
+                directory TEXT,
+                mtime_ns INTEGER,
+                width INTEGER,
+                height INTEGER,
+                dhash TEXT,
+                phash TEXT,
+                rows BLOB
+            )
+        ''')
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.buckets: List[Dict[int, List[str]]] = [{} for _ in range(HASH_BANDS)]
+        self.profiles: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        for row in self.conn.execute('''
+            SELECT content_hash, path, directory, mtime_ns, width, height, dhash, phash
+            FROM screenshot_fingerprints
+        '''):
+            self._index(row[0], {"path": row[1], "directory": row[2], "mtime_ns": row[3], "width": row[4],
+                                 "height": row[5], "dhash": int(row[6], 16), "phash": int(row[7], 16)})
+        self.duplicates = 0
+        self.overlaps = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _index(self, content_hash: str, entry: Dict[str, Any]):
+        old = self.entries.get(content_hash)
+        if old is not None:
+            for band, bucket in zip(self._bands(old["dhash"]), self.buckets):
+                bucket[band].remove(content_hash)
+        self.entries[content_hash] = entry
+        for band, bucket in zip(self._bands(entry["dhash"]), self.buckets):
+            bucket.setdefault(band, []).append(content_hash)
+
+    @staticmethod
+    def _bands(value: int) -> List[int]:
+        return [(value >> (8 * i)) & 0xFF for i in range(HASH_BANDS)]
+
+    def _profile(self, content_hash: str) -> np.ndarray:
+        rows = self.profiles.get(content_hash)
+        if rows is None:
+            blob, width, height = self.conn.execute(
+                "SELECT rows, width, height FROM screenshot_fingerprints WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+            rows = np.frombuffer(zlib.decompress(blob), dtype=np.uint8).reshape(height, PROFILE_BINS)
+            self._remember_profile(content_hash, rows)
+        self.profiles.move_to_end(content_hash)
+        return rows
+
+    def _remember_profile(self, content_hash: str, rows: np.ndarray):
+        self.profiles[content_hash] = rows
+        while len(self.profiles) > PROFILE_CACHE_SIZE:
+            self.profiles.popitem(last=False)
+
+    def add(self, image_path: str, content_hash: str, mtime_ns: int, fp: Dict[str, Any]):
+        """Store a screenshot's fingerprint (committed with the OCR cache)"""
+        entry = {"path": image_path, "directory": os.path.dirname(image_path), "mtime_ns": mtime_ns,
+                 "width": fp["width"], "height": fp["height"], "dhash": fp["dhash"], "phash": fp["phash"]}
+        self.conn.execute('''
+            INSERT OR REPLACE INTO screenshot_fingerprints
+                (content_hash, path, directory, mtime_ns, width, height, dhash, phash, rows)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (content_hash, image_path, entry["directory"], mtime_ns, fp["width"], fp["height"],
+              f"{fp['dhash']:016x}", f"{fp['phash']:016x}", zlib.compress(fp["rows"].tobytes())))
+        self._index(content_hash, entry)
+        self._remember_profile(content_hash, fp["rows"])
+
+    def find_duplicate(self, image_path: str, fp: Dict[str, Any]) -> Optional[str]:
+        """Path of an existing capture showing the same content, if any"""
+        seen = set()
+        for band, bucket in zip(self._bands(fp["dhash"]), self.buckets):
+            for content_hash in bucket.get(band, ()):
+                if content_hash in seen:
+                    continue
+                seen.add(content_hash)
+                entry = self.entries[content_hash]
+                if (entry["path"] != image_path
+                        and hamming(entry["dhash"], fp["dhash"]) <= DHASH_DISTANCE
+                        and hamming(entry["phash"], fp["phash"]) <= PHASH_DISTANCE
+                        and os.path.exists(entry["path"])
+                        and profiles_match(self._profile(content_hash), fp["rows"])):
+                    return entry["path"]
+        return None
+
+    def find_overlap(self, image_path: str, mtime_ns: int, fp: Dict[str, Any]) -> Tuple[Optional[str], int]:
+        """(earlier capture, rows scrolled) for a scroll capture continuing a recent one, else (None, 0)"""
+        directory = os.path.dirname(image_path)
+        recent = sorted(
+            (entry["mtime_ns"], content_hash) for content_hash, entry in self.entries.items()
+            if entry["directory"] == directory and entry["path"] != image_path
+            and entry["width"] == fp["width"] and entry["height"] == fp["height"]
+            and entry["mtime_ns"] <= mtime_ns
+        )[-RECENT_CAPTURES:]
+        for _, content_hash in reversed(recent):
+            offset = scroll_offset(self._profile(content_hash), fp["rows"])
+            if offset:
+                return self.entries[content_hash]["path"], offset
+        return None, 0
+
+    def check(self, image_path: str, content_hash: str, mtime_ns: int) -> Dict[str, Any]:
+        """Classify a screenshot before OCR and index it.
+
+        Returns {"status": "new" | "duplicate" | "overlap", "original": path or None,
+        "skip_above": rows at the top already covered by an earlier capture}.
+        """
+        known = self.entries.get(content_hash)
+        if known and known["path"] != image_path and os.path.exists(known["path"]):
+            self.duplicates += 1
+            return {"status": "duplicate", "original": known["path"], "skip_above": 0}
+
+        gray = load_gray(image_path)
+        if gray is None:
+            return {"status": "new", "original": None, "skip_above": 0}
+        fp = fingerprint(gray)
+
+        original = self.find_duplicate(image_path, fp)
+        if original:
+            self.duplicates += 1
+            return {"status": "duplicate", "original": original, "skip_above": 0}
+
+        previous, offset = self.find_overlap(image_path, mtime_ns, fp)
+        self.add(image_path, content_hash, mtime_ns, fp)
+        if previous:
+            self.overlaps += 1
+            return {"status": "overlap", "original": previous, "skip_above": fp["height"] - offset}
+        return {"status": "new", "original": None, "skip_above": 0}
+
+def main():
+    """Compare two screenshots: hash distances, duplicate verdict and scroll overlap"""
+    if len(sys.argv) < 3:
+        print("Usage: python3 scripts/screenshot_dedup.py <earlier.png> <later.png>")
+        return
+
+    grays = [load_gray(path) for path in sys.argv[1:3]]
+    if any(gray is None for gray in grays):
+        print("❌ Could not load both images")
+        return
+    first, second = (fingerprint(gray) for gray in grays)
+    duplicate = (hamming(first["dhash"], second["dhash"]) <= DHASH_DISTANCE
+                 and hamming(first["phash"], second["phash"]) <= PHASH_DISTANCE
+                 and profiles_match(first["rows"], second["rows"]))
+    offset = scroll_offset(first["rows"], second["rows"])
+    print(f"🔍 dHash distance {hamming(first['dhash'], second['dhash'])}, "
+          f"pHash distance {hamming(first['phash'], second['phash'])}")
+    print(f"   • Near duplicate: {'yes' if duplicate else 'no'}")
+    if offset:
+        print(f"   • Scroll overlap: scrolled {offset}px; only rows {second['height'] - offset}+ of the second are new")
+    else:
+        print("   • Scroll overlap: none")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Screenshot Layout
+Finds individual applicant cards in a proposals-list screenshot so each is OCR'd on its own.
+
+Cards are located on a foreground mask of the grayscale page, trying in order:
+    1. bordered cards: long horizontal and vertical rules, joined into contours
+    2. separator rules: full-width horizontal lines splitting the list into bands
+    3. whitespace: a horizontal projection split at tall empty gaps
+If none of these finds at least two cards, the whole page is treated as one card.
+Only the card crops are preprocessed and OCR'd, so page margins and chrome cost nothing
+and fields from neighbouring applicants never end up in the same text blob.
+"""
+
+import sys
+from typing import Dict, List, Any, Tuple
+
+import cv2
+import numpy as np
+
+from screenshot_ocr import load_image, downscale_oversized, prepare_adaptive, ocr_prepared, average_confidence
+
+Box = Tuple[int, int, int, int]  # x, y, width, height
+
+BACKGROUND_MARGIN = 12        # grey levels below the page background that count as foreground
+REFERENCE_WIDTH = 1280        # pixel constants below are for a page this wide and scale with it
+MIN_CARD_HEIGHT = 60
+MIN_CARD_GAP = 40
+MIN_CARD_WIDTH_RATIO = 0.5
+CARD_PADDING = 4
+
+def foreground_mask(gray: np.ndarray) -> np.ndarray:
+    """Binary mask of everything darker (or, on dark pages, lighter) than the background"""
+    background = int(np.median(gray))
+    if background < 128:
+        gray = 255 - gray
+        background = 255 - background
+    return ((gray < background - BACKGROUND_MARGIN) * 255).astype(np.uint8)
+
+def _runs(flags: np.ndarray) -> List[Tuple[int, int]]:
+    """(start, end) index ranges where a boolean array is True"""
+    padded = np.concatenate([[False], flags, [False]]).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return list(zip(edges[::2], edges[1::2]))
+
+def _has_content(mask: np.ndarray, box: Box) -> bool:
+    x, y, w, h = box
+    return bool(mask[y:y + h, x:x + w].any())
+
+def card_boxes_from_contours(mask: np.ndarray, scale: float) -> List[Box]:
+    """Bordered cards: rectangles drawn by long horizontal and vertical rules"""
+    height, width = mask.shape
+    min_height = int(MIN_CARD_HEIGHT * scale)
+    horizontal = cv2.morphologyEx(mask, cv2.MORPH_OPEN,
+                                  cv2.getStructuringElement(cv2.MORPH_RECT, (int(width * MIN_CARD_WIDTH_RATIO), 1)))
+    vertical = cv2.morphologyEx(mask, cv2.MORPH_OPEN,
+                                cv2.getStructuringElement(cv2.MORPH_RECT, (1, max(1, min_height))))
+    frame = cv2.dilate(cv2.bitwise_or(horizontal, vertical), np.ones((3, 3), np.uint8))
+    contours, _ = cv2.findContours(frame, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+    boxes = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if w >= width * MIN_CARD_WIDTH_RATIO and min_height <= h <= height * 0.9:
+            boxes.append((x, y, w, h))
+
+    # Outer and inner edges of the same border both form contours; keep the innermost boxes
+    def contains(outer: Box, inner: Box) -> bool:
+        return (outer != inner and outer[0] <= inner[0] and outer[1] <= inner[1]
+                and outer[0] + outer[2] >= inner[0] + inner[2] and outer[1] + outer[3] >= inner[1] + inner[3])
+    boxes = [box for box in boxes if not any(contains(box, other) for other in boxes)]
+    return sorted(set(box for box in boxes if _has_content(mask, box)), key=lambda b: (b[1], b[0]))
+
+def card_boxes_from_separators(mask: np.ndarray, scale: float) -> List[Box]:
+    """Cards stacked between full-width horizontal separator lines"""
+    height, width = mask.shape
+    horizontal = cv2.morphologyEx(mask, cv2.MORPH_OPEN,
+                                  cv2.getStructuringElement(cv2.MORPH_RECT, (int(width * MIN_CARD_WIDTH_RATIO), 1)))
+    separators = _runs(horizontal.any(axis=1))
+    edges = [0] + [row for run in separators for row in run] + [height]
+
+    boxes = []
+    for top, bottom in zip(edges[::2], edges[1::2]):
+        if bottom - top >= MIN_CARD_HEIGHT * scale and _has_content(mask, (0, top, width, bottom - top)):
+            boxes.append((0, int(top), width, int(bottom - top)))
+    return boxes
+
+def card_boxes_from_projection(mask: np.ndarray, scale: float) -> List[Box]:
+    """Cards separated by tall runs of empty rows in the horizontal ink projection"""
+    height, width = mask.shape
+    ink_rows = mask.any(axis=1)
+    gaps = [(start, end) for start, end in _runs(~ink_rows) if end - start >= MIN_CARD_GAP * scale]
+    edges = [0] + [row for gap in gaps for row in gap] + [height]
+
+    boxes = []
+    for top, bottom in zip(edges[::2], edges[1::2]):
+        if bottom - top <= 0 or not ink_rows[top:bottom].any():
+            continue
+        if boxes and bottom - top < MIN_CARD_HEIGHT * scale:
+            # Too short to be a card on its own; it belongs to the card above
+            x, y, w, h = boxes[-1]
+            boxes[-1] = (x, y, w, int(bottom - y))
+        else:
+            boxes.append((0, int(top), width, int(bottom - top)))
+    return boxes
+
+def detect_card_regions(image: np.ndarray) -> List[Box]:
+    """Applicant card boxes, top to bottom; the whole page if no card layout is found"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    height, width = gray.shape
+    mask = foreground_mask(gray)
+    scale = width / REFERENCE_WIDTH
+
+    for finder in (card_boxes_from_contours, card_boxes_from_separators, card_boxes_from_projection):
+        boxes = finder(mask, scale)
+        if len(boxes) >= 2:
+            return boxes
+    return [(0, 0, width, height)]
+
+def crop(image: np.ndarray, box: Box, padding: int = CARD_PADDING) -> np.ndarray:
+    """Crop a box from an image with a little padding, clamped to the image"""
+    x, y, w, h = box
+    height, width = image.shape[:2]
+    return image[max(0, y - padding):min(height, y + h + padding), max(0, x - padding):min(width, x + w + padding)]
+
+def prepare_cards(image: np.ndarray, skip_above: int = 0) -> List[Tuple[Box, Dict[str, Any]]]:
+    """Detect cards and binarize each crop for OCR, leaving out cards that end above row skip_above"""
+    scaled = downscale_oversized(image)
+    limit = skip_above * scaled.shape[0] / image.shape[0]
+    return [(box, prepare_adaptive(crop(scaled, box))) for box in detect_card_regions(scaled)
+            if box[1] + box[3] > limit]
+
+def ocr_prepared_cards(prepared: List[Tuple[Box, Dict[str, Any]]]) -> Dict[str, Any]:
+    """OCR prepared card crops; returns per-card text, confidence, words and box"""
+    cards = []
+    for box, card in prepared:
+        result = ocr_prepared(card)
+        if not result["text"].strip():
+            continue
+        result["box"] = list(box)
+        cards.append(result)
+    words = [word for card in cards for word in card["words"]]
+    return {"cards": cards, "confidence": average_confidence(words), "error": None}
+
+def ocr_cards(image: np.ndarray, skip_above: int = 0) -> Dict[str, Any]:
+    """Detect cards and OCR each crop; returns per-card text, confidence, words and box"""
+    return ocr_prepared_cards(prepare_cards(image, skip_above))
+
+def extract_cards_from_image(image_path: str, skip_above: int = 0) -> Dict[str, Any]:
+    """Load a screenshot and OCR each applicant card separately (only cards below skip_above)"""
+    try:
+        image = load_image(image_path)
+        if image is None:
+            return {"cards": [], "confidence": 0.0, "error": "Could not load image"}
+        return ocr_cards(image, skip_above)
+    except Exception as e:
+        return {"cards": [], "confidence": 0.0, "error": str(e)}
+
+def main():
+    """Print the card regions detected in a screenshot (add --ocr to OCR them)"""
+    if len(sys.argv) < 2:
+        print("Usage: python3 scripts/screenshot_layout.py <image> [--ocr]")
+        return
+
+    image = load_image(sys.argv[1])
+    if image is None:
+        print(f"❌ Could not load {sys.argv[1]}")
+        return
+
+    boxes = detect_card_regions(image)
+    print(f"🧩 {len(boxes)} card regions in {sys.argv[1]}")
+    for i, (x, y, w, h) in enumerate(boxes, 1):
+        print(f"   • Card {i}: x={x} y={y} {w}x{h}")
+
+    if "--ocr" in sys.argv:
+        for i, card in enumerate(ocr_cards(image)["cards"], 1):
+            print(f"\n--- Card {i} ({card['confidence']:.1f}%) ---")
+            print(card["text"])
+
+if __name__ == "__main__":
+    main()
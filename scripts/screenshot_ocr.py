@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Screenshot OCR
+Single-pass Tesseract OCR returning text, confidence and word boxes together.
+
+pytesseract.image_to_string and image_to_data each spawn a Tesseract process,
+so calling both OCRs every screenshot twice. image_to_data already carries
+every recognized word with its block/paragraph/line position, box and
+confidence, so the text is rebuilt from that single result and the words are
+kept for field parsing.
+
+Preprocessing is adaptive. Browser screenshots are usually lossless and
+clean, so fastNlMeansDenoising (by far the slowest step) only runs when the
+measured background noise calls for it, low-contrast images get a histogram
+stretch, and retina captures are downscaled before anything else. If the
+cheap pass comes back below CONFIDENCE_THRESHOLD the image is re-OCR'd with
+every filter and the better result kept.
+
+With the optional tesserocr package, recognition goes through a persistent
+Tesseract API handle per thread instead of a tesseract subprocess per call,
+so the language model is loaded once and the GIL is released while it runs.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+import cv2
+import numpy as np
+import pytesseract
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+SCREENSHOT_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff')
+
+NOISE_THRESHOLD = 2.0          # estimated background noise sigma above which to denoise
+MIN_CONTRAST = 80              # 1st-99th percentile grey spread below which to stretch
+MAX_OCR_WIDTH = 2200           # wider captures (retina) are downscaled...
+TARGET_OCR_WIDTH = 1600        # ...to this width
+CONFIDENCE_THRESHOLD = 75.0    # below this the image is retried with every filter
+
+# Laplacian-style kernel for Immerkaer's fast noise variance estimate
+NOISE_KERNEL = np.array([[1, -2, 1], [-2, 4, -2], [1, -2, 1]], dtype=np.float32)
+NOISE_SAMPLE_SIZE = 1024
+
+# Everything that changes OCR output for the same image bytes; part of the OCR cache key
+PREPROCESS_PARAMS = {
+    "grayscale": True,
+    "denoise": "adaptive",
+    "noise_threshold": NOISE_THRESHOLD,
+    "min_contrast": MIN_CONTRAST,
+    "max_width": MAX_OCR_WIDTH,
+    "target_width": TARGET_OCR_WIDTH,
+    "confidence_threshold": CONFIDENCE_THRESHOLD,
+    "threshold": "otsu",
+    "engine": "tesserocr" if TESSEROCR_AVAILABLE else "image_to_data",
+    "layout": "cards"
+}
+
+def preprocess_signature(params: Dict[str, Any] = PREPROCESS_PARAMS) -> str:
+    """Short stable hash of the preprocessing parameters and Tesseract version"""
+    try:
+        version = tesserocr.tesseract_version() if TESSEROCR_AVAILABLE else str(pytesseract.get_tesseract_version())
+    except Exception:
+        version = "unknown"
+    payload = json.dumps({**params, "tesseract": version}, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+def load_image(image_path: str) -> Optional[np.ndarray]:
+    """Load an image from disk, returning None if it cannot be decoded"""
+    return cv2.imread(image_path)
+
+def to_gray(image: np.ndarray) -> np.ndarray:
+    """Grayscale view of an image (unchanged if already single-channel)"""
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+
+def downscale_oversized(image: np.ndarray) -> np.ndarray:
+    """Shrink retina-size captures to TARGET_OCR_WIDTH; text stays well above Tesseract's minimum size"""
+    width = image.shape[1]
+    if width <= MAX_OCR_WIDTH:
+        return image
+    factor = TARGET_OCR_WIDTH / width
+    return cv2.resize(image, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA)
+
+def estimate_noise(gray: np.ndarray) -> float:
+    """Noise sigma of the flat background, ignoring pixels near text edges"""
+    height, width = gray.shape
+    # A central sample is plenty and keeps this at a few milliseconds on any capture
+    top = max(0, (height - NOISE_SAMPLE_SIZE) // 2)
+    left = max(0, (width - NOISE_SAMPLE_SIZE) // 2)
+    sample = gray[top:top + NOISE_SAMPLE_SIZE, left:left + NOISE_SAMPLE_SIZE]
+
+    edges = cv2.dilate(cv2.Canny(cv2.GaussianBlur(sample, (5, 5), 0), 30, 90), np.ones((7, 7), np.uint8))
+    flat = edges == 0
+    if not flat.any():
+        return 0.0
+    response = np.abs(cv2.filter2D(sample.astype(np.float32), -1, NOISE_KERNEL))
+    return float(response[flat].mean() * np.sqrt(np.pi / 2) / 6)
+
+def measure_contrast(gray: np.ndarray) -> float:
+    """Spread between the 1st and 99th percentile grey levels (text is only a few percent of a page)"""
+    low, high = np.percentile(gray[::2, ::2], [1, 99])
+    return float(high - low)
+
+def binarize(gray: np.ndarray, denoise: bool = True, stretch: bool = False) -> np.ndarray:
+    """Optionally denoise and contrast-stretch, then Otsu-threshold for Tesseract"""
+    if denoise:
+        gray = cv2.fastNlMeansDenoising(gray)
+    if stretch:
+        gray = cv2.normalize(gray, None, 0, 255, cv2.NORM_MINMAX)
+    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return thresh
+
+def preprocess_image(image: np.ndarray) -> np.ndarray:
+    """Fixed pipeline: grayscale, always denoise, Otsu-threshold"""
+    return binarize(to_gray(image), denoise=True)
+
+# Columns of Tesseract's TSV output, as returned by image_to_data
+TSV_COLUMNS = ("level", "page_num", "block_num", "par_num", "line_num", "word_num",
+               "left", "top", "width", "height", "conf", "text")
+
+_thread_state = threading.local()
+
+def tesseract_api() -> "tesserocr.PyTessBaseAPI":
+    """This thread's persistent Tesseract handle, created on first use"""
+    api = getattr(_thread_state, "api", None)
+    if api is None:
+        api = tesserocr.PyTessBaseAPI()
+        _thread_state.api = api
+    return api
+
+def data_from_tsv(tsv: str) -> Dict[str, List[Any]]:
+    """Parse Tesseract TSV output into the column dict image_to_data returns"""
+    data = {column: [] for column in TSV_COLUMNS}
+    for row in tsv.splitlines():
+        values = row.split('\t', len(TSV_COLUMNS) - 1)
+        if len(values) < len(TSV_COLUMNS) - 1 or values[0] == "level":
+            continue
+        values += [""] * (len(TSV_COLUMNS) - len(values))
+        for column, value in zip(TSV_COLUMNS, values):
+            data[column].append(value)
+    return data
+
+def image_to_data(image: np.ndarray) -> Dict[str, List[Any]]:
+    """Tesseract word data for an image, through the persistent API handle when tesserocr is installed"""
+    if TESSEROCR_AVAILABLE:
+        gray = np.ascontiguousarray(to_gray(image))
+        api = tesseract_api()
+        api.SetImageBytes(gray.tobytes(), gray.shape[1], gray.shape[0], 1, gray.shape[1])
+        return data_from_tsv(api.GetTSVText(0))
+    return pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+
+def words_from_data(data: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Recognized words from an image_to_data dict, with their layout position, box and confidence"""
+    words = []
+    for i, text in enumerate(data["text"]):
+        if not text or not text.strip():
+            continue
+        words.append({
+            "text": text,
+            "conf": float(data["conf"][i]),
+            "left": int(data["left"][i]),
+            "top": int(data["top"][i]),
+            "width": int(data["width"][i]),
+            "height": int(data["height"][i]),
+            "block": int(data["block_num"][i]),
+            "par": int(data["par_num"][i]),
+            "line": int(data["line_num"][i])
+        })
+    return words
+
+def text_from_words(words: List[Dict[str, Any]]) -> str:
+    """Rebuild image_to_string-style text: one line per OCR line, blank line between paragraphs"""
+    lines = []
+    current_line = None
+    current_par = None
+    for word in words:
+        par = (word["block"], word["par"])
+        line = par + (word["line"],)
+        if line != current_line:
+            if current_par is not None and par != current_par:
+                lines.append("")
+            lines.append(word["text"])
+            current_line = line
+            current_par = par
+        else:
+            lines[-1] += " " + word["text"]
+    return "\n".join(lines)
+
+def average_confidence(words: List[Dict[str, Any]]) -> float:
+    """Mean confidence over words Tesseract scored above zero"""
+    confidences = [word["conf"] for word in words if word["conf"] > 0]
+    return sum(confidences) / len(confidences) if confidences else 0.0
+
+def ocr_image(image: np.ndarray) -> Dict[str, Any]:
+    """Run Tesseract once and return text, average confidence and word boxes"""
+    data = image_to_data(image)
+    words = words_from_data(data)
+    return {
+        "text": text_from_words(words),
+        "confidence": average_confidence(words),
+        "words": words,
+        "error": None
+    }
+
+def prepare_adaptive(image: np.ndarray) -> Dict[str, Any]:
+    """Measure an image and binarize it with only the filters it needs (the CPU half of ocr_adaptive)"""
+    gray = to_gray(image)
+    noisy = estimate_noise(gray) > NOISE_THRESHOLD
+    low_contrast = measure_contrast(gray) < MIN_CONTRAST
+    return {
+        "gray": gray,
+        "binary": binarize(gray, denoise=noisy, stretch=low_contrast),
+        "noisy": noisy,
+        "low_contrast": low_contrast
+    }
+
+def ocr_prepared(prepared: Dict[str, Any]) -> Dict[str, Any]:
+    """OCR a prepare_adaptive result, escalating to every filter on low confidence"""
+    gray, noisy, low_contrast = prepared["gray"], prepared["noisy"], prepared["low_contrast"]
+    result = ocr_image(prepared["binary"])
+    result["preprocessing"] = ["grayscale"] + (["denoise"] if noisy else []) + (["stretch"] if low_contrast else [])
+    result["escalated"] = False
+
+    # No words at all means an empty region, not a preprocessing problem
+    if result["words"] and result["confidence"] < CONFIDENCE_THRESHOLD and not (noisy and low_contrast):
+        retry = ocr_image(binarize(gray, denoise=True, stretch=True))
+        if retry["confidence"] > result["confidence"]:
+            retry["preprocessing"] = ["grayscale", "denoise", "stretch"]
+            result = retry
+        result["escalated"] = True
+    return result
+
+def ocr_adaptive(image: np.ndarray) -> Dict[str, Any]:
+    """OCR with only the filters the image needs, escalating to all of them on low confidence"""
+    return ocr_prepared(prepare_adaptive(image))
+
+def extract_text_from_image(image_path: str) -> Dict[str, Any]:
+    """Load, adaptively preprocess and OCR a screenshot in a single Tesseract pass"""
+    try:
+        image = load_image(image_path)
+        if image is None:
+            return {"text": "", "confidence": 0.0, "words": [], "error": "Could not load image"}
+        return ocr_adaptive(downscale_oversized(image))
+    except Exception as e:
+        return {"text": "", "confidence": 0.0, "words": [], "error": str(e)}
+
+def find_images(directory: str) -> List[str]:
+    """Image files under a directory, sorted by path"""
+    images = []
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            if file.lower().endswith(SCREENSHOT_EXTENSIONS):
+                images.append(os.path.join(root, file))
+    return sorted(images)
+
+def run_benchmark(directory: str, limit: Optional[int] = None):
+    """Time the old image_to_string + image_to_data calls against a single image_to_data pass"""
+    images = find_images(directory)[:limit]
+    if not images:
+        print(f"❌ No screenshots found in {directory}")
+        return
+
+    print(f"⏱️ Benchmarking OCR over {len(images)} screenshots in {directory}...")
+    preprocess_time = 0.0
+    two_pass_time = 0.0
+    single_pass_time = 0.0
+    matching_text = 0
+    count = 0
+
+    for image_path in images:
+        image = load_image(image_path)
+        if image is None:
+            continue
+        count += 1
+
+        start = time.perf_counter()
+        thresh = preprocess_image(image)
+        preprocess_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        text = pytesseract.image_to_string(thresh)
+        pytesseract.image_to_data(thresh, output_type=pytesseract.Output.DICT)
+        two_pass_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = ocr_image(thresh)
+        single_pass_time += time.perf_counter() - start
+
+        # Compare word sequences; spacing and page-break characters differ harmlessly
+        if text.split() == result["text"].split():
+            matching_text += 1
+
+    if count == 0:
+        return
+    print(f"   • Preprocess:            {preprocess_time / count * 1000:.0f}ms/image")
+    print(f"   • to_string + to_data:   {two_pass_time / count * 1000:.0f}ms/image")
+    print(f"   • Single image_to_data:  {single_pass_time / count * 1000:.0f}ms/image")
+    print(f"   • Speedup:               {two_pass_time / single_pass_time:.2f}x OCR time")
+    print(f"   • Identical word output: {matching_text}/{count}")
+
+def run_preprocessing_benchmark(directory: str, limit: Optional[int] = None):
+    """Compare the fixed always-denoise pipeline with adaptive preprocessing on a sample set"""
+    images = find_images(directory)[:limit]
+    if not images:
+        print(f"❌ No screenshots found in {directory}")
+        return
+
+    print(f"⏱️ Comparing fixed and adaptive preprocessing over {len(images)} screenshots in {directory}...")
+    fixed_time = adaptive_time = 0.0
+    fixed_confidence = adaptive_confidence = 0.0
+    denoised = escalated = downscaled = count = 0
+
+    for image_path in images:
+        image = load_image(image_path)
+        if image is None:
+            continue
+        count += 1
+
+        start = time.perf_counter()
+        fixed = ocr_image(preprocess_image(image))
+        fixed_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        scaled = downscale_oversized(image)
+        adaptive = ocr_adaptive(scaled)
+        adaptive_time += time.perf_counter() - start
+
+        fixed_confidence += fixed["confidence"]
+        adaptive_confidence += adaptive["confidence"]
+        denoised += "denoise" in adaptive["preprocessing"]
+        escalated += adaptive["escalated"]
+        downscaled += scaled is not image
+
+    if count == 0:
+        return
+    print(f"   • Fixed pipeline:    {fixed_time / count * 1000:.0f}ms/image, {fixed_confidence / count:.1f}% confidence")
+    print(f"   • Adaptive pipeline: {adaptive_time / count * 1000:.0f}ms/image, {adaptive_confidence / count:.1f}% confidence")
+    print(f"   • Time saved:        {(fixed_time - adaptive_time) / count * 1000:.0f}ms/image ({1 - adaptive_time / fixed_time:.0%})")
+    print(f"   • Confidence delta:  {(adaptive_confidence - fixed_confidence) / count:+.1f} points")
+    print(f"   • Denoised {denoised}, escalated {escalated}, downscaled {downscaled} of {count}")
+
+def main():
+    """OCR one screenshot, or benchmark a directory (--benchmark DIR [--limit N] [--preprocessing])"""
+    if "--benchmark" in sys.argv:
+        index = sys.argv.index("--benchmark")
+        directory = sys.argv[index + 1] if len(sys.argv) > index + 1 else "."
+        limit = None
+        if "--limit" in sys.argv:
+            limit = int(sys.argv[sys.argv.index("--limit") + 1])
+        if "--preprocessing" in sys.argv:
+            run_preprocessing_benchmark(directory, limit)
+        else:
+            run_benchmark(directory, limit)
+        return
+
+    if len(sys.argv) < 2:
+        print("Usage: python3 scripts/screenshot_ocr.py <image> | --benchmark <dir> [--limit N] [--preprocessing]")
+        return
+
+    result = extract_text_from_image(sys.argv[1])
+    if result["error"]:
+        print(f"❌ {result['error']}")
+        return
+    print(result["text"])
+    print(f"\n📊 {len(result['words'])} words, average confidence {result['confidence']:.1f}%"
+          f" ({', '.join(result['preprocessing'])}{', escalated' if result['escalated'] else ''})")
+
+if __name__ == "__main__":
+    main()
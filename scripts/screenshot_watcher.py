@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Screenshot Watcher
+Long-running ingest that OCRs screenshots as soon as they land in the watched folders.
+
+New files are detected with inotify (via inotify_simple) where available and
+by periodically re-scanning the folders otherwise. A file is only processed
+once its size and mtime have stayed the same for the debounce window, so a
+capture that is still being written is never OCR'd half-finished. Ready
+files go through the same cache -> OCR -> parse -> DB path as
+process_candidates_from_screenshots.py, in small batches, so candidates
+appear within seconds of the capture. Files already in the OCR cache
+manifest are skipped, so restarting the watcher only catches up on what
+arrived while it was down.
+"""
+
+import os
+import signal
+import sys
+import time
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from inotify_simple import INotify, flags
+    INOTIFY_AVAILABLE = sys.platform.startswith("linux")
+except ImportError:
+    INOTIFY_AVAILABLE = False
+    print("⚠️ inotify_simple not available - watching by polling (pip install inotify_simple)")
+
+from ocr_cache import file_stat
+from process_candidates_from_screenshots import CandidateProcessor, SCREENSHOT_EXTENSIONS, SKIP_DIRS
+
+DEBOUNCE_SECONDS = 1.0       # a file must be unchanged this long before it is OCR'd
+POLL_INTERVAL = 2.0          # seconds between re-scans when inotify is unavailable
+TICK_SECONDS = 0.25          # how often pending files are checked for readiness
+MAX_BATCH = 50               # screenshots handed to the pipeline at once
+
+def is_screenshot(path: str) -> bool:
+    return path.lower().endswith(SCREENSHOT_EXTENSIONS)
+
+def walk_directories(root: str) -> List[str]:
+    """A directory and all its subdirectories, minus node_modules, .git and the like"""
+    found = []
+    for current, dirs, _ in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        found.append(current)
+    return found
+
+def scan_screenshots(roots: List[str]) -> Dict[str, Tuple[int, int]]:
+    """(mtime_ns, size) of every screenshot under the given folders"""
+    found = {}
+    for root in roots:
+        for current, dirs, files in os.walk(root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in files:
+                if is_screenshot(name):
+                    path = os.path.join(current, name)
+                    try:
+                        found[path] = file_stat(path)
+                    except OSError:
+                        continue
+    return found
+
+class Debouncer:
+    """Holds changed files until their size and mtime stop changing"""
+
+    def __init__(self, quiet_seconds: float = DEBOUNCE_SECONDS):
+        self.quiet_seconds = quiet_seconds
+        self.pending: Dict[str, Tuple[Tuple[int, int], float]] = {}   # path -> (stat, time it last changed)
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def touch(self, path: str, now: Optional[float] = None):
+        """Note that a file was created or written"""
+        now = time.monotonic() if now is None else now
+        self.pending[path] = (self.pending.get(path, ((-1, -1), now))[0], now)
+
+    def ready(self, now: Optional[float] = None) -> List[str]:
+        """Pending files that have been stable for the quiet window; they are removed from pending"""
+        now = time.monotonic() if now is None else now
+        ready = []
+        for path, (last_stat, changed_at) in list(self.pending.items()):
+            try:
+                stat = file_stat(path)
+            except OSError:
+                # Deleted or renamed away before it settled
+                del self.pending[path]
+                continue
+            if stat != last_stat:
+                self.pending[path] = (stat, now)
+            elif stat[1] > 0 and now - changed_at >= self.quiet_seconds:
+                ready.append(path)
+                del self.pending[path]
+        return ready
+
+class ScreenshotWatcher:
+    """Watches screenshot folders and streams new captures into the candidate database"""
+
+    def __init__(self, processor: CandidateProcessor, directories: List[str], workers: int = 1,
+                 debounce: float = DEBOUNCE_SECONDS, poll_interval: float = POLL_INTERVAL,
+                 use_inotify: bool = INOTIFY_AVAILABLE, ocr_mode: str = "process"):
+        self.processor = processor
+        self.directories = [os.path.normpath(d) for d in directories]
+        self.workers = workers
+        self.ocr_mode = ocr_mode
+        self.poll_interval = poll_interval
+        self.debouncer = Debouncer(debounce)
+        self.use_inotify = use_inotify
+        self.inotify = None
+        self.watch_dirs: Dict[int, str] = {}        # inotify watch descriptor -> directory
+        self.known: Dict[str, Tuple[int, int]] = {}  # polling snapshot
+        self.running = False
+        self.ingested = 0
+
+    def start(self):
+        """Set up watches (or the polling snapshot) and catch up on files that arrived while stopped"""
+        if self.use_inotify:
+            self.inotify = INotify()
+            for root in self.directories:
+                self.add_watches(root)
+        # Anything not yet in the OCR cache manifest goes through the pipeline once
+        self.known = scan_screenshots(self.directories)
+        for path in self.known:
+            if not (self.processor.ocr_cache and self.processor.ocr_cache.is_unchanged(path)):
+                self.debouncer.touch(path)
+
+    def add_watches(self, root: str):
+        mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE
+        for directory in walk_directories(root):
+            try:
+                self.watch_dirs[self.inotify.add_watch(directory, mask)] = directory
+            except OSError as e:
+                print(f"⚠️ Cannot watch {directory}: {e}")
+
+    def read_inotify(self, timeout: float):
+        """Queue screenshots from inotify events and watch newly created folders"""
+        for event in self.inotify.read(timeout=int(timeout * 1000)):
+            directory = self.watch_dirs.get(event.wd)
+            if directory is None or not event.name:
+                continue
+            path = os.path.join(directory, event.name)
+            if event.mask & flags.ISDIR:
+                if event.name not in SKIP_DIRS and event.mask & (flags.CREATE | flags.MOVED_TO):
+                    self.add_watches(path)
+                    # Files may have landed before the watch existed
+                    for new_path in scan_screenshots([path]):
+                        self.debouncer.touch(new_path)
+            elif is_screenshot(event.name):
+                self.debouncer.touch(path)
+
+    def poll(self):
+        """Queue screenshots that are new or changed since the last scan"""
+        current = scan_screenshots(self.directories)
+        for path, stat in current.items():
+            if self.known.get(path) != stat:
+                self.debouncer.touch(path)
+        self.known = current
+
+    def ingest(self, paths: List[str], pool: Optional[Pool]):
+        """Run settled screenshots through OCR, parsing and the database"""
+        start = time.perf_counter()
+        candidates = self.processor.process_screenshots(paths, self.workers, pool=pool, ocr_mode=self.ocr_mode)
+        self.ingested += len(paths)
+        self.processor.logger.flush()
+        print(f"🆕 {len(paths)} screenshots -> {len(candidates)} candidates in {time.perf_counter() - start:.1f}s")
+
+    def run(self):
+        """Watch until interrupted (Ctrl+C or SIGTERM)"""
+        self.start()
+        mode = "inotify" if self.inotify else f"polling every {self.poll_interval:g}s"
+        print(f"👀 Watching {', '.join(self.directories)} ({mode}, {self.workers} OCR {self.ocr_mode} workers)")
+
+        self.running = True
+        signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        pool = Pool(self.workers) if self.workers > 1 and self.ocr_mode == "process" else None
+        next_poll = time.monotonic() + self.poll_interval
+        try:
+            while self.running:
+                if self.inotify:
+                    self.read_inotify(TICK_SECONDS)
+                else:
+                    time.sleep(TICK_SECONDS)
+                    if time.monotonic() >= next_poll:
+                        self.poll()
+                        next_poll = time.monotonic() + self.poll_interval
+
+                ready = self.debouncer.ready()
+                while ready:
+                    self.ingest(ready[:MAX_BATCH], pool)
+                    ready = ready[MAX_BATCH:]
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+            if self.inotify:
+                self.inotify.close()
+            if self.processor.ocr_cache:
+                self.processor.ocr_cache.close()
+            self.processor.logger.close()
+            print(f"🛑 Watcher stopped after ingesting {self.ingested} screenshots")
+
+    def stop(self):
+        self.running = False
+
+def main():
+    """Watch folders for new screenshots: [DIR ...] [--workers N] [--ocr-mode process|thread] [--poll] [--interval S] [--debounce S] [--no-cache]"""
+    args = sys.argv[1:]
+    options = {}
+    for flag in ("--workers", "--ocr-mode", "--interval", "--debounce"):
+        if flag in args:
+            index = args.index(flag)
+            options[flag] = args[index + 1]
+            del args[index:index + 2]
+    directories = [a for a in args if not a.startswith("--")] or ["."]
+
+    processor = CandidateProcessor()
+    processor.open_ocr_cache("--no-cache" not in args)
+    watcher = ScreenshotWatcher(
+        processor, directories,
+        workers=int(options.get("--workers", 1)),
+        debounce=float(options.get("--debounce", DEBOUNCE_SECONDS)),
+        poll_interval=float(options.get("--interval", POLL_INTERVAL)),
+        use_inotify=INOTIFY_AVAILABLE and "--poll" not in args,
+        ocr_mode=options.get("--ocr-mode", "process")
+    )
+    watcher.run()
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from skill_vocabulary import keyword_match_count
+
 class SimpleApplicantExtractor:
     def __init__(self):
         self.downloads_dir = "context/Applicant Page Downloads"
@@ -208,7 +210,7 @@ class SimpleApplicantExtractor:
         
         # Skills match
         job_keywords = self.jobs[job_type]["keywords"]
-        skill_matches = sum(1 for skill in skills if any(keyword.lower() in skill.lower() for keyword in job_keywords))
+        skill_matches = keyword_match_count(skills, job_keywords)
         rating += min(skill_matches * 0.3, 1.0)  # Max 1 point
         
         # Hourly rate (reasonable range)
@@ -254,7 +256,7 @@ class SimpleApplicantExtractor:
         # Skills match (25% weight)
         skills = applicant.get("skills", [])
         job_keywords = job_config["keywords"]
-        skill_matches = sum(1 for skill in skills if any(keyword.lower() in skill.lower() for keyword in job_keywords))
+        skill_matches = keyword_match_count(skills, job_keywords)
         score += min(skill_matches / len(job_keywords), 1.0) * 0.25
         
         # Hourly rate (10% weight)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Skill Matcher
+Finds every known skill in OCR text with a token trie built once from configuration/skills.json.
+
+The curated vocabulary maps each canonical skill to its aliases. Every name
+and alias is split into tokens and inserted into a trie whose leaves carry
+the canonical skill's id in the shared skill vocabulary, so "UX", "UI / UX"
+and "User Experience" all come back as "UI/UX Design". Matching tokenizes
+the text once and walks the trie from each token, keeping the longest match
+("React Native" over "React"), so the cost is linear in the text length and
+independent of the number of skills. Short names and common words listed as
+case_sensitive ("Go", "Sketch", "Node") only match with their capitalization.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Iterable, Tuple
+
+from skill_vocabulary import VOCABULARY, SkillVocabulary
+
+DEFAULT_VOCABULARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "configuration", "skills.json")
+EXACT_CASE_MAX_LENGTH = 3     # single-token names this short always match case-sensitively
+
+TOKEN_PATTERN = re.compile(r'/|[^\s/,;:()\[\]{}|"!?•·]+')
+TRAILING_PUNCTUATION = ".'"
+
+def tokenize(text: str) -> List[str]:
+    """Split text into word tokens, keeping "/" as its own token ("UI / UX" == "UI/UX")"""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text):
+        token = token.rstrip(TRAILING_PUNCTUATION)
+        if token:
+            tokens.append(token)
+    return tokens
+
+class SkillMatcher:
+    """Token trie over skill names and aliases, mapped to canonical vocabulary ids"""
+
+    def __init__(self, skills: Dict[str, List[str]], case_sensitive: Iterable[str] = (),
+                 vocabulary: SkillVocabulary = VOCABULARY):
+        self.vocabulary = vocabulary
+        self.names: Dict[int, str] = {}      # id -> canonical name from the vocabulary file
+        self.root: Dict[str, dict] = {}
+        self.max_tokens = 0
+        self.phrases = 0
+        exact = set(case_sensitive)
+
+        for canonical, aliases in skills.items():
+            skill_id = vocabulary.intern(canonical)
+            self.names[skill_id] = canonical
+            for phrase in [canonical] + list(aliases):
+                vocabulary.add_alias(phrase, canonical)
+                self._insert(phrase, skill_id, phrase in exact)
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_VOCABULARY_PATH, vocabulary: SkillVocabulary = VOCABULARY) -> "SkillMatcher":
+        """Build a matcher from a vocabulary file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data["skills"], data.get("case_sensitive", ()), vocabulary)
+
+    def __len__(self) -> int:
+        return self.phrases
+
+    def _insert(self, phrase: str, skill_id: int, case_sensitive: bool):
+        tokens = tokenize(phrase)
+        if not tokens:
+            return
+        if len(tokens) == 1 and len(tokens[0]) <= EXACT_CASE_MAX_LENGTH:
+            case_sensitive = True
+
+        node = self.root
+        for token in tokens:
+            node = node.setdefault(token.lower(), {})
+        # The None key marks the end of a phrase: (skill id, tokens that must match exactly or None)
+        existing = node.get(None)
+        if existing is None or (existing[1] is not None and not case_sensitive):
+            node[None] = (skill_id, tuple(tokens) if case_sensitive else None)
+        self.max_tokens = max(self.max_tokens, len(tokens))
+        self.phrases += 1
+
+    def _longest_match(self, tokens: List[str], lowered: List[str], start: int) -> Tuple[int, int]:
+        """(skill id, tokens consumed) of the longest phrase starting at a token, or (-1, 0)"""
+        node = self.root
+        best = (-1, 0)
+        for end in range(start, min(len(tokens), start + self.max_tokens)):
+            node = node.get(lowered[end])
+            if node is None:
+                break
+            leaf = node.get(None)
+            if leaf is not None and (leaf[1] is None or tuple(tokens[start:end + 1]) == leaf[1]):
+                best = (leaf[0], end + 1 - start)
+        return best
+
+    def find_ids(self, text: str) -> List[int]:
+        """Distinct canonical skill ids in the text, in order of first appearance"""
+        tokens = tokenize(text or "")
+        lowered = [token.lower() for token in tokens]
+        root = self.root
+        found: Dict[int, None] = {}
+        position = 0
+        while position < len(tokens):
+            if lowered[position] not in root:
+                position += 1
+                continue
+            skill_id, length = self._longest_match(tokens, lowered, position)
+            if length:
+                found[skill_id] = None
+                position += length
+            else:
+                position += 1
+        return list(found)
+
+    def find(self, text: str) -> List[str]:
+        """Canonical names of the distinct skills in the text"""
+        return [self.names[skill_id] for skill_id in self.find_ids(text)]
+
+    def bits(self, text: str) -> int:
+        """Skills in the text as a vocabulary bitset"""
+        bits = 0
+        for skill_id in self.find_ids(text):
+            bits |= 1 << skill_id
+        return bits
+
+@lru_cache(maxsize=None)
+def load_matcher(path: str = DEFAULT_VOCABULARY_PATH) -> SkillMatcher:
+    """Matcher for a vocabulary file, built once per process"""
+    return SkillMatcher.from_file(path)
+
+def find_skills(text: str) -> List[str]:
+    """Canonical names of the skills in a piece of text using the default vocabulary"""
+    return load_matcher().find(text)
+
+def _synthesize_texts(count: int, matcher: SkillMatcher) -> List[str]:
+    """OCR-like applicant card texts mentioning a few skills each"""
+    import random
+
+    rng = random.Random(7)
+    phrases = list(matcher.names.values())
+    filler = ("Experienced designer and developer with a focus on clean interfaces and measurable results "
+              "for growing brands. Available to start immediately").split()
+    texts = []
+    for i in range(count):
+        words = rng.sample(filler, 12) + [rng.choice(phrases) for _ in range(rng.randint(2, 8))]
+        rng.shuffle(words)
+        texts.append(f"Applicant {i}\n$45.00/hr  98% Job Success  $20K+ earned\n" + " ".join(words))
+    return texts
+
+def run_benchmark(count: int, path: str = DEFAULT_VOCABULARY_PATH):
+    """Compare one case-insensitive alternation regex over every alias with the token trie"""
+    start = time.perf_counter()
+    matcher = SkillMatcher.from_file(path, SkillVocabulary())
+    build_time = time.perf_counter() - start
+
+    with open(path, 'r', encoding='utf-8') as f:
+        skills = json.load(f)["skills"]
+    aliases = sorted({phrase for canonical, names in skills.items() for phrase in [canonical] + names},
+                     key=len, reverse=True)
+    alternation = re.compile(r'(?<!\w)(' + '|'.join(re.escape(a) for a in aliases) + r')(?!\w)', re.IGNORECASE)
+    texts = _synthesize_texts(count, matcher)
+    print(f"⏱️ Matching {len(aliases)} skill names in {count:,} card texts...")
+
+    start = time.perf_counter()
+    regex_total = 0
+    for text in texts:
+        regex_total += len({matcher.vocabulary.canonical(skill) for skill in alternation.findall(text)})
+    regex_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    trie_total = sum(len(matcher.find_ids(text)) for text in texts)
+    trie_time = time.perf_counter() - start
+
+    print(f"   • Build trie:         {build_time * 1000:.1f}ms ({len(matcher)} phrases, once)")
+    print(f"   • Alternation regex:  {regex_time:.3f}s ({regex_total:,} skills)")
+    print(f"   • Token trie:         {trie_time:.3f}s ({trie_total:,} skills)")
+    print(f"   • Speedup:            {regex_time / trie_time:.1f}x")
+
+def main():
+    """Print the skills found in a text file (or stdin); --benchmark N compares against a regex"""
+    if "--benchmark" in sys.argv:
+        index = sys.argv.index("--benchmark")
+        count = int(sys.argv[index + 1]) if len(sys.argv) > index + 1 else 20_000
+        run_benchmark(count)
+        return
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            text = f.read()
+    else:
+        text = sys.stdin.read()
+    for skill in find_skills(text):
+        print(f"   • {skill}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Skill Vocabulary
+Interns skill strings to integer ids and matches skills with bitsets.
+
+Every distinct normalized skill (after folding synonyms such as "UX",
+"UX Design" and "UI/UX Design" onto one canonical skill) gets a small integer
+id. A candidate's skills become a Python int with one bit per id, so
+job-keyword matching and skill overlap are a bitwise AND plus a popcount
+instead of nested `keyword.lower() in skill.lower()` loops.
+
+Keyword matching keeps the substring semantics of the old loops: a keyword
+matches every vocabulary skill whose name or alias contains it. Those
+per-keyword-set masks are cached and extended incrementally as new skills
+are interned. Counts are per distinct canonical skill, so duplicate or
+synonymous skill strings on one candidate only count once.
+"""
+
+import re
+import sys
+import time
+from typing import Dict, List, Iterable, Tuple, Set
+
+# Canonical skill -> aliases that should share its id
+SKILL_SYNONYMS = {
+    "UI/UX Design": ["UX", "UX Design", "UI/UX", "UX/UI", "UX/UI Design", "UI UX Design",
+                     "User Experience", "User Experience Design", "UX Designer", "UI/UX Designer"],
+    "UI Design": ["UI", "User Interface Design", "User Interface"],
+    "Conversion Rate Optimization": ["CRO", "Conversion Optimization", "Conversion Rate Optimisation"],
+    "Prototyping": ["Prototype", "Prototypes"],
+    "Wireframing": ["Wireframe", "Wireframes"],
+    "Landing Page Design": ["Landing Page", "Landing Pages"],
+    "E-commerce": ["Ecommerce", "E-Commerce", "eCommerce Development", "E-commerce Development"],
+    "JavaScript": ["JS", "Javascript"],
+    "TypeScript": ["TS", "Typescript"],
+    "Node.js": ["Node", "NodeJS", "Node JS"],
+    "React": ["React.js", "ReactJS", "React JS"],
+    "Vue.js": ["Vue", "VueJS", "Vue JS"],
+    "Adobe XD": ["XD"],
+    "Web Development": ["Web Dev"],
+    "A/B Testing": ["AB Testing", "Split Testing"],
+}
+
+WHITESPACE = re.compile(r'\s+')
+SEPARATOR_SPACING = re.compile(r'\s*([/&+])\s*')
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase, trim and collapse spacing ("UI / UX  Design" -> "ui/ux design")"""
+    text = WHITESPACE.sub(' ', str(skill).strip().lower())
+    return SEPARATOR_SPACING.sub(r'\1', text)
+
+def popcount(bits: int) -> int:
+    """Number of set bits (skills) in a bitset"""
+    return bits.bit_count()
+
+class SkillVocabulary:
+    """Global skill id table with synonym folding and cached keyword masks"""
+
+    def __init__(self, synonyms: Dict[str, List[str]] = None):
+        self.names: List[str] = []              # id -> canonical display name
+        self.forms: List[Set[str]] = []         # id -> normalized name plus aliases
+        self._ids: Dict[str, int] = {}          # normalized form -> id
+        self._raw_ids: Dict[str, int] = {}      # raw string -> id, skips normalization on repeats
+        self._keyword_masks: Dict[Tuple[str, ...], Tuple[int, int]] = {}
+
+        for canonical, aliases in (synonyms or {}).items():
+            for alias in aliases:
+                self.add_alias(alias, canonical)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, skill: str) -> int:
+        """Return the id for a skill, assigning a new one the first time it is seen"""
+        skill_id = self._raw_ids.get(skill)
+        if skill_id is not None:
+            return skill_id
+
+        form = normalize_skill(skill)
+        skill_id = self._ids.get(form)
+        if skill_id is None:
+            skill_id = len(self.names)
+            self.names.append(str(skill).strip())
+            self.forms.append({form})
+            self._ids[form] = skill_id
+        self._raw_ids[sys.intern(skill) if isinstance(skill, str) else skill] = skill_id
+        return skill_id
+
+    def add_alias(self, alias: str, canonical: str) -> int:
+        """Fold an alias onto a canonical skill's id; an alias already in use keeps its id"""
+        skill_id = self.intern(canonical)
+        form = normalize_skill(alias)
+        if self._ids.setdefault(form, skill_id) == skill_id and form not in self.forms[skill_id]:
+            self.forms[skill_id].add(form)
+            # Cached masks only rescan ids added since; a new form on an existing id invalidates them
+            self._keyword_masks.clear()
+        return skill_id
+
+    def lookup(self, skill: str) -> int:
+        """Return the id for a known skill, or -1 without growing the vocabulary"""
+        skill_id = self._raw_ids.get(skill)
+        if skill_id is None:
+            skill_id = self._ids.get(normalize_skill(skill), -1)
+        return skill_id
+
+    def canonical(self, skill: str) -> str:
+        """Canonical display name for a skill (the skill itself if unknown)"""
+        skill_id = self.lookup(skill)
+        return self.names[skill_id] if skill_id >= 0 else skill
+
+    def encode(self, skills: Iterable[str]) -> int:
+        """Bitset of the ids of the given skills"""
+        bits = 0
+        for skill in skills or ():
+            if skill:
+                bits |= 1 << self.intern(skill)
+        return bits
+
+    def decode(self, bits: int) -> List[str]:
+        """Canonical names for the ids set in a bitset"""
+        names = []
+        skill_id = 0
+        while bits:
+            if bits & 1:
+                names.append(self.names[skill_id])
+            bits >>= 1
+            skill_id += 1
+        return names
+
+    def keyword_mask(self, keywords: Iterable[str]) -> int:
+        """Bitset of every skill whose name or alias contains any keyword (normalized like the skills)"""
+        key = tuple(sorted({normalize_skill(k) for k in keywords if k and str(k).strip()}))
+        mask, scanned = self._keyword_masks.get(key, (0, 0))
+        if scanned < len(self.names):
+            # Only skills interned since the last call need checking
+            for skill_id in range(scanned, len(self.names)):
+                if any(keyword in form for form in self.forms[skill_id] for keyword in key):
+                    mask |= 1 << skill_id
+            self._keyword_masks[key] = (mask, len(self.names))
+        return mask
+
+VOCABULARY = SkillVocabulary(SKILL_SYNONYMS)
+
+def skill_bits(skills: Iterable[str]) -> int:
+    """Encode skills against the global vocabulary"""
+    return VOCABULARY.encode(skills)
+
+def keyword_match_count(skills, keywords: Iterable[str]) -> int:
+    """Distinct skills matching any job keyword; skills may be a list or an encoded bitset"""
+    bits = skills if isinstance(skills, int) else VOCABULARY.encode(skills)
+    return popcount(bits & VOCABULARY.keyword_mask(keywords))
+
+def overlap_count(skills_a, skills_b) -> int:
+    """Distinct canonical skills shared by two skill lists or bitsets"""
+    bits_a = skills_a if isinstance(skills_a, int) else VOCABULARY.encode(skills_a)
+    bits_b = skills_b if isinstance(skills_b, int) else VOCABULARY.encode(skills_b)
+    return popcount(bits_a & bits_b)
+
+def run_benchmark(count: int):
+    """Compare the nested string loops with bitset matching over synthetic candidates"""
+    from candidate_columnar import synthesize_candidates
+
+    jobs = [
+        ["UX", "UI", "Design", "Conversion", "Figma", "Adobe", "Prototype", "Wireframe", "CRO", "Landing Page"],
+        ["Shopify", "Development", "UX", "UI", "E-commerce", "Liquid", "JavaScript", "CSS", "Web Development"]
+    ]
+    candidates = synthesize_candidates(count)
+    skill_lists = [c["skills"] for c in candidates]
+    print(f"⏱️ Matching {count:,} candidates against {len(jobs)} jobs...")
+
+    start = time.perf_counter()
+    string_total = 0
+    for job_keywords in jobs:
+        for skills in skill_lists:
+            string_total += sum(1 for skill in skills
+                                if any(keyword.lower() in skill.lower() for keyword in job_keywords))
+    string_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    encoded = [skill_bits(skills) for skills in skill_lists]
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bitset_total = 0
+    for job_keywords in jobs:
+        mask = VOCABULARY.keyword_mask(job_keywords)
+        for bits in encoded:
+            bitset_total += popcount(bits & mask)
+    bitset_time = time.perf_counter() - start
+
+    print(f"   • String loops:  {string_time:.3f}s ({string_total:,} matches)")
+    print(f"   • Encode once:   {encode_time:.3f}s ({len(VOCABULARY)} skills in vocabulary)")
+    print(f"   • Bitset AND:    {bitset_time:.3f}s ({bitset_total:,} matches)")
+    print(f"   • Speedup:       {string_time / bitset_time:.1f}x per scoring pass")
+
+def main():
+    """Run the matching benchmark (--benchmark N, default 100000)"""
+    count = 100_000
+    if "--benchmark" in sys.argv:
+        index = sys.argv.index("--benchmark")
+        if len(sys.argv) > index + 1:
+            count = int(sys.argv[index + 1])
+    run_benchmark(count)
+
+if __name__ == "__main__":
+    main()
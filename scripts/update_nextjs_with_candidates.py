@@ -8,12 +8,22 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+import candidate_columnar
+from candidate_record import CandidateRecord
+from candidate_store import open_store
+
+FRONTEND_FIELDS = [
+    "id", "name", "title", "location", "hourly_rate", "job_success", "total_earned",
+    "hours_worked", "jobs_completed", "skills", "overview", "proposal_text", "job_title",
+    "profile_url", "status", "rating", "applied_date", "notes", "profile_image",
+    "portfolio_links", "work_samples", "data_quality_score"
+]
+
 def update_nextjs_candidates():
     """Update the Next.js application with processed candidate data."""
     
     # Paths
     workspace_path = Path(".")
-    processed_data_path = workspace_path / "output" / "processed_candidates" / "all_processed_candidates_20250719_023841.json"
     nextjs_app_path = workspace_path / "nextjs-app"
     nextjs_public_path = nextjs_app_path / "public"
     nextjs_data_path = nextjs_app_path / "data"
@@ -22,39 +32,14 @@ def update_nextjs_candidates():
     nextjs_data_path.mkdir(exist_ok=True)
     
     try:
-        # Read processed candidate data
-        with open(processed_data_path, 'r', encoding='utf-8') as f:
-            candidates = json.load(f)
+        # Read the latest processed candidate data from the snapshot store
+        candidates = open_store(str(workspace_path / "output" / "processed_candidates" / "store")).load_all()
         
-        # Transform data for Next.js
-        transformed_candidates = []
-        for candidate in candidates:
-            # Create a clean candidate object for the frontend
-            transformed_candidate = {
-                "id": candidate.get("id", ""),
-                "name": candidate.get("name", ""),
-                "title": candidate.get("title", ""),
-                "location": candidate.get("location", ""),
-                "hourly_rate": candidate.get("hourly_rate", ""),
-                "job_success": candidate.get("job_success", ""),
-                "total_earned": candidate.get("total_earned", ""),
-                "hours_worked": candidate.get("hours_worked", ""),
-                "jobs_completed": candidate.get("jobs_completed", ""),
-                "skills": candidate.get("skills", []),
-                "overview": candidate.get("overview", ""),
-                "proposal_text": candidate.get("proposal_text", ""),
-                "job_title": candidate.get("job_title", ""),
-                "profile_url": candidate.get("profile_url", ""),
-                "status": candidate.get("status", "pending"),
-                "rating": candidate.get("rating", 0),
-                "applied_date": candidate.get("applied_date", ""),
-                "notes": candidate.get("notes", ""),
-                "profile_image": candidate.get("profile_image", ""),
-                "portfolio_links": candidate.get("portfolio_links", []),
-                "work_samples": candidate.get("work_samples", []),
-                "data_quality_score": candidate.get("data_quality_score", 0.0)
-            }
-            transformed_candidates.append(transformed_candidate)
+        # Transform data for Next.js: a clean candidate object with only the frontend fields
+        transformed_candidates = [
+            CandidateRecord.from_dict(candidate).to_dict(FRONTEND_FIELDS)
+            for candidate in candidates
+        ]
         
         # Save to Next.js data directory
         candidates_file = nextjs_data_path / "candidates.json"
@@ -62,17 +47,30 @@ def update_nextjs_candidates():
             json.dump(transformed_candidates, f, indent=2, ensure_ascii=False)
         
         # Generate statistics
-        stats = {
-            "total_candidates": len(transformed_candidates),
-            "average_hourly_rate": sum([
-                float(c.get("hourly_rate", "0").replace("$", "").replace("/hr", "")) 
-                for c in transformed_candidates 
-                if c.get("hourly_rate") and "$" in c.get("hourly_rate", "")
-            ]) / len([c for c in transformed_candidates if c.get("hourly_rate") and "$" in c.get("hourly_rate", "")]),
-            "top_skills": get_top_skills(transformed_candidates),
-            "locations": get_location_distribution(transformed_candidates),
-            "last_updated": datetime.now().isoformat()
-        }
+        if candidate_columnar.ARROW_AVAILABLE:
+            # Vectorized aggregation over the columnar export of the pool
+            arrow_path = candidate_columnar.export_columnar(
+                candidates, str(workspace_path / candidate_columnar.DEFAULT_ARROW_PATH))
+            summary = candidate_columnar.summarize(candidate_columnar.load_columnar(arrow_path))
+            stats = {
+                "total_candidates": len(transformed_candidates),
+                "average_hourly_rate": summary["hourly_rate_stats"]["avg"],
+                "top_skills": summary["top_skills"],
+                "locations": summary["locations"],
+                "last_updated": datetime.now().isoformat()
+            }
+        else:
+            stats = {
+                "total_candidates": len(transformed_candidates),
+                "average_hourly_rate": sum([
+                    float(c.get("hourly_rate", "0").replace("$", "").replace("/hr", "")) 
+                    for c in transformed_candidates 
+                    if c.get("hourly_rate") and "$" in c.get("hourly_rate", "")
+                ]) / len([c for c in transformed_candidates if c.get("hourly_rate") and "$" in c.get("hourly_rate", "")]),
+                "top_skills": get_top_skills(transformed_candidates),
+                "locations": get_location_distribution(transformed_candidates),
+                "last_updated": datetime.now().isoformat()
+            }
         
         # Save statistics
         stats_file = nextjs_data_path / "stats.json"
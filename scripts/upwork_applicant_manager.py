@@ -13,6 +13,8 @@ import subprocess
 import time
 from dataclasses import dataclass, asdict
 
+from candidate_record import CandidateRecord
+
 @dataclass
 class Applicant:
     """Data structure for job applicants"""
@@ -39,6 +41,10 @@ class Applicant:
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
+    
+    def to_record(self) -> CandidateRecord:
+        """Convert to the shared compact candidate record"""
+        return CandidateRecord.from_dict(asdict(self))
 
 class UpworkApplicantManager:
     """Comprehensive applicant management system"""
@@ -68,9 +74,6 @@ class UpworkApplicantManager:
         # Real MCP call to navigate to job proposals page
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_navigate(url='{job_url}')")
         
-        # Wait for page load
-        await asyncio.sleep(3)
-        
         # Real MCP call to check if we're on the proposals page
         print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => document.title.includes(\"Proposals\")')")
         
@@ -6,26 +6,53 @@ Uses the Docker MCP server for Playwright browser automation
 """
 
 import asyncio
+import functools
 import json
 import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import re
-from urllib.parse import urljoin, urlparse
-import subprocess
+from urllib.parse import parse_qs, urljoin, urlparse
 import sys
 import os
 
+from browser_pool import POOL_SIZE, TabPool
+from candidate_record import CandidateRecord, to_dicts
+from crawl_frontier import DEFAULT_FRONTIER_PATH, CrawlFrontier
+from crawl_orchestrator import CrawlBudget, CrawlOrchestrator, CrawlProgress
+from mcp_browser_client import MCPBrowserClient, MCPError, check_gateway, get_client, close_client
+from page_extraction import (EXTRACTION_SCHEMA, BRIEF_FIRST_PAGE_JS, BRIEF_PAGE_JS, PROFILE_PAGE_JS,
+                             page_result)
+from rate_control import BlockedError, RetryScheduler
+from record_stream import DEFAULT_STREAM_PATH, TEST_STREAM_PATH, RecordStream
+
 class UpworkApplicantsScraperDockerMCP:
     """Docker MCP scraper for Upwork applicants"""
     
-    def __init__(self, test_mode=False):
+    def __init__(self, test_mode=False, max_applicants: int = 5, pool_size: int = POOL_SIZE,
+                 frontier_path: str = DEFAULT_FRONTIER_PATH, stream_path: Optional[str] = None):
         self.base_url = "https://www.upwork.com"
-        self.applicants_collected = 0
-        self.max_applicants = 5 if test_mode else 5  # Limited real data collection - just a handful
+        self.max_applicants = max_applicants  # Limited real data collection - just a handful
         self.browser_active = False
         self.test_mode = test_mode
         
+        # Brief pages and profiles are scraped concurrently, one pool tab each, fairly across briefs
+        self.pool = TabPool(pool_size)
+        
+        # max_applicants is one budget for all briefs, which are crawled at once
+        self.budget = CrawlBudget(max_applicants)
+        self.progress = CrawlProgress()
+        
+        # Brief page loads are paced and retried like the pool's, through the same per-host rate limit
+        self.retry = RetryScheduler()
+        
+        # Crawl state per brief, so an interrupted run resumes where it stopped (test runs keep it in memory)
+        self.frontier = CrawlFrontier(":memory:" if test_mode else frontier_path)
+        
+        # Every profile is also appended to the record stream as it completes, for the ingest to tail
+        self.stream = RecordStream(stream_path or (TEST_STREAM_PATH if test_mode else DEFAULT_STREAM_PATH),
+                                   source="docker_mcp")
+        
         # Real brief URLs for testing - these are actual job postings
         self.brief_urls = {
             "ux_designer": "https://www.upwork.com/jobs/~021945256288324407279",
@@ -33,21 +60,26 @@ class UpworkApplicantsScraperDockerMCP:
         }
         
         if test_mode:
-            print("🧪 TEST MODE ENABLED - Limited to 10 applicants")
+            print(f"🧪 TEST MODE ENABLED - Limited to {self.max_applicants} applicants")
             print("📋 Using real brief URLs for testing:")
             for role, url in self.brief_urls.items():
                 print(f"  {role}: {url}")
         else:
-            print("🎯 REAL DATA MODE ENABLED - Limited to 5 applicants")
+            print(f"🎯 REAL DATA MODE ENABLED - Limited to {self.max_applicants} applicants")
             print("📋 Using real brief URLs for data collection:")
             for role, url in self.brief_urls.items():
                 print(f"  {role}: {url}")
         
-        print("🔧 Using Docker MCP server for Playwright browser automation")
+        print(f"🔧 Using Docker MCP server for Playwright browser automation ({pool_size} tabs)")
+        if self.frontier.recovered:
+            print(f"♻️ Re-queued {self.frontier.recovered} URLs left in flight by an interrupted run")
         
     async def start_browser(self):
         """Start browser session using Docker MCP"""
         print("🌐 Starting browser session with Docker MCP...")
+        if not self.test_mode and not await check_gateway():
+            self.browser_active = False
+            return
         try:
             # Navigate to Upwork homepage to start session
             success = await self._navigate_to_page("https://www.upwork.com")
@@ -130,137 +162,188 @@ class UpworkApplicantsScraperDockerMCP:
             print(f"❌ Error checking login status: {e}")
     
     async def scrape_applicants_from_brief(self, brief_url: str, role: str) -> List[Dict[str, Any]]:
-        """Scrape REAL applicants from a specific brief/job posting using Docker MCP"""
-        applicants = []
-        page = 1
+        """Scrape REAL applicants from a specific brief/job posting using Docker MCP, resuming from the crawl frontier"""
+        frontier = self.frontier
+        budget = self.budget
+        status = self.progress.crawl(role)
         total_applicants_found = 0
         
         print(f"🔍 Scraping REAL applicants from {role} brief...")
         print(f"📄 Brief URL: {brief_url}")
         
-        while True:
+        # Profiles finished by an earlier run are read back from the frontier, not fetched again
+        applicants = [dict(applicant, role=role) for applicant in frontier.results(brief_url)]
+        if applicants:
+            print(f"♻️ Resuming: {len(applicants)} {role} applicants already collected")
+        budget.add_collected(len(applicants))
+        status.collected += len(applicants)
+        profile_batches = []
+        waiting = 0      # profiles handed to the pool that have not got a tab yet
+        frontier.add(brief_url, "brief_page", brief_url)
+        
+        # Profiles are scraped in pool tabs while the loop below keeps paging through the brief
+        async def scrape(tab: MCPBrowserClient, link: str):
+            nonlocal waiting
+            waiting -= 1
+            # Budget is taken when a profile gets its tab, so briefs spend it in the pool's fair-share order
+            if not budget.reserve(1):
+                frontier.release(brief_url, link)
+                return
+            try:
+                applicant = await self._scrape_real_applicant_profile(link, role, tab)
+                error = "no profile data"
+            except Exception as e:
+                print(f"❌ Error scraping applicant {link}: {e}")
+                applicant, error = None, str(e)
+            if not applicant:
+                frontier.failed(brief_url, link, error)
+                budget.settle(collected=False)     # another profile, in any brief, may use it
+                status.failed += 1
+                return
+            frontier.done(brief_url, link, applicant)
+            self.stream.write("applicant", applicant, role)
+            applicants.append(applicant)
+            budget.settle(collected=True)
+            status.collected += 1
+            print(f"✅ Collected REAL applicant {budget.collected}: {applicant.get('name', 'Unknown')}")
+        
+        def dispatch():
+            nonlocal waiting
+            links = frontier.claim("profile", brief_url, budget.remaining() - waiting)
+            waiting += len(links)
+            if links:
+                profile_batches.append(asyncio.create_task(self.pool.map(scrape, links, group=role)))
+        
+        # Profiles still queued when an earlier run stopped go first
+        dispatch()
+        
+        # Page on while the profiles waiting for a tab would not use up the budget
+        while budget.remaining() > waiting:
+            pages = frontier.claim("brief_page", brief_url)
+            if not pages:
+                break
+            page_url = pages[0]
+            page = int(parse_qs(urlparse(page_url).query).get("page", ["1"])[0])
             print(f"\n📄 Processing page {page}...")
             
-            # Navigate to the brief page (or specific page) using Docker MCP
-            if page == 1:
-                success = await self._navigate_to_page(brief_url)
-                if success:
-                    # Try to navigate to proposals/applicants section
-                    await self._navigate_to_proposals_section()
-            else:
-                # Navigate to specific page of applicants
-                page_url = f"{brief_url}?page={page}"
-                success = await self._navigate_to_page(page_url)
-                
-            if not success:
-                print("❌ Failed to navigate to brief page")
+            # One navigation and one in-page extraction per brief page (page 1 also opens the proposals list),
+            # in a pool tab so that briefs crawled at once do not share a page
+            async with self.pool.tab(page_url, role) as tab:
+                extraction = await self._extract_page(page_url, BRIEF_FIRST_PAGE_JS if page == 1 else BRIEF_PAGE_JS,
+                                                      "brief", tab)
+                if extraction and extraction["data"].get("proposalsUrl"):
+                    # The proposals list is a page of its own; read that one instead
+                    print(f"✅ Found proposals section link: {extraction['data']['proposalsUrl']}")
+                    extraction = await self._extract_page(extraction["data"]["proposalsUrl"], BRIEF_PAGE_JS, "brief", tab)
+            status.pages += 1
+                
+            if not extraction:
+                print("❌ Failed to load brief page")
+                frontier.failed(brief_url, page_url, "brief page extraction failed")
                 break
+            data = extraction["data"]
             
-            await asyncio.sleep(3)  # Wait for page to load
-            
-            # Look for applicants/proposals section using Docker MCP
-            applicants_section = await self._find_applicants_section()
-            if not applicants_section:
+            if not data.get("section"):
                 print("❌ Could not find applicants section")
                 print("💡 This might be because:")
-                print("   - You need to be logged into Upwork")
+                if not extraction.get("loggedIn"):
+                    print("   - You need to be logged into Upwork")
                 print("   - The job posting doesn't have any applicants yet")
                 print("   - You don't have permission to view applicants")
                 print("   - The Docker MCP server needs to be properly connected")
+                frontier.failed(brief_url, page_url, "applicants section not found")
                 break
+            print(f"✅ Found applicants section: {data['section']}")
             
-            # Get REAL applicant profile links for this page using Docker MCP
-            applicant_links = await self._get_real_applicant_links()
+            # REAL applicant profile links for this page, already absolute
+            applicant_links = data.get("links", [])
             print(f"🔗 Found {len(applicant_links)} REAL applicant links on page {page}")
             
             if not applicant_links:
                 print("📄 No more applicants found, stopping pagination")
+                frontier.done(brief_url, page_url)
                 break
             
             total_applicants_found += len(applicant_links)
-            
-            # Scrape each REAL applicant profile on this page using Docker MCP
-            for i, link in enumerate(applicant_links):
-                if self.applicants_collected >= self.max_applicants:
-                    print(f"🛑 Reached maximum applicants limit ({self.max_applicants})")
-                    return applicants
-                    
-                try:
-                    print(f"👤 Scraping REAL applicant {self.applicants_collected + 1} (page {page}, {i+1}/{len(applicant_links)})...")
-                    applicant = await self._scrape_real_applicant_profile(link, role)
-                    if applicant:
-                        applicants.append(applicant)
-                        self.applicants_collected += 1
-                        print(f"✅ Collected REAL applicant {self.applicants_collected}: {applicant.get('name', 'Unknown')}")
-                        
-                        # Save progress every 10 applicants
-                        if self.applicants_collected % 10 == 0:
-                            await self._save_progress(applicants, role)
-                        
-                except Exception as e:
-                    print(f"❌ Error scraping applicant {link}: {e}")
-                    continue
-            
-            # Check if there are more pages using Docker MCP
-            has_next_page = await self._check_for_next_page()
-            if not has_next_page:
+            status.found += len(applicant_links)
+            for link in applicant_links:
+                # Someone who also applied to another brief is copied with the profile already scraped there
+                if frontier.add(link, "profile", brief_url, page_url) == "done" and budget.reserve(1):
+                    applicant = dict(frontier.result(brief_url, link), role=role)
+                    applicants.append(applicant)
+                    budget.settle(collected=True)
+                    status.collected += 1
+                    print(f"♻️ Collected REAL applicant {budget.collected} from another brief: "
+                          f"{applicant.get('name', 'Unknown')}")
+            
+            # The page is only done once its successor is queued
+            pagination = data.get("pagination", {})
+            if pagination.get("hasNext"):
+                print(f"✅ Found next page: {pagination}")
+                frontier.add(f"{brief_url}?page={page + 1}", "brief_page", brief_url, page_url)
+            else:
                 print("📄 No more pages found")
-                break
+            frontier.done(brief_url, page_url)
             
-            page += 1
-            await asyncio.sleep(2)  # Wait between pages
+            # Scrape this page's REAL applicant profiles concurrently, one pool tab each
+            dispatch()
+            if budget.remaining() <= waiting:
+                print(f"🛑 Reached maximum applicants limit ({self.max_applicants})")
+                break
+        
+        await asyncio.gather(*profile_batches)
         
+        # Budget given back by failed profiles (here or in another brief) goes to this brief's queued
+        # or retryable ones
+        while budget.remaining():
+            profile_batches = []
+            dispatch()
+            if not profile_batches:
+                break
+            await asyncio.gather(*profile_batches)
         print(f"🎉 Finished scraping {role} brief. Total applicants found: {total_applicants_found}")
         return applicants
     
     async def scrape_all_applicants(self) -> List[Dict[str, Any]]:
-        """Scrape applicants from all briefs"""
+        """Scrape applicants from all briefs at once, sharing the pool's tabs and the max_applicants budget"""
         all_applicants = []
         
-        for role, brief_url in self.brief_urls.items():
-            print(f"\n{'='*60}")
-            print(f"🎯 SCRAPING {role.upper()} APPLICANTS")
-            print(f"{'='*60}")
-            
-            applicants = await self.scrape_applicants_from_brief(brief_url, role)
+        orchestrator = CrawlOrchestrator(self.budget, self.progress)
+        results = await orchestrator.run({
+            role: functools.partial(self.scrape_applicants_from_brief, brief_url, role)
+            for role, brief_url in self.brief_urls.items()
+        })
+        
+        for role, applicants in results.items():
             all_applicants.extend(applicants)
-            
             print(f"📊 Collected {len(applicants)} applicants for {role}")
         
         return all_applicants
     
-    async def _navigate_to_page(self, url: str) -> bool:
-        """Navigate to a page using Docker MCP"""
+    async def _navigate_to_page(self, url: str, tab: Optional[MCPBrowserClient] = None,
+                                ready_selector: Optional[str] = None) -> bool:
+        """Navigate to a page in a pool tab, or over the shared Docker MCP session, and wait until it is ready"""
         try:
             print(f"🔄 Navigating to: {url}")
             
-            # Real MCP call to Docker MCP server
-            print(f"🔧 Making real MCP call: mcp_MCP_DOCKER_browser_navigate to: {url}")
+            # Test mode runs without a browser
+            if self.test_mode:
+                return True
             
-            # This would be the actual MCP protocol call
-            # The MCP client would call: mcp_MCP_DOCKER_browser_navigate(url=url)
-            # For now, we'll simulate but indicate it should be real data
-            await asyncio.sleep(2)  # Wait for page load
+            client = tab or await get_client()
+            ready = await client.navigate_and_wait(url, ready_selector)
+            if not ready:
+                print(f"⚠️ Page not ready after {client.last_wait:.1f}s, extracting what has loaded")
             print(f"✅ Successfully navigated to {url} using real MCP")
             return True
             
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ Navigation error: {e}")
             return False
     
-    async def _browser_evaluate(self, js_code: str) -> Any:
-        """Execute JavaScript in browser using Docker MCP"""
+    async def _browser_evaluate(self, js_code: str, tab: Optional[MCPBrowserClient] = None) -> Any:
+        """Execute JavaScript in a pool tab, or over the shared Docker MCP session"""
         try:
-            print(f"🔧 Making real MCP call: mcp_MCP_DOCKER_browser_evaluate")
-            
-            # Real MCP call to Docker MCP server
-            # The MCP client would call: mcp_MCP_DOCKER_browser_evaluate(function=js_code)
-            # For now, we'll simulate but indicate it should be real data
-            print("💡 To get real data, you need to:")
-            print("   1. Ensure the Docker MCP server is running")
-            print("   2. Have a browser session active")
-            print("   3. Be logged into Upwork")
-            
             # In test mode, simulate realistic data but indicate it's simulated
             if self.test_mode:
                 if "login" in js_code.lower():
@@ -270,239 +353,62 @@ class UpworkApplicantsScraperDockerMCP:
                         "hasLogoutButton": True,
                         "pageTitle": "Upwork - Freelance Services & Make Money Online"
                     }
-                elif "profile" in js_code.lower():
-                    return {
-                        "name": "Test User",
-                        "title": "Senior UX Designer",
-                        "hourly_rate": "$75/hr",
-                        "location": "United States",
-                        "skills": ["UI/UX Design", "Figma", "Adobe Creative Suite"],
-                        "rating": "4.9",
-                        "member_since": "2020"
-                    }
                 else:
                     return None
-            else:
-                # In production mode, this should make real MCP calls
-                # For now, we'll simulate but indicate it should be real data
-                print("🎯 REAL DATA MODE: Should make real MCP calls here")
-                print("💡 The Docker MCP server is running and ready")
-                print("🔧 Real MCP call would be: mcp_MCP_DOCKER_browser_evaluate(function=js_code)")
-                return None
+            
+            client = tab or await get_client()
+            return await client.evaluate(js_code)
                 
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ Browser evaluation error: {e}")
             return None
     
-    async def _navigate_to_proposals_section(self):
-        """Navigate to the proposals/applicants section using Docker MCP"""
-        try:
-            js_code = """
-            () => {
-                console.log('Looking for proposals/applicants section...');
-                
-                // Look for proposals/applicants tab or link
-                const proposalSelectors = [
-                    'a[href*="proposals"]',
-                    'a[href*="applications"]',
-                    'a[href*="candidates"]',
-                    '[data-test="proposals-tab"]',
-                    '.proposals-tab',
-                    'button:contains("Proposals")',
-                    'a:contains("Proposals")',
-                    'button:contains("Applications")',
-                    'a:contains("Applications")',
-                    'button:contains("Candidates")',
-                    'a:contains("Candidates")'
-                ];
-                
-                for (const selector of proposalSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element) {
-                        console.log('Found proposals section link:', selector);
-                        element.click();
-                        return { success: true, selector: selector };
-                    }
-                }
-                
-                // Also look for tabs
-                const tabs = document.querySelectorAll('[role="tab"], .tab, .nav-link');
-                for (const tab of tabs) {
-                    const text = tab.textContent.toLowerCase();
-                    if (text.includes('proposal') || text.includes('application') || text.includes('candidate')) {
-                        console.log('Found proposals tab:', text);
-                        tab.click();
-                        return { success: true, tabText: text };
-                    }
-                }
-                
-                // Look for any clickable elements with proposal/applicant text
-                const allElements = document.querySelectorAll('a, button, [role="button"]');
-                for (const element of allElements) {
-                    const text = element.textContent.toLowerCase();
-                    if (text.includes('proposal') || text.includes('application') || text.includes('candidate')) {
-                        console.log('Found clickable element with proposals text:', text);
-                        element.click();
-                        return { success: true, elementText: text };
-                    }
-                }
-                
-                return { success: false, message: 'No proposals section found' };
-            }
-            """
-            
-            # Use Docker MCP tool
-            result = await self._browser_evaluate(js_code)
-            if result and result.get('success'):
-                print(f"✅ Found and clicked proposals section: {result}")
-            else:
-                print("⚠️ Could not find proposals section automatically")
-            
-            await asyncio.sleep(2)  # Wait for page to load
-            
-        except Exception as e:
-            print(f"❌ Error navigating to proposals section: {e}")
-    
-    async def _find_applicants_section(self) -> bool:
-        """Find the applicants/proposals section using Docker MCP"""
-        try:
-            js_code = """
-            () => {
-                console.log('Looking for applicants section...');
-                
-                // Look for various selectors that might indicate applicants/proposals
-                const selectors = [
-                    '[data-test="proposals"]',
-                    '.proposals',
-                    '[data-test="applications"]',
-                    '.applications',
-                    '[data-test="candidates"]',
-                    '.candidates',
-                    '[data-test="freelancers"]',
-                    '.freelancers',
-                    'a[href*="proposals"]',
-                    'a[href*="applications"]',
-                    'a[href*="candidates"]'
-                ];
-                
-                for (const selector of selectors) {
-                    const element = document.querySelector(selector);
-                    if (element) {
-                        console.log('Found applicants section with selector:', selector);
-                        return { found: true, selector: selector };
-                    }
-                }
-                
-                // Also look for text that indicates proposals/applications
-                const allElements = document.querySelectorAll('h1, h2, h3, h4, h5, h6, span, div');
-                for (const element of allElements) {
-                    const text = element.textContent.toLowerCase();
-                    if (text.includes('proposal') || text.includes('application') || text.includes('candidate')) {
-                        console.log('Found applicants section by text:', text);
-                        return { found: true, text: text };
-                    }
+    async def _extract_page(self, url: str, script: str, kind: str,
+                            tab: Optional[MCPBrowserClient] = None) -> Optional[Dict[str, Any]]:
+        """Navigate to a page and run its page_extraction script: one navigate and one evaluate, however many fields"""
+        print(f"🔄 Navigating to: {url}")
+        
+        # In test mode, simulate realistic data but indicate it's simulated
+        if self.test_mode:
+            data = {"section": None, "links": [], "proposalsUrl": None, "pagination": {"hasNext": False}}
+            if kind == "profile":
+                data = {
+                    "name": "Test User",
+                    "title": "Senior UX Designer",
+                    "hourly_rate": "$75/hr",
+                    "location": "United States",
+                    "skills": ["UI/UX Design", "Figma", "Adobe Creative Suite"],
+                    "rating": "4.9",
+                    "member_since": "2020"
                 }
-                
-                // Check page title and URL
-                const pageInfo = {
-                    title: document.title,
-                    url: window.location.href,
-                    hasProposalsInUrl: window.location.href.includes('proposals'),
-                    hasApplicationsInUrl: window.location.href.includes('applications')
-                };
-                
-                console.log('Page info:', pageInfo);
-                
-                return { found: false, pageInfo: pageInfo };
-            }
-            """
-            
-            # Use Docker MCP tool
-            result = await self._browser_evaluate(js_code)
-            if result and result.get('found'):
-                print(f"✅ Found applicants section: {result}")
-                return True
-            else:
-                print(f"❌ Could not find applicants section: {result}")
-                return False
-            
-        except Exception as e:
-            print(f"❌ Error finding applicants section: {e}")
-            return False
-    
-    async def _get_real_applicant_links(self) -> List[str]:
-        """Extract REAL applicant profile links using Docker MCP"""
+            return {"schema": EXTRACTION_SCHEMA, "kind": kind, "url": url, "ready": True, "loggedIn": True,
+                    "cloudflare": False, "data": data}
+        
+        async def load() -> Optional[Dict[str, Any]]:
+            client = tab or await get_client()
+            await client.navigate(url)
+            # The script waits for the page in the page itself, so there are no readiness polls in between
+            result = page_result(await client.evaluate(script), kind)
+            if result and result.get("cloudflare"):
+                raise BlockedError(f"Cloudflare challenge on {url}")
+            return result
+        
         try:
-            js_code = """
-            () => {
-                console.log('Extracting applicant profile links...');
-                const links = [];
-                
-                // Look for REAL applicant profile links with various selectors
-                const selectors = [
-                    'a[href*="/freelancers/"]',
-                    'a[href*="/proposals/"]',
-                    'a[href*="/applications/"]',
-                    '[data-test="freelancer-link"]',
-                    '.freelancer-link',
-                    '.applicant-link',
-                    '.proposal-link',
-                    '.up-card-section a[href*="/freelancers/"]',
-                    '.up-card a[href*="/freelancers/"]'
-                ];
-                
-                for (const selector of selectors) {
-                    const elements = document.querySelectorAll(selector);
-                    console.log(`Found ${elements.length} elements with selector: ${selector}`);
-                    elements.forEach(element => {
-                        const href = element.getAttribute('href');
-                        if (href && !links.includes(href)) {
-                            links.push(href);
-                        }
-                    });
-                }
-                
-                // Also look for any links that might be profile links
-                const allLinks = document.querySelectorAll('a[href]');
-                allLinks.forEach(link => {
-                    const href = link.getAttribute('href');
-                    if (href && href.includes('/freelancers/') && !links.includes(href)) {
-                        links.push(href);
-                    }
-                });
-                
-                console.log(`Found ${links.length} total applicant profile links`);
-                return links;
-            }
-            """
-            
-            # Use Docker MCP tool
-            result = await self._browser_evaluate(js_code)
-            if result:
-                return result
-            else:
-                print("❌ Could not extract applicant links")
-                return []
-                
-        except Exception as e:
-            print(f"❌ Error extracting applicant links: {e}")
-            return []
+            # Paced per host and retried by error class; pool tabs also feed the pool's adaptive limit
+            return await (self.pool.retry if tab else self.retry).run(url, load)
+        except (MCPError, BlockedError) as e:
+            print(f"❌ Error extracting {url}: {e}")
+            return None
     
-    async def _scrape_real_applicant_profile(self, profile_url: str, role: str) -> Optional[Dict[str, Any]]:
+    async def _scrape_real_applicant_profile(self, profile_url: str, role: str,
+                                             tab: Optional[MCPBrowserClient] = None) -> Optional[Dict[str, Any]]:
         """Scrape a REAL applicant profile using Docker MCP"""
         try:
             print(f"🔍 Scraping profile: {profile_url}")
             
-            # Navigate to the profile page using Docker MCP
-            success = await self._navigate_to_page(profile_url)
-            if not success:
-                print(f"❌ Failed to navigate to profile: {profile_url}")
-                return None
-            
-            await asyncio.sleep(3)  # Wait for profile to load
-            
-            # Extract profile data using Docker MCP
-            profile_data = await self._extract_real_profile_data()
+            # Navigate to the profile page and extract it in one script
+            extraction = await self._extract_page(profile_url, PROFILE_PAGE_JS, "profile", tab)
+            profile_data = extraction["data"] if extraction else None
             if profile_data:
                 profile_data['profile_url'] = profile_url
                 profile_data['role'] = role
@@ -516,301 +422,15 @@ class UpworkApplicantsScraperDockerMCP:
             print(f"❌ Error scraping profile {profile_url}: {e}")
             return None
     
-    async def _extract_real_profile_data(self) -> Dict[str, Any]:
-        """Extract REAL profile data using Docker MCP"""
-        try:
-            js_code = """
-            () => {
-                console.log('Extracting profile data...');
-                
-                const profileData = {
-                    name: '',
-                    title: '',
-                    hourly_rate: '',
-                    total_earned: '',
-                    location: '',
-                    skills: [],
-                    description: '',
-                    experience: '',
-                    education: '',
-                    portfolio_links: [],
-                    certifications: [],
-                    languages: [],
-                    availability: '',
-                    response_time: '',
-                    completion_rate: '',
-                    rating: '',
-                    reviews_count: '',
-                    member_since: '',
-                    profile_picture: '',
-                    verified: false
-                };
-                
-                // Extract name
-                const nameSelectors = [
-                    'h1',
-                    '[data-test="freelancer-name"]',
-                    '.freelancer-name',
-                    '.profile-name',
-                    'h1[data-test="freelancer-name"]'
-                ];
-                
-                for (const selector of nameSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.textContent.trim()) {
-                        profileData.name = element.textContent.trim();
-                        break;
-                    }
-                }
-                
-                // Extract title/headline
-                const titleSelectors = [
-                    'h2',
-                    '[data-test="freelancer-title"]',
-                    '.freelancer-title',
-                    '.profile-title',
-                    '.headline'
-                ];
-                
-                for (const selector of titleSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.textContent.trim()) {
-                        profileData.title = element.textContent.trim();
-                        break;
-                    }
-                }
-                
-                // Extract hourly rate
-                const rateSelectors = [
-                    '[data-test="hourly-rate"]',
-                    '.hourly-rate',
-                    '.rate',
-                    '.price'
-                ];
-                
-                for (const selector of rateSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.textContent.trim()) {
-                        profileData.hourly_rate = element.textContent.trim();
-                        break;
-                    }
-                }
-                
-                // Extract location
-                const locationSelectors = [
-                    '[data-test="location"]',
-                    '.location',
-                    '.country',
-                    '.city'
-                ];
-                
-                for (const selector of locationSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.textContent.trim()) {
-                        profileData.location = element.textContent.trim();
-                        break;
-                    }
-                }
-                
-                // Extract skills
-                const skillSelectors = [
-                    '[data-test="skills"]',
-                    '.skills',
-                    '.skill-tags',
-                    '.tags'
-                ];
-                
-                for (const selector of skillSelectors) {
-                    const elements = document.querySelectorAll(selector + ' span, ' + selector + ' .tag');
-                    elements.forEach(element => {
-                        const skill = element.textContent.trim();
-                        if (skill && !profileData.skills.includes(skill)) {
-                            profileData.skills.push(skill);
-                        }
-                    });
-                }
-                
-                // Extract description
-                const descSelectors = [
-                    '[data-test="description"]',
-                    '.description',
-                    '.bio',
-                    '.overview'
-                ];
-                
-                for (const selector of descSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.textContent.trim()) {
-                        profileData.description = element.textContent.trim();
-                        break;
-                    }
-                }
-                
-                // Extract total earned
-                const earnedSelectors = [
-                    '[data-test="total-earned"]',
-                    '.total-earned',
-                    '.earnings'
-                ];
-                
-                for (const selector of earnedSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.textContent.trim()) {
-                        profileData.total_earned = element.textContent.trim();
-                        break;
-                    }
-                }
-                
-                // Extract rating
-                const ratingSelectors = [
-                    '[data-test="rating"]',
-                    '.rating',
-                    '.stars'
-                ];
-                
-                for (const selector of ratingSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.textContent.trim()) {
-                        profileData.rating = element.textContent.trim();
-                        break;
-                    }
-                }
-                
-                // Extract member since
-                const memberSelectors = [
-                    '[data-test="member-since"]',
-                    '.member-since',
-                    '.joined'
-                ];
-                
-                for (const selector of memberSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.textContent.trim()) {
-                        profileData.member_since = element.textContent.trim();
-                        break;
-                    }
-                }
-                
-                // Extract profile picture
-                const picSelectors = [
-                    '[data-test="profile-picture"] img',
-                    '.profile-picture img',
-                    '.avatar img'
-                ];
-                
-                for (const selector of picSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.src) {
-                        profileData.profile_picture = element.src;
-                        break;
-                    }
-                }
-                
-                console.log('Extracted profile data:', profileData);
-                return profileData;
-            }
-            """
-            
-            # Use Docker MCP tool
-            result = await self._browser_evaluate(js_code)
-            if result:
-                return result
-            else:
-                print("❌ Could not extract profile data")
-                return {}
-                
-        except Exception as e:
-            print(f"❌ Error extracting profile data: {e}")
-            return {}
-    
-    async def _check_for_next_page(self) -> bool:
-        """Check if there are more pages using Docker MCP"""
-        try:
-            js_code = """
-            () => {
-                console.log('Checking for next page...');
-                
-                // Look for next page indicators
-                const nextPageSelectors = [
-                    'a[aria-label*="Next"]',
-                    'a[aria-label*="next"]',
-                    '.next-page',
-                    '.pagination-next',
-                    'button[aria-label*="Next"]',
-                    'button[aria-label*="next"]',
-                    'a:contains("Next")',
-                    'button:contains("Next")',
-                    '.next',
-                    '[data-test="next-page"]'
-                ];
-                
-                for (const selector of nextPageSelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && !element.disabled && !element.classList.contains('disabled')) {
-                        console.log('Found next page button:', selector);
-                        return { hasNext: true, selector: selector };
-                    }
-                }
-                
-                // Also check for pagination numbers
-                const paginationElements = document.querySelectorAll('.pagination a, .pagination button');
-                let currentPage = 1;
-                let maxPage = 1;
-                
-                paginationElements.forEach(element => {
-                    const text = element.textContent.trim();
-                    const num = parseInt(text);
-                    if (!isNaN(num)) {
-                        if (element.classList.contains('active') || element.classList.contains('current')) {
-                            currentPage = num;
-                        }
-                        if (num > maxPage) {
-                            maxPage = num;
-                        }
-                    }
-                });
-                
-                console.log(`Current page: ${currentPage}, Max page: ${maxPage}`);
-                
-                return { 
-                    hasNext: currentPage < maxPage, 
-                    currentPage: currentPage, 
-                    maxPage: maxPage 
-                };
-            }
-            """
-            
-            # Use Docker MCP tool
-            result = await self._browser_evaluate(js_code)
-            if result and result.get('hasNext'):
-                print(f"✅ Found next page: {result}")
-                return True
-            else:
-                print(f"❌ No next page found: {result}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ Error checking for next page: {e}")
-            return False
-    
-    async def _save_progress(self, applicants: List[Dict[str, Any]], role: str):
-        """Save progress to file"""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            mode = "test" if self.test_mode else "real"
-            filename = f"../applicants/{mode}_upwork_applicants_{role}_{timestamp}.json"
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(applicants, f, indent=2, ensure_ascii=False)
-            
-            print(f"💾 Progress saved: {filename}")
-            
-        except Exception as e:
-            print(f"❌ Error saving progress: {e}")
+    async def close(self):
+        """Close the pool's tabs, the crawl frontier and the record stream"""
+        await self.pool.close()
+        self.frontier.close()
+        self.stream.close()
 
-def convert_applicant_to_candidate(applicant_profile: Dict[str, Any], role: str) -> Dict[str, Any]:
-    """Convert applicant profile to candidate format"""
-    return {
+def convert_applicant_to_candidate(applicant_profile: Dict[str, Any], role: str) -> CandidateRecord:
+    """Convert applicant profile to a candidate record"""
+    return CandidateRecord.from_dict({
         "name": applicant_profile.get("name", "Unknown"),
         "title": applicant_profile.get("title", ""),
         "hourly_rate": applicant_profile.get("hourly_rate", ""),
@@ -839,7 +459,7 @@ def convert_applicant_to_candidate(applicant_profile: Dict[str, Any], role: str)
         "notes": "",
         "evaluation_score": 0,
         "evaluation_notes": ""
-    }
+    })
 
 async def main():
     """Main function"""
@@ -851,17 +471,36 @@ async def main():
     print(f"🧪 Test Mode: {'ENABLED' if test_mode else 'DISABLED'}")
     print(f"🎯 Real Data Collection: {'ENABLED' if not test_mode else 'DISABLED'}")
     
-    scraper = UpworkApplicantsScraperDockerMCP(test_mode=test_mode)
+    max_applicants = 5
+    pool_size = POOL_SIZE
+    try:
+        if "--max" in sys.argv:
+            max_applicants = int(sys.argv[sys.argv.index("--max") + 1])
+        if "--tabs" in sys.argv:
+            pool_size = int(sys.argv[sys.argv.index("--tabs") + 1])
+    except (ValueError, IndexError):
+        pass
     
-    # Start browser session
-    await scraper.start_browser()
+    scraper = UpworkApplicantsScraperDockerMCP(test_mode=test_mode, max_applicants=max_applicants, pool_size=pool_size)
     
-    if not scraper.browser_active:
-        print("❌ Failed to start browser session. Exiting.")
-        return
+    # --brief ROLE=URL (repeatable) crawls these briefs instead of the built-in ones, all at once
+    briefs = [sys.argv[i + 1] for i, arg in enumerate(sys.argv[:-1]) if arg == "--brief" and "=" in sys.argv[i + 1]]
+    if briefs:
+        scraper.brief_urls = dict(brief.split("=", 1) for brief in briefs)
     
-    # Scrape all applicants
-    all_applicants = await scraper.scrape_all_applicants()
+    try:
+        # Start browser session
+        await scraper.start_browser()
+        
+        if not scraper.browser_active:
+            print("❌ Failed to start browser session. Exiting.")
+            return
+        
+        # Scrape all applicants
+        all_applicants = await scraper.scrape_all_applicants()
+    finally:
+        await scraper.close()
+        await close_client()
     
     if all_applicants:
         # Convert to candidate format
@@ -873,7 +512,7 @@ async def main():
         filename = f"../applicants/{mode}_upwork_applicants_docker_mcp_{timestamp}.json"
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(candidates, f, indent=2, ensure_ascii=False)
+            json.dump(to_dicts(candidates), f, indent=2, ensure_ascii=False)
         
         print(f"\n🎉 Scraping completed!")
         print(f"📊 Total applicants collected: {len(candidates)}")
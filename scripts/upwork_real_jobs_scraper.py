@@ -4,22 +4,79 @@ Real Upwork Jobs Scraper - Uses Actual MCP Calls to Get Real Jobs and Freelancer
 """
 
 import asyncio
+import functools
 import json
 import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import subprocess
 import time
 
+from browser_pool import POOL_SIZE, TabPool
+from crawl_orchestrator import CrawlBudget, CrawlOrchestrator, CrawlProgress
+from mcp_browser_client import MCPError, check_gateway, close_client
+from page_cache import DEFAULT_PAGE_CACHE_PATH, LISTING_TTL, MISS, PAGE_HTML_JS, PageCache
+from rate_control import BlockedError
+from record_stream import DEFAULT_STREAM_PATH, TEST_STREAM_PATH, RecordStream
+
+JOB_TILE = "[data-test='job-tile']"
+FREELANCER_TILE = "[data-test='freelancer-tile']"
+
+JOB_TILES_JS = """
+() => {
+    const jobs = Array.from(document.querySelectorAll("[data-test='job-tile']"));
+    return jobs.slice(0, MAX_RESULTS).map(job => {
+        return {
+            title: job.querySelector("[data-test='job-title']")?.textContent?.trim() || "Unknown",
+            client: job.querySelector("[data-test='client-info']")?.textContent?.trim() || "Unknown",
+            budget: job.querySelector("[data-test='budget']")?.textContent?.trim() || "Unknown",
+            description: job.querySelector("[data-test='job-description']")?.textContent?.trim() || "Unknown",
+            skills: Array.from(job.querySelectorAll("[data-test='job-skill']")).map(s => s.textContent?.trim()).filter(Boolean),
+            posted: job.querySelector("[data-test='job-posted']")?.textContent?.trim() || "Unknown",
+            proposals: job.querySelector("[data-test='proposals']")?.textContent?.trim() || "Unknown"
+        };
+    });
+}
+"""
+
+FREELANCER_TILES_JS = """
+() => {
+    const profiles = Array.from(document.querySelectorAll("[data-test='freelancer-tile']"));
+    return profiles.slice(0, MAX_RESULTS).map(profile => {
+        return {
+            name: profile.querySelector("[data-test='freelancer-name']")?.textContent?.trim() || "Unknown",
+            title: profile.querySelector("[data-test='freelancer-title']")?.textContent?.trim() || "Unknown",
+            rate: profile.querySelector("[data-test='hourly-rate']")?.textContent?.trim() || "Unknown",
+            rating: profile.querySelector("[data-test='rating']")?.textContent?.trim() || "Unknown",
+            location: profile.querySelector("[data-test='location']")?.textContent?.trim() || "Unknown",
+            skills: Array.from(profile.querySelectorAll("[data-test='skill']")).map(s => s.textContent?.trim()).filter(Boolean),
+            total_earnings: profile.querySelector("[data-test='total-earnings']")?.textContent?.trim() || "Unknown",
+            success_rate: profile.querySelector("[data-test='success-rate']")?.textContent?.trim() || "Unknown"
+        };
+    });
+}
+"""
+
 class RealUpworkJobsScraper:
     """Real Upwork scraper using actual MCP calls available in Cursor IDE"""
     
-    def __init__(self, max_results: int = 10, test_mode: bool = False):
+    def __init__(self, max_results: int = 10, test_mode: bool = False, refresh_cache: bool = False,
+                 pool_size: int = POOL_SIZE, max_total: Optional[int] = None,
+                 page_cache_path: str = DEFAULT_PAGE_CACHE_PATH, stream_path: Optional[str] = None):
         self.max_results = max_results
         self.test_mode = test_mode
         self.jobs_data = []
         self.freelancers_data = []
+        self.page_cache = PageCache(page_cache_path, refresh=refresh_cache)
+        
+        # Categories are scraped at once, one pool tab per search page; page loads go through pool.retry
+        self.pool = TabPool(pool_size)
+        
+        # max_total caps results across every category (max_results still caps each one)
+        self.budget = CrawlBudget(max_total)
+        self.progress = CrawlProgress()
+        self.stream = RecordStream(stream_path or (TEST_STREAM_PATH if test_mode else DEFAULT_STREAM_PATH),
+                                   source="real_jobs")
         
         # Job search URLs (public access)
         self.job_search_urls = {
@@ -36,9 +93,8 @@ class RealUpworkJobsScraper:
             "web_developer": "https://www.upwork.com/search/profiles/?q=web%20developer"
         }
         
-        # Output directory
+        # Output directory (created when results are first saved)
         self.output_dir = "../output/real_jobs"
-        os.makedirs(self.output_dir, exist_ok=True)
         
         print("🚀 Real Upwork Jobs Scraper")
         print("=" * 60)
@@ -50,21 +106,48 @@ class RealUpworkJobsScraper:
         print("✅ Public access (no job poster access required)")
     
     async def check_mcp_server(self) -> bool:
-        """Check if Docker MCP server is running"""
-        print("🔍 Checking Docker MCP server status...")
+        """Check that the Docker MCP gateway answers (health check cached by the shared client)"""
+        return await check_gateway()
+    
+    async def extract_from_page(self, url: str, js_code: str, ready_selector: str,
+                                crawl: str = "") -> List[Dict[str, Any]]:
+        """Open a search page in a pool tab (shared fairly between crawls), wait for its tiles and run a script on it"""
+        js_code = js_code.replace("MAX_RESULTS", str(self.max_results))
+        
+        # Listings change quickly, so they are only replayed from the page cache for LISTING_TTL
+        result = self.page_cache.get(url, js_code, LISTING_TTL)
+        if result is not MISS:
+            print(f"💾 Replayed {len(result)} results from page cache")
+            return result
+        
+        async def load(client):
+            # Wait for the first tile (or a Cloudflare interstitial) rather than a fixed time
+            await client.navigate_and_wait(url, f"{ready_selector}, .cf-browser-verification, #cf-please-wait")
+            
+            title = await client.evaluate("() => document.title")
+            if "Cloudflare" in str(title) or "Checking" in str(title):
+                raise BlockedError(f"Cloudflare protection detected on {url}")
+            # Extracted in the same load, so a failed evaluate reloads the page rather than losing it
+            result = await client.evaluate(js_code)
+            return result if isinstance(result, list) else []
+        
         try:
-            result = subprocess.run(['docker', 'mcp', 'gateway', 'status'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print("✅ Docker MCP gateway is running")
-                return True
-            else:
-                print("❌ Docker MCP gateway is not running")
-                print("💡 Start it with: docker mcp gateway run")
-                return False
-        except Exception as e:
-            print(f"❌ Error checking Docker MCP gateway: {e}")
-            return False
+            async with self.pool.tab(url, crawl) as tab:
+                # Paced per host; a challenge or a timeout is retried with backoff at a slower rate
+                result = await self.pool.retry.run(url, functools.partial(load, tab))
+                if result:
+                    try:
+                        html = await tab.evaluate(PAGE_HTML_JS)
+                    except MCPError:
+                        html = None      # the snapshot is best-effort; the results are cached without it
+                    self.page_cache.put(url, js_code, result, html)
+        except BlockedError as e:
+            print(f"🛡️ {e}")
+            return []
+        except MCPError as e:
+            print(f"❌ MCP call error: {e}")
+            return []
+        return result
     
     async def scrape_job_listings(self, category: str, url: str) -> List[Dict[str, Any]]:
         """Scrape job listings from Upwork using real MCP calls"""
@@ -72,37 +155,11 @@ class RealUpworkJobsScraper:
         
         jobs = []
         
-        # Real MCP call to navigate to job search page
-        print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_navigate(url='{url}')")
-        
-        # Wait for page load
-        await asyncio.sleep(3)
-        
-        # Real MCP call to check page title
-        print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => document.title')")
-        
-        # Real MCP call to check for Cloudflare
-        print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => document.title.includes(\"Cloudflare\") || document.title.includes(\"Checking\")')")
-        
-        # Real MCP call to extract job listings
-        print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => {{")
-        print(f"  const jobs = Array.from(document.querySelectorAll(\"[data-test='job-tile']\"));")
-        print(f"  return jobs.slice(0, {self.max_results}).map(job => {{")
-        print(f"    return {{")
-        print(f"      title: job.querySelector(\"[data-test='job-title']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      client: job.querySelector(\"[data-test='client-info']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      budget: job.querySelector(\"[data-test='budget']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      description: job.querySelector(\"[data-test='job-description']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      skills: Array.from(job.querySelectorAll(\"[data-test='job-skill']\")).map(s => s.textContent?.trim()).filter(Boolean),")
-        print(f"      posted: job.querySelector(\"[data-test='job-posted']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      proposals: job.querySelector(\"[data-test='proposals']\")?.textContent?.trim() || \"Unknown\"")
-        print(f"    }};")
-        print(f"  }});")
-        print(f"}}')")
-        
-        # Simulate extracted jobs (in real implementation, these would come from MCP calls)
-        if "ux" in category:
-            sample_jobs = [
+        # Test mode uses sample listings instead of the browser
+        if not self.test_mode:
+            found_jobs = await self.extract_from_page(url, JOB_TILES_JS, JOB_TILE, f"jobs:{category}")
+        elif "ux" in category:
+            found_jobs = [
                 {
                     "title": "UX Designer needed for mobile app redesign",
                     "client": "Tech Startup Inc.",
@@ -123,7 +180,7 @@ class RealUpworkJobsScraper:
                 }
             ]
         elif "shopify" in category:
-            sample_jobs = [
+            found_jobs = [
                 {
                     "title": "Shopify developer for custom theme",
                     "client": "Fashion Brand",
@@ -144,7 +201,7 @@ class RealUpworkJobsScraper:
                 }
             ]
         elif "web" in category:
-            sample_jobs = [
+            found_jobs = [
                 {
                     "title": "Full-stack web developer needed",
                     "client": "Digital Agency",
@@ -165,7 +222,7 @@ class RealUpworkJobsScraper:
                 }
             ]
         else:
-            sample_jobs = [
+            found_jobs = [
                 {
                     "title": "General web development project",
                     "client": "Small Business",
@@ -177,8 +234,14 @@ class RealUpworkJobsScraper:
                 }
             ]
         
+        # Only as many as the run's budget has left
+        status = self.progress.crawl(f"jobs:{category}")
+        status.pages += 1
+        status.found += len(found_jobs)
+        found_jobs = found_jobs[:self.budget.reserve(len(found_jobs))]
+        
         # Add metadata to each job
-        for job in sample_jobs:
+        for job in found_jobs:
             job.update({
                 "category": category,
                 "url": url,
@@ -186,6 +249,9 @@ class RealUpworkJobsScraper:
                 "source": "upwork_jobs"
             })
             jobs.append(job)
+            self.stream.write("job", job, category)
+            self.budget.settle(collected=True)
+            status.collected += 1
         
         print(f"✅ Extracted {len(jobs)} {category} jobs")
         return jobs
@@ -196,38 +262,12 @@ class RealUpworkJobsScraper:
         
         freelancers = []
         
-        # Real MCP call to navigate to freelancer search page
-        print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_navigate(url='{url}')")
-        
-        # Wait for page load
-        await asyncio.sleep(3)
-        
-        # Real MCP call to check page title
-        print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => document.title')")
-        
-        # Real MCP call to check for Cloudflare
-        print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => document.title.includes(\"Cloudflare\") || document.title.includes(\"Checking\")')")
-        
-        # Real MCP call to extract freelancer profiles
-        print(f"🔧 REAL MCP call: mcp_MCP_DOCKER_browser_evaluate(function='() => {{")
-        print(f"  const profiles = Array.from(document.querySelectorAll(\"[data-test='freelancer-tile']\"));")
-        print(f"  return profiles.slice(0, {self.max_results}).map(profile => {{")
-        print(f"    return {{")
-        print(f"      name: profile.querySelector(\"[data-test='freelancer-name']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      title: profile.querySelector(\"[data-test='freelancer-title']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      rate: profile.querySelector(\"[data-test='hourly-rate']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      rating: profile.querySelector(\"[data-test='rating']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      location: profile.querySelector(\"[data-test='location']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      skills: Array.from(profile.querySelectorAll(\"[data-test='skill']\")).map(s => s.textContent?.trim()).filter(Boolean),")
-        print(f"      total_earnings: profile.querySelector(\"[data-test='total-earnings']\")?.textContent?.trim() || \"Unknown\",")
-        print(f"      success_rate: profile.querySelector(\"[data-test='success-rate']\")?.textContent?.trim() || \"Unknown\"")
-        print(f"    }};")
-        print(f"  }});")
-        print(f"}}')")
-        
-        # Simulate extracted freelancers (in real implementation, these would come from MCP calls)
-        if "ux" in category:
-            sample_freelancers = [
+        # Test mode uses sample profiles instead of the browser
+        if not self.test_mode:
+            found_freelancers = await self.extract_from_page(url, FREELANCER_TILES_JS, FREELANCER_TILE,
+                                                              f"freelancers:{category}")
+        elif "ux" in category:
+            found_freelancers = [
                 {
                     "name": "John Smith",
                     "title": "Senior UX Designer",
@@ -250,7 +290,7 @@ class RealUpworkJobsScraper:
                 }
             ]
         elif "shopify" in category:
-            sample_freelancers = [
+            found_freelancers = [
                 {
                     "name": "Mike Chen",
                     "title": "Shopify Expert",
@@ -273,7 +313,7 @@ class RealUpworkJobsScraper:
                 }
             ]
         elif "web" in category:
-            sample_freelancers = [
+            found_freelancers = [
                 {
                     "name": "Alex Rodriguez",
                     "title": "Full-Stack Developer",
@@ -296,7 +336,7 @@ class RealUpworkJobsScraper:
                 }
             ]
         else:
-            sample_freelancers = [
+            found_freelancers = [
                 {
                     "name": "David Brown",
                     "title": "Web Developer",
@@ -309,8 +349,14 @@ class RealUpworkJobsScraper:
                 }
             ]
         
+        # Only as many as the run's budget has left
+        status = self.progress.crawl(f"freelancers:{category}")
+        status.pages += 1
+        status.found += len(found_freelancers)
+        found_freelancers = found_freelancers[:self.budget.reserve(len(found_freelancers))]
+        
         # Add metadata to each freelancer
-        for freelancer in sample_freelancers:
+        for freelancer in found_freelancers:
             freelancer.update({
                 "category": category,
                 "url": url,
@@ -318,6 +364,9 @@ class RealUpworkJobsScraper:
                 "source": "upwork_freelancers"
             })
             freelancers.append(freelancer)
+            self.stream.write("freelancer", freelancer, category)
+            self.budget.settle(collected=True)
+            status.collected += 1
         
         print(f"✅ Extracted {len(freelancers)} {category} freelancers")
         return freelancers
@@ -330,6 +379,7 @@ class RealUpworkJobsScraper:
         if jobs:
             jobs_filename = f"upwork_jobs_{timestamp}.json"
             jobs_filepath = os.path.join(self.output_dir, jobs_filename)
+            os.makedirs(self.output_dir, exist_ok=True)
             
             jobs_data = {
                 "scraped_at": datetime.now().isoformat(),
@@ -352,6 +402,7 @@ class RealUpworkJobsScraper:
         if freelancers:
             freelancers_filename = f"upwork_freelancers_{timestamp}.json"
             freelancers_filepath = os.path.join(self.output_dir, freelancers_filename)
+            os.makedirs(self.output_dir, exist_ok=True)
             
             freelancers_data = {
                 "scraped_at": datetime.now().isoformat(),
@@ -374,32 +425,25 @@ class RealUpworkJobsScraper:
         """Main scraping workflow"""
         print("🌐 Starting Real Upwork Jobs Scraper...")
         
-        # Check MCP server
-        if not await self.check_mcp_server():
+        # Check MCP server (test mode works from sample data)
+        if not self.test_mode and not await self.check_mcp_server():
             print("❌ Cannot proceed without MCP server")
             return
         
         print("✅ MCP server ready - making real MCP calls")
         
-        # Scrape job listings
-        print("\n" + "="*60)
-        print("📋 SCRAPING JOB LISTINGS")
-        print("="*60)
-        
-        for category, url in self.job_search_urls.items():
-            jobs = await self.scrape_job_listings(category, url)
-            self.jobs_data.extend(jobs)
-            await asyncio.sleep(2)  # Small delay between categories
-        
-        # Scrape freelancer profiles
+        # Scrape job listings and freelancer profiles, every category at once over the tab pool
         print("\n" + "="*60)
-        print("👤 SCRAPING FREELANCER PROFILES")
+        print("📋 SCRAPING JOB LISTINGS AND 👤 FREELANCER PROFILES")
         print("="*60)
         
-        for category, url in self.freelancer_search_urls.items():
-            freelancers = await self.scrape_freelancer_profiles(category, url)
-            self.freelancers_data.extend(freelancers)
-            await asyncio.sleep(2)  # Small delay between categories
+        crawls = {f"jobs:{category}": functools.partial(self.scrape_job_listings, category, url)
+                  for category, url in self.job_search_urls.items()}
+        crawls.update({f"freelancers:{category}": functools.partial(self.scrape_freelancer_profiles, category, url)
+                       for category, url in self.freelancer_search_urls.items()})
+        results = await CrawlOrchestrator(self.budget, self.progress).run(crawls)
+        for name, items in results.items():
+            (self.jobs_data if name.startswith("jobs:") else self.freelancers_data).extend(items)
         
         # Save results
         await self.save_results(self.jobs_data, self.freelancers_data)
@@ -440,6 +484,8 @@ async def main():
     # Parse command line arguments
     test_mode = "--test" in sys.argv
     max_results = 10
+    max_total = None
+    pool_size = POOL_SIZE
     
     if "--max" in sys.argv:
         try:
@@ -447,10 +493,27 @@ async def main():
             max_results = int(sys.argv[max_index + 1])
         except (ValueError, IndexError):
             pass
+    if "--total" in sys.argv:
+        try:
+            max_total = int(sys.argv[sys.argv.index("--total") + 1])
+        except (ValueError, IndexError):
+            pass
+    if "--tabs" in sys.argv:
+        try:
+            pool_size = int(sys.argv[sys.argv.index("--tabs") + 1])
+        except (ValueError, IndexError):
+            pass
     
     # Create and run scraper
-    scraper = RealUpworkJobsScraper(max_results=max_results, test_mode=test_mode)
-    await scraper.run()
+    scraper = RealUpworkJobsScraper(max_results=max_results, test_mode=test_mode,
+                                    refresh_cache="--refresh" in sys.argv, pool_size=pool_size, max_total=max_total)
+    try:
+        await scraper.run()
+    finally:
+        scraper.page_cache.close()
+        scraper.stream.close()
+        await scraper.pool.close()
+        await close_client()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
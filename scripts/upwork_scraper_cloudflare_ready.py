@@ -10,17 +10,30 @@ import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import subprocess
 import time
 
+from mcp_browser_client import CHALLENGE_TIMEOUT, CLOUDFLARE_CLEARED, MCPError, check_gateway, get_client, close_client
+from page_cache import DEFAULT_PAGE_CACHE_PATH, MISS, PAGE_HTML_JS, PageCache
+from rate_control import BlockedError, RetryScheduler
+from record_stream import DEFAULT_STREAM_PATH, TEST_STREAM_PATH, RecordStream
+
+# Readiness selector for profile pages: navigation waits until it matches instead of a fixed sleep
+PROFILE_READY = '[data-test="freelancer-name"], .freelancer-name, h1, .profile-name'
+
 class CloudflareReadyUpworkScraper:
     """Upwork scraper with Cloudflare bypass and real MCP calls"""
     
-    def __init__(self, max_applicants: int = 5, test_mode: bool = False):
+    def __init__(self, max_applicants: int = 5, test_mode: bool = False, refresh_cache: bool = False,
+                 page_cache_path: str = DEFAULT_PAGE_CACHE_PATH, stream_path: Optional[str] = None):
         self.max_applicants = max_applicants
         self.test_mode = test_mode
         self.applicants_data = []
         self.mcp_server_running = False
+        self.page_cache = PageCache(page_cache_path, refresh=refresh_cache)
+        self.retry = RetryScheduler()
+        self.page_url = "https://www.upwork.com"   # shared session's current page, paces in-page retries
+        self.stream = RecordStream(stream_path or (TEST_STREAM_PATH if test_mode else DEFAULT_STREAM_PATH),
+                                   source="cloudflare_ready")
         
         # Real Upwork job brief URLs
         self.brief_urls = {
@@ -28,9 +41,8 @@ class CloudflareReadyUpworkScraper:
             "shopify_developer": "https://www.upwork.com/jobs/~021945253868907578965"
         }
         
-        # Output directory
+        # Output directory (created when results are first saved)
         self.output_dir = "../output/applicants"
-        os.makedirs(self.output_dir, exist_ok=True)
         
         print("🚀 Starting Cloudflare-Ready Upwork Scraper")
         print("=" * 60)
@@ -45,100 +57,9 @@ class CloudflareReadyUpworkScraper:
         print("🛡️ Anti-detection measures enabled")
     
     async def check_mcp_server(self) -> bool:
-        """Check if Docker MCP server is running"""
-        print("🔍 Checking Docker MCP server status...")
-        try:
-            result = subprocess.run(['docker', 'mcp', 'gateway', 'status'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print("✅ Docker MCP gateway is running")
-                self.mcp_server_running = True
-                return True
-            else:
-                print("❌ Docker MCP gateway is not running")
-                print("💡 Start it with: docker mcp gateway run")
-                return False
-        except Exception as e:
-            print(f"❌ Error checking Docker MCP gateway: {e}")
-            return False
-    
-    async def make_real_mcp_call(self, tool_name: str, **kwargs) -> Any:
-        """Make a real MCP call to the Docker MCP server with anti-detection"""
-        if not self.mcp_server_running:
-            print("❌ MCP server not running")
-            return None
-            
-        print(f"🔧 Making REAL MCP call: {tool_name}")
-        print(f"📋 Parameters: {kwargs}")
-        
-        # In a real implementation, this would use an MCP client library
-        # with anti-detection measures
-        try:
-            # Simulate the MCP call with realistic timing
-            await asyncio.sleep(1)
-            
-            if tool_name == "mcp_MCP_DOCKER_browser_navigate":
-                url = kwargs.get('url', '')
-                print(f"🌐 REAL MCP: Navigating to {url}")
-                
-                # Check if this is a Cloudflare-protected site
-                if "upwork.com" in url:
-                    print("🛡️ Detected Upwork - applying Cloudflare bypass measures")
-                    print("💡 Using stealth mode and realistic browser headers")
-                
-                return {"success": True, "url": url}
-                
-            elif tool_name == "mcp_MCP_DOCKER_browser_evaluate":
-                function = kwargs.get('function', '')
-                print(f"💻 REAL MCP: Executing JavaScript")
-                print(f"📜 Function: {function[:100]}...")
-                
-                # Simulate different responses based on the JavaScript
-                if "cloudflare" in function.lower():
-                    return {
-                        "isCloudflare": True,
-                        "hasCfWrapper": True,
-                        "hasCfVerification": True,
-                        "message": "Cloudflare protection detected"
-                    }
-                elif "login" in function.lower():
-                    return {
-                        "isLoggedIn": True,
-                        "hasLoginButton": False,
-                        "hasLogoutButton": True,
-                        "pageTitle": "Upwork - Freelance Services & Make Money Online"
-                    }
-                elif "proposals" in function.lower():
-                    return {
-                        "proposalsCount": 12,
-                        "hasProposals": True,
-                        "proposalsSection": "found"
-                    }
-                elif "applicants" in function.lower():
-                    return {
-                        "applicantsCount": 8,
-                        "hasApplicants": True,
-                        "applicantsSection": "found"
-                    }
-                else:
-                    return {"result": "page_content_loaded"}
-                    
-            elif tool_name == "mcp_MCP_DOCKER_browser_click":
-                element = kwargs.get('element', '')
-                print(f"🖱️ REAL MCP: Clicking element: {element}")
-                return {"success": True, "clicked": element}
-                
-            elif tool_name == "mcp_MCP_DOCKER_browser_screenshot":
-                print("📸 REAL MCP: Taking screenshot")
-                return {"success": True, "screenshot": "captured"}
-                
-            else:
-                print(f"❓ Unknown MCP tool: {tool_name}")
-                return None
-                
-        except Exception as e:
-            print(f"❌ MCP call error: {e}")
-            return None
+        """Check that the Docker MCP gateway answers (health check cached by the shared client)"""
+        self.mcp_server_running = await check_gateway()
+        return self.mcp_server_running
     
     async def setup_stealth_browser(self):
         """Setup browser with anti-detection measures"""
@@ -170,10 +91,7 @@ class CloudflareReadyUpworkScraper:
         }
         """
         
-        result = await self.make_real_mcp_call(
-            "mcp_MCP_DOCKER_browser_evaluate",
-            function=js_code
-        )
+        result = await self.evaluate_javascript(js_code)
         
         if result:
             print("✅ Stealth browser configured")
@@ -211,10 +129,7 @@ class CloudflareReadyUpworkScraper:
         }
         """
         
-        result = await self.make_real_mcp_call(
-            "mcp_MCP_DOCKER_browser_evaluate",
-            function=js_code
-        )
+        result = await self.evaluate_javascript(js_code)
         
         if result and result.get("isBlocked"):
             print("🛡️ Cloudflare challenge detected!")
@@ -226,7 +141,15 @@ class CloudflareReadyUpworkScraper:
             
             # Wait for Cloudflare to potentially auto-bypass
             print("⏳ Waiting for Cloudflare auto-bypass...")
-            await asyncio.sleep(5)
+            try:
+                client = await get_client()
+                cleared = await client.wait_until_ready(probe=CLOUDFLARE_CLEARED, timeout=CHALLENGE_TIMEOUT)
+            except MCPError as e:
+                print(f"❌ Readiness check error: {e}")
+                return False
+            if not cleared:
+                print(f"❌ Cloudflare challenge still showing after {CHALLENGE_TIMEOUT:.0f}s")
+                return False
             
             # Check again
             return await self.handle_cloudflare_challenge()
@@ -235,55 +158,82 @@ class CloudflareReadyUpworkScraper:
             print("✅ No Cloudflare challenge detected")
             return True
     
-    async def navigate_to_page(self, url: str) -> bool:
-        """Navigate to a page using real MCP with Cloudflare handling"""
+    async def navigate_to_page(self, url: str, ready_selector: Optional[str] = None) -> bool:
+        """Navigate over the shared MCP session and wait for ready_selector (else network idle), with Cloudflare handling"""
         try:
             print(f"🔄 Navigating to: {url}")
             
             # Setup stealth browser first
             await self.setup_stealth_browser()
+            self.page_url = url
             
-            # Navigate to page
-            result = await self.make_real_mcp_call(
-                "mcp_MCP_DOCKER_browser_navigate", 
-                url=url
-            )
-            
-            if not result or not result.get("success"):
-                print(f"❌ Failed to navigate to {url}")
-                return False
-            
-            # Wait for page load
-            await asyncio.sleep(3)
+            # Navigate to page; a challenge that does not clear is retried with backoff at a slower rate
+            async def load():
+                client = await get_client()
+                ready = await client.navigate_and_wait(url, ready_selector, network_idle=ready_selector is None)
+                if not ready:
+                    print(f"⚠️ Page not ready after {client.last_wait:.1f}s, continuing")
+                
+                # Handle Cloudflare challenges
+                if not await self.handle_cloudflare_challenge():
+                    raise BlockedError(f"Cloudflare blocked access to {url}")
             
-            # Handle Cloudflare challenges
-            cloudflare_ok = await self.handle_cloudflare_challenge()
-            if not cloudflare_ok:
-                print(f"❌ Cloudflare blocked access to {url}")
-                return False
+            await self.retry.run(url, load)
             
             print(f"✅ Successfully navigated to {url} using REAL MCP with Cloudflare bypass")
             return True
                 
-        except Exception as e:
+        except BlockedError as e:
+            print(f"❌ {e}")
+            return False
+        except MCPError as e:
             print(f"❌ Navigation error: {e}")
             return False
     
     async def evaluate_javascript(self, js_code: str) -> Any:
-        """Execute JavaScript using real MCP"""
+        """Execute JavaScript on the shared MCP session's current page, retried by error class"""
         try:
-            result = await self.make_real_mcp_call(
-                "mcp_MCP_DOCKER_browser_evaluate",
-                function=js_code
-            )
-            return result
+            client = await get_client()
+            return await self.retry.run(self.page_url, lambda: client.evaluate(js_code))
             
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ JavaScript evaluation error: {e}")
             return None
     
-    async def check_login_status(self) -> bool:
-        """Check if user is logged into Upwork"""
+    async def page_snapshot(self) -> Optional[str]:
+        """HTML of the current page for the page cache; best-effort, a failed snapshot only loses the HTML"""
+        try:
+            client = await get_client()
+            return await client.evaluate(PAGE_HTML_JS)
+        except MCPError:
+            return None
+    
+    async def extract_page(self, url: str, js_code: str, ready_selector: Optional[str] = None,
+                           cache: bool = False) -> Any:
+        """Navigate (with Cloudflare handling) and run js_code as one retried load, so a failed evaluate reloads the page"""
+        print(f"🔄 Navigating to: {url}")
+        await self.setup_stealth_browser()
+        self.page_url = url
+        
+        async def load() -> Any:
+            client = await get_client()
+            if not await client.navigate_and_wait(url, ready_selector, network_idle=ready_selector is None):
+                print(f"⚠️ Page not ready after {client.last_wait:.1f}s, extracting what has loaded")
+            if not await self.handle_cloudflare_challenge():
+                raise BlockedError(f"Cloudflare blocked access to {url}")
+            return await client.evaluate(js_code)
+        
+        try:
+            result = await self.retry.run(url, load)
+        except (MCPError, BlockedError) as e:
+            print(f"❌ Error extracting {url}: {e}")
+            return None
+        if cache and result:
+            self.page_cache.put(url, js_code, result, await self.page_snapshot())
+        return result
+    
+    async def check_login_status(self, url: Optional[str] = None) -> bool:
+        """Check if user is logged into Upwork (loading url first, in the same retried load, when given)"""
         print("🔐 Checking login status...")
         
         js_code = """
@@ -301,7 +251,10 @@ class CloudflareReadyUpworkScraper:
         }
         """
         
-        result = await self.evaluate_javascript(js_code)
+        if url:
+            result = await self.extract_page(url, js_code)
+        else:
+            result = await self.evaluate_javascript(js_code)
         
         if result and result.get("isLoggedIn"):
             print("✅ User is logged into Upwork")
@@ -383,14 +336,6 @@ class CloudflareReadyUpworkScraper:
         """Scrape individual applicant profile"""
         print(f"👤 Scraping profile: {profile_url}")
         
-        # Navigate to profile
-        success = await self.navigate_to_page(profile_url)
-        if not success:
-            return {}
-        
-        # Wait for page load
-        await asyncio.sleep(2)
-        
         # Extract profile data
         js_code = """
         () => {
@@ -437,7 +382,12 @@ class CloudflareReadyUpworkScraper:
         }
         """
         
-        result = await self.evaluate_javascript(js_code)
+        # A re-run within the TTL replays the extraction from the page cache instead of the browser
+        result = self.page_cache.get(profile_url, js_code)
+        if result is MISS:
+            result = await self.extract_page(profile_url, js_code, PROFILE_READY, cache=True)
+        else:
+            print("💾 Replayed from page cache")
         
         if result:
             profile_data = {
@@ -461,15 +411,10 @@ class CloudflareReadyUpworkScraper:
         
         applicants = []
         
-        # Navigate to brief with Cloudflare handling
-        success = await self.navigate_to_page(brief_url)
-        if not success:
-            print(f"❌ Failed to navigate to {brief_name} brief (possibly blocked by Cloudflare)")
-            return applicants
-        
-        # Check login status
-        if not await self.check_login_status():
-            print(f"❌ Need to be logged in to view {brief_name} applicants")
+        # Navigate to brief with Cloudflare handling and check login status
+        if not await self.check_login_status(brief_url):
+            print(f"❌ Could not load {brief_name} brief (possibly blocked by Cloudflare), "
+                  f"or need to be logged in to view its applicants")
             return applicants
         
         # Find proposals section
@@ -490,9 +435,7 @@ class CloudflareReadyUpworkScraper:
             profile_data = await self.scrape_applicant_profile(link)
             if profile_data:
                 applicants.append(profile_data)
-            
-            # Small delay between profiles
-            await asyncio.sleep(1)
+                self.stream.write("applicant", profile_data, brief_name)
         
         print(f"🎉 Finished scraping {brief_name} brief. Total applicants found: {len(applicants)}")
         print(f"📊 Collected {len(applicants)} applicants for {brief_name}")
@@ -507,6 +450,7 @@ class CloudflareReadyUpworkScraper:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{brief_name}_applicants_{timestamp}.json"
         filepath = os.path.join(self.output_dir, filename)
+        os.makedirs(self.output_dir, exist_ok=True)
         
         data = {
             "brief_name": brief_name,
@@ -573,8 +517,14 @@ async def main():
             pass
     
     # Create and run scraper
-    scraper = CloudflareReadyUpworkScraper(max_applicants=max_applicants, test_mode=test_mode)
-    await scraper.run()
+    scraper = CloudflareReadyUpworkScraper(max_applicants=max_applicants, test_mode=test_mode,
+                                           refresh_cache="--refresh" in sys.argv)
+    try:
+        await scraper.run()
+    finally:
+        scraper.page_cache.close()
+        scraper.stream.close()
+        await close_client()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -9,9 +9,10 @@ import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import subprocess
 import time
 
+from mcp_browser_client import check_gateway, close_client
+
 class FinalWorkingUpworkScraper:
     """Final working Upwork scraper using real MCP calls available in Cursor"""
     
@@ -47,21 +48,8 @@ class FinalWorkingUpworkScraper:
         print("✅ Public freelancer search (no job poster access required)")
     
     async def check_mcp_server(self) -> bool:
-        """Check if Docker MCP server is running"""
-        print("🔍 Checking Docker MCP server status...")
-        try:
-            result = subprocess.run(['docker', 'mcp', 'gateway', 'status'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print("✅ Docker MCP gateway is running")
-                return True
-            else:
-                print("❌ Docker MCP gateway is not running")
-                print("💡 Start it with: docker mcp gateway run")
-                return False
-        except Exception as e:
-            print(f"❌ Error checking Docker MCP gateway: {e}")
-            return False
+        """Check that the Docker MCP gateway answers (health check cached by the shared client)"""
+        return await check_gateway()
     
     async def test_simple_sites(self):
         """Test simple sites to verify MCP connection works"""
@@ -297,7 +285,10 @@ async def main():
     
     # Create and run scraper
     scraper = FinalWorkingUpworkScraper(max_freelancers=max_freelancers, test_mode=test_mode)
-    await scraper.run()
+    try:
+        await scraper.run()
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -10,17 +10,36 @@ import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import subprocess
 import time
 
+from browser_pool import POOL_SIZE, TabPool
+from mcp_browser_client import (CHALLENGE_TIMEOUT, CLOUDFLARE_CLEARED, READY_TIMEOUT, MCPBrowserClient, MCPError,
+                                check_gateway, get_client, close_client)
+from page_cache import DEFAULT_PAGE_CACHE_PATH, MISS, PAGE_HTML_JS, PageCache
+from rate_control import RetryScheduler
+from record_stream import DEFAULT_STREAM_PATH, TEST_STREAM_PATH, RecordStream
+
+# Readiness selectors: navigation waits until one of these is on the page instead of a fixed sleep
+PROPOSALS_READY = ('[data-test="proposals-section"], [data-test="applicants-section"], .proposals-section, '
+                   '[data-qa="proposals"], [data-qa="applicants"], a[href*="/freelancers/"]')
+PROFILE_READY = '[data-test="freelancer-name"], .freelancer-name, h1'
+
 class RealMCPUpworkScraper:
     """Real MCP-based Upwork scraper that actually connects to Docker MCP server"""
     
-    def __init__(self, max_applicants: int = 5, test_mode: bool = False):
+    def __init__(self, max_applicants: int = 5, test_mode: bool = False, pool_size: int = POOL_SIZE,
+                 refresh_cache: bool = False, page_cache_path: str = DEFAULT_PAGE_CACHE_PATH,
+                 stream_path: Optional[str] = None):
         self.max_applicants = max_applicants
         self.test_mode = test_mode
         self.applicants_data = []
         self.mcp_server_running = False
+        self.page_cache = PageCache(page_cache_path, refresh=refresh_cache)
+        self.pool = TabPool(pool_size)
+        self.retry = RetryScheduler()      # shared-session loads; pool tabs use self.pool.retry
+        self.page_url = "https://www.upwork.com"   # shared session's current page, paces in-page retries
+        self.stream = RecordStream(stream_path or (TEST_STREAM_PATH if test_mode else DEFAULT_STREAM_PATH),
+                                   source="real_mcp")
         
         # Real Upwork job brief URLs
         self.brief_urls = {
@@ -28,9 +47,8 @@ class RealMCPUpworkScraper:
             "shopify_developer": "https://www.upwork.com/jobs/~021945253868907578965"
         }
         
-        # Output directory
+        # Output directory (created when results are first saved)
         self.output_dir = "../output/applicants"
-        os.makedirs(self.output_dir, exist_ok=True)
         
         print("🚀 Starting Upwork Applicants Scraper with REAL MCP Calls")
         print("=" * 60)
@@ -44,124 +62,83 @@ class RealMCPUpworkScraper:
         print("🔧 Using REAL Docker MCP server for Playwright browser automation")
     
     async def check_mcp_server(self) -> bool:
-        """Check if Docker MCP server is running"""
-        print("🔍 Checking Docker MCP server status...")
-        try:
-            # Check if Docker MCP gateway is running
-            result = subprocess.run(['docker', 'mcp', 'gateway', 'status'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print("✅ Docker MCP gateway is running")
-                self.mcp_server_running = True
-                return True
-            else:
-                print("❌ Docker MCP gateway is not running")
-                print("💡 Start it with: docker mcp gateway run")
-                return False
-        except Exception as e:
-            print(f"❌ Error checking Docker MCP gateway: {e}")
-            return False
-    
-    async def make_real_mcp_call(self, tool_name: str, **kwargs) -> Any:
-        """Make a real MCP call to the Docker MCP server"""
-        if not self.mcp_server_running:
-            print("❌ MCP server not running")
-            return None
-            
-        print(f"🔧 Making REAL MCP call: {tool_name}")
-        print(f"📋 Parameters: {kwargs}")
-        
-        # In a real implementation, this would use an MCP client library
-        # For now, we'll simulate the call but indicate it's real
-        try:
-            # Simulate the MCP call with realistic timing
-            await asyncio.sleep(1)
-            
-            if tool_name == "mcp_MCP_DOCKER_browser_navigate":
-                url = kwargs.get('url', '')
-                print(f"🌐 REAL MCP: Navigating to {url}")
-                return {"success": True, "url": url}
-                
-            elif tool_name == "mcp_MCP_DOCKER_browser_evaluate":
-                function = kwargs.get('function', '')
-                print(f"💻 REAL MCP: Executing JavaScript")
-                print(f"📜 Function: {function[:100]}...")
-                
-                # Simulate different responses based on the JavaScript
-                if "login" in function.lower():
-                    return {
-                        "isLoggedIn": True,
-                        "hasLoginButton": False,
-                        "hasLogoutButton": True,
-                        "pageTitle": "Upwork - Freelance Services & Make Money Online"
-                    }
-                elif "proposals" in function.lower():
-                    return {
-                        "proposalsCount": 12,
-                        "hasProposals": True,
-                        "proposalsSection": "found"
-                    }
-                elif "applicants" in function.lower():
-                    return {
-                        "applicantsCount": 8,
-                        "hasApplicants": True,
-                        "applicantsSection": "found"
-                    }
-                else:
-                    return {"result": "page_content_loaded"}
-                    
-            elif tool_name == "mcp_MCP_DOCKER_browser_click":
-                element = kwargs.get('element', '')
-                print(f"🖱️ REAL MCP: Clicking element: {element}")
-                return {"success": True, "clicked": element}
-                
-            elif tool_name == "mcp_MCP_DOCKER_browser_screenshot":
-                print("📸 REAL MCP: Taking screenshot")
-                return {"success": True, "screenshot": "captured"}
-                
-            else:
-                print(f"❓ Unknown MCP tool: {tool_name}")
-                return None
-                
-        except Exception as e:
-            print(f"❌ MCP call error: {e}")
-            return None
+        """Check that the Docker MCP gateway answers (health check cached by the shared client)"""
+        self.mcp_server_running = await check_gateway()
+        return self.mcp_server_running
     
-    async def navigate_to_page(self, url: str) -> bool:
-        """Navigate to a page using real MCP"""
+    async def navigate_to_page(self, url: str, tab: Optional[MCPBrowserClient] = None,
+                               ready_selector: Optional[str] = None, network_idle: bool = False) -> bool:
+        """Navigate to a page in a pool tab, or over the shared MCP session, and wait until it is ready"""
         try:
             print(f"🔄 Navigating to: {url}")
-            result = await self.make_real_mcp_call(
-                "mcp_MCP_DOCKER_browser_navigate", 
-                url=url
-            )
-            
-            if result and result.get("success"):
-                print(f"✅ Successfully navigated to {url} using REAL MCP")
-                return True
-            else:
-                print(f"❌ Failed to navigate to {url}")
-                return False
+            client = tab or await get_client()
+            if not tab:
+                self.page_url = url
+            # Paced per host and retried by error class; pool tabs also feed the pool's adaptive limit
+            retry = self.pool.retry if tab else self.retry
+            ready = await retry.run(url, lambda: client.navigate_and_wait(url, ready_selector, network_idle))
+            if not ready:
+                print(f"⚠️ Page not ready after {client.last_wait:.1f}s, extracting what has loaded")
+            print(f"✅ Successfully navigated to {url} using REAL MCP")
+            return True
                 
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ Navigation error: {e}")
             return False
     
+    async def wait_until_ready(self, ready_selector: Optional[str] = None, probe: Optional[str] = None,
+                               timeout: float = READY_TIMEOUT) -> bool:
+        """Wait on the shared session's current page after an in-page action"""
+        try:
+            client = await get_client()
+            return await client.wait_until_ready(ready_selector, probe=probe, timeout=timeout)
+        except MCPError as e:
+            print(f"❌ Readiness check error: {e}")
+            return False
+    
     async def evaluate_javascript(self, js_code: str) -> Any:
-        """Execute JavaScript using real MCP"""
+        """Execute JavaScript on the shared MCP session's current page, retried by error class"""
         try:
-            result = await self.make_real_mcp_call(
-                "mcp_MCP_DOCKER_browser_evaluate",
-                function=js_code
-            )
-            return result
+            client = await get_client()
+            return await self.retry.run(self.page_url, lambda: client.evaluate(js_code))
             
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ JavaScript evaluation error: {e}")
             return None
     
-    async def check_login_status(self) -> bool:
-        """Check if user is logged into Upwork"""
+    async def page_snapshot(self, client: MCPBrowserClient) -> Optional[str]:
+        """HTML of client's current page for the page cache; best-effort, a failed snapshot only loses the HTML"""
+        try:
+            return await client.evaluate(PAGE_HTML_JS)
+        except MCPError:
+            return None
+    
+    async def extract_page(self, url: str, js_code: str, tab: Optional[MCPBrowserClient] = None,
+                           ready_selector: Optional[str] = None, network_idle: bool = False,
+                           cache: bool = False) -> Any:
+        """Navigate to a page and run js_code on it as one retried load, so a failed evaluate reloads the page"""
+        print(f"🔄 Navigating to: {url}")
+        client = tab or await get_client()
+        if not tab:
+            self.page_url = url
+        
+        async def load() -> Any:
+            if not await client.navigate_and_wait(url, ready_selector, network_idle):
+                print(f"⚠️ Page not ready after {client.last_wait:.1f}s, extracting what has loaded")
+            return await client.evaluate(js_code)
+        
+        try:
+            # Paced per host and retried by error class; pool tabs also feed the pool's adaptive limit
+            result = await (self.pool.retry if tab else self.retry).run(url, load)
+        except MCPError as e:
+            print(f"❌ Error extracting {url}: {e}")
+            return None
+        if cache and result:
+            self.page_cache.put(url, js_code, result, await self.page_snapshot(client))
+        return result
+    
+    async def check_login_status(self, url: Optional[str] = None) -> bool:
+        """Check if user is logged into Upwork (loading url first, in the same retried load, when given)"""
         print("🔐 Checking login status...")
         
         js_code = """
@@ -179,7 +156,10 @@ class RealMCPUpworkScraper:
         }
         """
         
-        result = await self.evaluate_javascript(js_code)
+        if url:
+            result = await self.extract_page(url, js_code, network_idle=True)
+        else:
+            result = await self.evaluate_javascript(js_code)
         
         if result and result.get("isLoggedIn"):
             print("✅ User is logged into Upwork")
@@ -258,17 +238,9 @@ class RealMCPUpworkScraper:
             return []
     
     async def scrape_applicant_profile(self, profile_url: str) -> Dict[str, Any]:
-        """Scrape individual applicant profile"""
+        """Scrape individual applicant profile (in a pool tab, taken only when the page cache misses)"""
         print(f"👤 Scraping profile: {profile_url}")
         
-        # Navigate to profile
-        success = await self.navigate_to_page(profile_url)
-        if not success:
-            return {}
-        
-        # Wait for page load
-        await asyncio.sleep(2)
-        
         # Extract profile data
         js_code = """
         () => {
@@ -315,7 +287,13 @@ class RealMCPUpworkScraper:
         }
         """
         
-        result = await self.evaluate_javascript(js_code)
+        # A re-run within the TTL replays the extraction from the page cache instead of the browser
+        result = self.page_cache.get(profile_url, js_code)
+        if result is MISS:
+            async with self.pool.tab(profile_url) as tab:
+                result = await self.extract_page(profile_url, js_code, tab, PROFILE_READY, cache=True)
+        else:
+            print("💾 Replayed from page cache")
         
         if result:
             profile_data = {
@@ -339,18 +317,9 @@ class RealMCPUpworkScraper:
         
         applicants = []
         
-        # Navigate to brief
-        success = await self.navigate_to_page(brief_url)
-        if not success:
-            print(f"❌ Failed to navigate to {brief_name} brief")
-            return applicants
-        
-        # Wait for page load
-        await asyncio.sleep(3)
-        
-        # Check login status
-        if not await self.check_login_status():
-            print(f"❌ Need to be logged in to view {brief_name} applicants")
+        # Navigate to brief and check login status
+        if not await self.check_login_status(brief_url):
+            print(f"❌ Could not load {brief_name} brief, or need to be logged in to view its applicants")
             return applicants
         
         # Handle Cloudflare and find View Proposals link
@@ -360,9 +329,6 @@ class RealMCPUpworkScraper:
             print(f"❌ Could not access proposals for {brief_name}")
             return applicants
         
-        # Wait for proposals page to load
-        await asyncio.sleep(3)
-        
         # Find proposals section on the proposals page
         proposals_selector = await self.find_proposals_section()
         if not proposals_selector:
@@ -375,15 +341,19 @@ class RealMCPUpworkScraper:
             print(f"❌ No applicant links found for {brief_name}")
             return applicants
         
-        # Scrape each applicant profile
-        for i, link in enumerate(applicant_links[:self.max_applicants], 1):
-            print(f"\n📄 Processing applicant {i}/{len(applicant_links[:self.max_applicants])}...")
+        # Scrape applicant profiles concurrently, one pool tab each
+        links = applicant_links[:self.max_applicants]
+        print(f"\n📄 Processing {len(links)} applicants in {self.pool.size} tabs...")
+        
+        async def scrape(link: str) -> Dict[str, Any]:
             profile_data = await self.scrape_applicant_profile(link)
             if profile_data:
-                applicants.append(profile_data)
-            
-            # Small delay between profiles
-            await asyncio.sleep(1)
+                # Streamed as soon as it is in, for the ingest to pick up mid-crawl
+                self.stream.write("applicant", profile_data, brief_name)
+            return profile_data
+        
+        results = await asyncio.gather(*(scrape(link) for link in links))
+        applicants.extend(profile_data for profile_data in results if profile_data)
         
         print(f"🎉 Finished scraping {brief_name} brief. Total applicants found: {len(applicants)}")
         print(f"📊 Collected {len(applicants)} applicants for {brief_name}")
@@ -398,6 +368,7 @@ class RealMCPUpworkScraper:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{brief_name}_applicants_{timestamp}.json"
         filepath = os.path.join(self.output_dir, filename)
+        os.makedirs(self.output_dir, exist_ok=True)
         
         data = {
             "brief_name": brief_name,
@@ -510,7 +481,9 @@ class RealMCPUpworkScraper:
         if result and result.get("isCloudflare"):
             print("🛡️ Cloudflare protection detected - waiting for page to load...")
             # Wait for Cloudflare to finish
-            await asyncio.sleep(5)
+            if not await self.wait_until_ready(probe=CLOUDFLARE_CLEARED, timeout=CHALLENGE_TIMEOUT):
+                print(f"❌ Cloudflare challenge still showing after {CHALLENGE_TIMEOUT:.0f}s")
+                return False
             return await self.handle_cloudflare_page()  # Recursive check
         
         elif result and result.get("hasViewProposals"):
@@ -528,7 +501,7 @@ class RealMCPUpworkScraper:
         if href:
             # If we have a direct href, navigate to it
             print(f"🔗 Navigating directly to proposals: {href}")
-            return await self.navigate_to_page(href)
+            return await self.navigate_to_page(href, ready_selector=PROPOSALS_READY)
         else:
             # Click the element
             js_code = f"""
@@ -546,7 +519,7 @@ class RealMCPUpworkScraper:
             
             if result and result.get("success"):
                 print(f"✅ Clicked View Proposals: {result.get('clicked')}")
-                await asyncio.sleep(3)  # Wait for page to load
+                await self.wait_until_ready(PROPOSALS_READY)
                 return True
             else:
                 print("❌ Failed to click View Proposals")
@@ -557,6 +530,7 @@ async def main():
     # Parse command line arguments
     test_mode = "--test" in sys.argv
     max_applicants = 5
+    pool_size = POOL_SIZE
     
     if "--max" in sys.argv:
         try:
@@ -564,10 +538,22 @@ async def main():
             max_applicants = int(sys.argv[max_index + 1])
         except (ValueError, IndexError):
             pass
+    if "--tabs" in sys.argv:
+        try:
+            pool_size = int(sys.argv[sys.argv.index("--tabs") + 1])
+        except (ValueError, IndexError):
+            pass
     
     # Create and run scraper
-    scraper = RealMCPUpworkScraper(max_applicants=max_applicants, test_mode=test_mode)
-    await scraper.run()
+    scraper = RealMCPUpworkScraper(max_applicants=max_applicants, test_mode=test_mode, pool_size=pool_size,
+                                   refresh_cache="--refresh" in sys.argv)
+    try:
+        await scraper.run()
+    finally:
+        scraper.page_cache.close()
+        scraper.stream.close()
+        await scraper.pool.close()
+        await close_client()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
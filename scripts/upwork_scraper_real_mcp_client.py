@@ -9,17 +9,9 @@ import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import subprocess
 import time
 
-# Try to import MCP client libraries
-try:
-    import mcp
-    from mcp import ClientSession, StdioServerParameters
-    MCP_AVAILABLE = True
-except ImportError:
-    MCP_AVAILABLE = False
-    print("⚠️ MCP client library not available - installing...")
+from mcp_browser_client import MCPError, check_gateway, get_client, close_client
 
 class RealMCPUpworkScraper:
     """Real MCP-based Upwork scraper that actually connects to Docker MCP server"""
@@ -50,114 +42,40 @@ class RealMCPUpworkScraper:
         print("🛡️ Anti-detection measures enabled")
     
     async def check_mcp_server(self) -> bool:
-        """Check if Docker MCP server is running"""
-        print("🔍 Checking Docker MCP server status...")
-        try:
-            result = subprocess.run(['docker', 'mcp', 'gateway', 'status'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print("✅ Docker MCP gateway is running")
-                self.mcp_server_running = True
-                return True
-            else:
-                print("❌ Docker MCP gateway is not running")
-                print("💡 Start it with: docker mcp gateway run")
-                return False
-        except Exception as e:
-            print(f"❌ Error checking Docker MCP gateway: {e}")
-            return False
+        """Check that the Docker MCP gateway answers (health check cached by the shared client)"""
+        self.mcp_server_running = await check_gateway()
+        return self.mcp_server_running
     
     async def connect_to_mcp_server(self) -> bool:
-        """Connect to the Docker MCP server using real MCP client"""
-        if not MCP_AVAILABLE:
-            print("❌ MCP client library not available")
-            print("💡 Install with: pip install mcp")
-            return False
-        
+        """Attach to the shared, long-lived MCP session"""
         try:
             print("🔌 Connecting to Docker MCP server...")
-            
-            # Connect to Docker MCP server via stdio
-            # The Docker MCP gateway exposes the Playwright server
-            server_params = StdioServerParameters(
-                command="docker",
-                args=["mcp", "gateway", "stdio", "--server", "playwright"]
-            )
-            
-            self.mcp_client = ClientSession(server_params)
-            await self.mcp_client.__aenter__()
-            
-            print("✅ Connected to Docker MCP server")
+            self.mcp_client = await get_client()
+            print(f"✅ Connected to Docker MCP server ({len(self.mcp_client.tools)} tools)")
             return True
             
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ Failed to connect to MCP server: {e}")
             return False
     
-    async def make_real_mcp_call(self, tool_name: str, **kwargs) -> Any:
-        """Make a real MCP call to the Docker MCP server"""
-        if not self.mcp_client:
-            print("❌ MCP client not connected")
-            return None
-            
-        try:
-            print(f"🔧 Making REAL MCP call: {tool_name}")
-            print(f"📋 Parameters: {kwargs}")
-            
-            # Convert tool name to MCP format
-            if tool_name == "mcp_MCP_DOCKER_browser_navigate":
-                mcp_tool = "browser_navigate"
-            elif tool_name == "mcp_MCP_DOCKER_browser_evaluate":
-                mcp_tool = "browser_evaluate"
-            elif tool_name == "mcp_MCP_DOCKER_browser_click":
-                mcp_tool = "browser_click"
-            elif tool_name == "mcp_MCP_DOCKER_browser_screenshot":
-                mcp_tool = "browser_screenshot"
-            else:
-                print(f"❓ Unknown MCP tool: {tool_name}")
-                return None
-            
-            # Make the actual MCP call
-            result = await self.mcp_client.call_tool(mcp_tool, kwargs)
-            
-            print(f"✅ MCP call successful: {mcp_tool}")
-            return result
-            
-        except Exception as e:
-            print(f"❌ MCP call error: {e}")
-            return None
-    
     async def navigate_to_page(self, url: str) -> bool:
-        """Navigate to a page using real MCP"""
+        """Navigate to a page over the shared MCP session"""
         try:
             print(f"🔄 Navigating to: {url}")
-            
-            result = await self.make_real_mcp_call(
-                "mcp_MCP_DOCKER_browser_navigate", 
-                url=url
-            )
-            
-            if result:
-                print(f"✅ Successfully navigated to {url} using REAL MCP")
-                return True
-            else:
-                print(f"❌ Failed to navigate to {url}")
-                return False
+            await self.mcp_client.navigate_and_wait(url, network_idle=True)
+            print(f"✅ Successfully navigated to {url} using REAL MCP ({self.mcp_client.last_wait:.1f}s to settle)")
+            return True
                 
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ Navigation error: {e}")
             return False
     
     async def evaluate_javascript(self, js_code: str) -> Any:
-        """Execute JavaScript using real MCP"""
+        """Execute JavaScript over the shared MCP session"""
         try:
-            result = await self.make_real_mcp_call(
-                "mcp_MCP_DOCKER_browser_evaluate",
-                function=js_code
-            )
-            return result
+            return await self.mcp_client.evaluate(js_code)
             
-        except Exception as e:
+        except MCPError as e:
             print(f"❌ JavaScript evaluation error: {e}")
             return None
     
@@ -175,9 +93,6 @@ class RealMCPUpworkScraper:
                 print(f"❌ Failed to navigate to {site_name}")
                 continue
             
-            # Wait for page load
-            await asyncio.sleep(2)
-            
             # Get page title
             js_code = "() => document.title"
             result = await self.evaluate_javascript(js_code)
@@ -209,9 +124,6 @@ class RealMCPUpworkScraper:
                 print(f"❌ Failed to navigate to Upwork")
                 continue
             
-            # Wait for page load
-            await asyncio.sleep(3)
-            
             # Check page title
             js_code = "() => document.title"
             result = await self.evaluate_javascript(js_code)
@@ -289,8 +201,7 @@ class RealMCPUpworkScraper:
         await self.save_test_results(results)
         
         # Close MCP connection
-        if self.mcp_client:
-            await self.mcp_client.__aexit__(None, None, None)
+        await close_client()
         
         print("\n🎉 Real MCP Client Test Completed!")
         print("✅ MCP connection successful")
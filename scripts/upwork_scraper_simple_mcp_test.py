@@ -9,9 +9,10 @@ import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import subprocess
 import time
 
+from mcp_browser_client import check_gateway, close_client
+
 class SimpleMCPTest:
     """Simple test using MCP tools available in Cursor"""
     
@@ -35,20 +36,8 @@ class SimpleMCPTest:
         print("🎯 This will test the actual MCP protocol calls")
     
     async def check_mcp_server(self) -> bool:
-        """Check if Docker MCP server is running"""
-        print("🔍 Checking Docker MCP server status...")
-        try:
-            result = subprocess.run(['docker', 'mcp', 'gateway', 'status'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print("✅ Docker MCP gateway is running")
-                return True
-            else:
-                print("❌ Docker MCP gateway is not running")
-                return False
-        except Exception as e:
-            print(f"❌ Error checking Docker MCP gateway: {e}")
-            return False
+        """Check that the Docker MCP gateway answers (health check cached by the shared client)"""
+        return await check_gateway()
     
     async def test_mcp_tools_availability(self):
         """Test if MCP tools are available in the current environment"""
@@ -211,7 +200,10 @@ async def main():
     """Main function"""
     # Create and run test
     test = SimpleMCPTest()
-    await test.run()
+    try:
+        await test.run()
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file